@@ -2,20 +2,22 @@
 
 A Python library that provides Gmail functionality with progressive disclosure,
 pagination, and LLM-optimized output formatting.
-
-Note: You may see an INFO message: "file_cache is only supported with oauth2client<4.0.0"
-This is harmless and comes from the Google API client library. It can be safely ignored.
 """
 
-from .gmail_client import GmailClient
-from .models import (
-    EmailFormat,
-    EmailFull,
-    EmailSummary,
-    Folder,
-    SearchResult,
-    SendEmailRequest,
-)
+from typing import TYPE_CHECKING
+
+from gmaillm.helpers.core.lazy import lazy_importer
+
+if TYPE_CHECKING:
+    from .gmail_client import GmailClient
+    from .models import (
+        EmailFormat,
+        EmailFull,
+        EmailSummary,
+        Folder,
+        SearchResult,
+        SendEmailRequest,
+    )
 
 __version__ = "1.0.0"
 __all__ = [
@@ -27,3 +29,13 @@ __all__ = [
     "Folder",
     "SendEmailRequest",
 ]
+
+__getattr__ = lazy_importer(globals(), {
+    "GmailClient": "gmaillm.gmail_client",
+    "EmailSummary": "gmaillm.models",
+    "EmailFull": "gmaillm.models",
+    "EmailFormat": "gmaillm.models",
+    "SearchResult": "gmaillm.models",
+    "Folder": "gmaillm.models",
+    "SendEmailRequest": "gmaillm.models",
+})
@@ -1,60 +1,131 @@
 #!/usr/bin/env python3
 """Command-line interface for gmaillm using Typer."""
 
-# Note: You may see this INFO message on first run:
-#   "file_cache is only supported with oauth2client<4.0.0"
-# This is harmless - it's from Google's API client library and can be ignored.
-
+import os
+import time
+from datetime import timedelta
 from enum import Enum
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import click
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 
-from gmaillm import GmailClient, SendEmailRequest
-from gmaillm.commands import config as config_commands
-
-# Import command modules
-from gmaillm.commands import ask, groups, labels, styles, workflows
-from gmaillm.formatters import RichFormatter
 from gmaillm.helpers.cli import (
-    HelpfulGroup,
-    confirm_or_force,
+    LazyTyperGroup,
+    command_errors,
     display_schema_and_exit,
+    emit_json,
+    emit_model_json,
+    emit_ndjson,
+    get_formatter,
     load_and_validate_json,
     show_operation_preview,
 )
+from gmaillm.helpers.core.lazy import lazy_importer
+
+if TYPE_CHECKING:
+    from gmaillm.models import Folder
 
-# Import helper utilities
-from gmaillm.helpers.domain import expand_email_groups
-from gmaillm.models import Folder
 
-# Import validators
-from gmaillm.validators.email import validate_attachment_paths, validate_email_list
+def _completion_callback(ctx: click.Context, param: click.Parameter, value: Any) -> Any:
+    """Run Typer's --install-completion/--show-completion handler on demand."""
+    if not value or ctx.resilient_parsing:
+        return value
+    from typer import completion
 
+    if param.name == "install_completion":
+        return completion.install_callback(ctx, param, value)
+    return completion.show_callback(ctx, param, value)
 
-# Custom callback to print help on errors
-def custom_abort_if_false(ctx: Any, param: Any, value: Any) -> None:
-    """Custom callback for validation that shows help on failure."""
-    if not value:
-        click.echo(ctx.parent.get_help() if ctx.parent else ctx.get_help())
-        ctx.exit(1)
+
+class GmailGroup(LazyTyperGroup):
+    """Root command group; subcommand modules are imported on first use.
+
+    The shell-completion options are registered here rather than through
+    Typer's add_completion, which imports its completion machinery (and
+    shellingham) on every invocation.
+    """
+
+    lazy_subcommands = {
+        "ask": "gmaillm.commands.ask",
+        "labels": "gmaillm.commands.labels",
+        "groups": "gmaillm.commands.groups",
+        "styles": "gmaillm.commands.styles",
+        "workflows": "gmaillm.commands.workflows",
+        "config": "gmaillm.commands.config",
+    }
+    # Must match each sub-app's help; checked in tests/test_cli.py
+    lazy_subcommand_help = {
+        "ask": "Ask natural language questions about your email history",
+        "labels": "Manage Gmail labels",
+        "groups": "Manage email distribution groups",
+        "styles": "Manage email style templates",
+        "workflows": "Interactive email workflows",
+        "config": "Manage Gmail integration configuration",
+    }
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.params.extend([
+            click.Option(
+                ["--install-completion"],
+                is_flag=True,
+                expose_value=False,
+                callback=_completion_callback,
+                help="Install completion for the current shell.",
+            ),
+            click.Option(
+                ["--show-completion"],
+                is_flag=True,
+                expose_value=False,
+                callback=_completion_callback,
+                help="Show completion for the current shell, to copy it or customize the installation.",
+            ),
+        ])
 
 
 # Initialize Typer app and console
 app = typer.Typer(
     name="gmaillm",
     help="Gmail CLI with LLM-friendly operations and progressive disclosure patterns",
-    add_completion=True,
+    add_completion=False,  # Completion options are added lazily by GmailGroup
     no_args_is_help=True,
-    cls=HelpfulGroup,  # Show help when required args are missing
+    cls=GmailGroup,  # Show help when required args are missing, load subcommands lazily
     context_settings={"help_option_names": ["-h", "--help"]},  # Support -h and --help
     rich_markup_mode="rich",  # Enable Rich markup in docstrings
 )
 console = Console()
-formatter = RichFormatter(console)
+
+_LAZY_IMPORTS = {
+    "GmailClient": "gmaillm.gmail_client",
+    "SendEmailRequest": "gmaillm.models",
+    "expand_email_groups": "gmaillm.helpers.domain",
+    "parse_email_address": "gmaillm.utils",
+    "validate_attachment_paths": "gmaillm.validators.email",
+    "validate_email_lists": "gmaillm.validators.email",
+}
+
+__getattr__ = _lazy = lazy_importer(globals(), _LAZY_IMPORTS)
+
+
+# (client class, instance) for the process-wide GmailClient
+_client_cache: Optional[Tuple[Any, Any]] = None
+
+
+def _get_client() -> Any:
+    """Return a GmailClient shared by every command run in this process.
+
+    Authentication and service discovery happen once; the cache is keyed
+    on the class so patching ``gmaillm.cli.GmailClient`` gets a fresh client.
+    """
+    global _client_cache
+    client_class = _lazy("GmailClient")
+    if _client_cache is None or _client_cache[0] is not client_class:
+        _client_cache = (client_class, client_class())
+    return _client_cache[1]
+
 
 # Output format enum (kept for backward compatibility)
 class OutputFormat(str, Enum):
@@ -67,63 +138,112 @@ class OutputFormat(str, Enum):
 SNIPPET_PREVIEW_LENGTH = 80
 MESSAGE_ID_DISPLAY_LENGTH = 8
 
+# Section separators for report/preview output
+SEPARATOR = "=" * 60
+SETUP_SEPARATOR = "=" * 70
+
+# Label count footer of the status report
+STATUS_SUMMARY_TEMPLATE = (
+    "\n[cyan]Total Labels:[/cyan] {total} | [blue]Custom:[/blue] {user}"
+    " | [magenta]System:[/magenta] {system}"
+)
+
+# Pause between token checks in `gmail daemon` when a refresh is already
+# due (also the retry delay after a failed refresh)
+DAEMON_MIN_SLEEP_SECONDS = 30
+# `gmail daemon` refreshes this long before expiry: twice the 5 minute
+# TOKEN_REFRESH_BUFFER other commands use, so it stays ahead of them
+DAEMON_REFRESH_BUFFER = timedelta(minutes=10)
+
 
 # ============ HELPER FUNCTIONS ============
 
-def _get_folder_by_name(folders: List[Folder], folder_name: str) -> Optional[Folder]:
-    """Get folder by name from list."""
-    return next((f for f in folders if f.name == folder_name), None)
+def _summarize_folders(folders: List["Folder"]) -> Tuple[int, int, Optional["Folder"]]:
+    """Count user/system labels and find INBOX in a single pass.
+
+    Returns:
+        Tuple of (user label count, system label count, INBOX folder or None)
+    """
+    user_labels = system_labels = 0
+    inbox_folder = None
+    for f in folders:
+        if f.type == "user":
+            user_labels += 1
+        elif f.type == "system":
+            system_labels += 1
+        if f.name == "INBOX":
+            inbox_folder = f
+    return user_labels, system_labels, inbox_folder
+
+
+# Output dispatch tables for the list/search hot paths, keyed on "JSON output?"
+_LIST_EMIT = {
+    True: lambda result, folder: emit_model_json(result),
+    False: lambda result, folder: get_formatter(console).print_email_list(result.emails, folder),
+}
+_SEARCH_EMIT = {
+    True: emit_model_json,
+    False: lambda result: get_formatter(console).print_search_results(result),
+}
+
+
+def _confirm(prompt: str) -> bool:
+    """Ask a y/N question with a plain input() call (defaults to No)."""
+    try:
+        return input(f"{prompt} [y/N] ").strip().lower().startswith("y")
+    except EOFError:
+        return False
 
 
 # ============ MAIN COMMANDS ============
 
 @app.command()
+@command_errors("verifying setup")
 def verify(
     output_format: OutputFormat = typer.Option(OutputFormat.RICH, "--output-format", help="Output format"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON (same as --output-format json)"),
 ) -> None:
     """Verify Gmail API authentication and configuration.
 
     [bold cyan]EXAMPLE[/bold cyan]:
       [dim]$[/dim] gmail verify
     """
-    try:
-        client = GmailClient()
-        result = client.verify_setup()
-
-        if output_format == OutputFormat.JSON:
-            console.print_json(data=result)
-        else:  # RICH
-            console.print("=" * 60)
-            console.print("gmaillm Setup Verification")
-            console.print("=" * 60)
-
-            if result["auth"]:
-                console.print("[green]✓[/green] Authentication: Working")
-                if result["email_address"]:
-                    console.print(f"[green]✓[/green] Authenticated as: {result['email_address']}")
-            else:
-                console.print("[red]✗[/red] Authentication: Failed")
+    as_json = json_output or output_format == OutputFormat.JSON
 
-            console.print(f"[green]✓[/green] Folders accessible: {result['folders']}")
+    client = _get_client()
+    result = client.verify_setup()
 
-            if result["inbox_accessible"]:
-                console.print("[green]✓[/green] Inbox: Accessible")
-            else:
-                console.print("[red]✗[/red] Inbox: Not accessible")
+    if as_json:
+        emit_json(result)
+    else:  # RICH
+        # Build the report and print it in one call
+        lines = [SEPARATOR, "gmaillm Setup Verification", SEPARATOR]
 
-            if result["errors"]:
-                console.print("\n[red]Errors:[/red]")
-                for error in result["errors"]:
-                    console.print(f"  - {error}")
-            else:
-                console.print("\n[green]✅ All checks passed![/green]")
+        if result["auth"]:
+            lines.append("[green]✓[/green] Authentication: Working")
+            if result["email_address"]:
+                lines.append(f"[green]✓[/green] Authenticated as: {result['email_address']}")
+        else:
+            lines.append("[red]✗[/red] Authentication: Failed")
 
-    except Exception as e:
-        console.print(f"[red]✗ Setup verification failed: {e}[/red]")
-        raise typer.Exit(code=1)
+        lines.append(f"[green]✓[/green] Folders accessible: {result['folders']}")
+
+        if result["inbox_accessible"]:
+            lines.append("[green]✓[/green] Inbox: Accessible")
+        else:
+            lines.append("[red]✗[/red] Inbox: Not accessible")
+
+        if result["errors"]:
+            lines.append("\n[red]Errors:[/red]")
+            lines.extend(f"  - {error}" for error in result["errors"])
+        else:
+            lines.append("\n[green]✅ All checks passed![/green]")
+
+        console.print("\n".join(lines))
 
 
 @app.command()
+@command_errors("setting up authentication")
 def setup_auth(
     oauth_keys: Optional[str] = typer.Option(
         None, "--oauth-keys", help="Path to OAuth2 client secrets (gcp-oauth.keys.json)"
@@ -134,53 +254,105 @@ def setup_auth(
         help="Path to save credentials (default: ~/.gmail-mcp/credentials.json)",
     ),
     port: int = typer.Option(8080, "--port", help="Local server port for OAuth callback"),
+    force_refresh: bool = typer.Option(
+        False, "--force-refresh", help="Refresh the cached access token without re-running OAuth"
+    ),
 ) -> None:
     """Set up Gmail API authentication via OAuth2.
 
     [bold cyan]EXAMPLES[/bold cyan]:
       [dim]$[/dim] gmail setup-auth
       [dim]$[/dim] gmail setup-auth --oauth-keys ~/gcp-oauth.keys.json
+      [dim]$[/dim] gmail setup-auth --force-refresh
     """
-    try:
-        from gmaillm.setup_auth import setup_authentication
+    if force_refresh:
+        _lazy("GmailClient")(credentials_file=credentials, oauth_keys_file=oauth_keys, force_refresh=True)
+        console.print("[green]✅ Access token refreshed[/green]")
+        return
 
-        console.print("=" * 70)
-        console.print("  Gmail API Authentication Setup")
-        console.print("=" * 70)
-        console.print()
+    from gmaillm.setup_auth import setup_authentication
 
-        result = setup_authentication(
-            oauth_keys_file=oauth_keys,
-            credentials_file=credentials,
-            port=port,
-        )
+    console.print(f"{SETUP_SEPARATOR}\n  Gmail API Authentication Setup\n{SETUP_SEPARATOR}\n")
 
-        if result is None:
-            console.print(
-                "\n[yellow]⚠️  Setup incomplete. Please address the issues above.[/yellow]"
-            )
-            raise typer.Exit(code=1)
-        else:
-            console.print("\n[green]✅ Setup complete![/green]")
-            console.print("\nYou can now use the Gmail CLI and Python library.")
-            console.print("\nVerify with: [cyan]gmail verify[/cyan]")
-
-            console.print("\n" + "=" * 70)
-            console.print("📊 Next Steps (Optional)")
-            console.print("=" * 70)
-            console.print("\n💡 Install shell completions for faster typing:")
-            console.print("   [cyan]$ gmail --install-completion[/cyan]")
-            console.print("\nThen restart your shell to enable tab-completion:")
-            console.print("   [cyan]$ exec $SHELL[/cyan]\n")
-
-    except Exception as e:
-        console.print(f"\n[red]✗ Authentication failed: {e}[/red]")
+    result = setup_authentication(
+        oauth_keys_file=oauth_keys,
+        credentials_file=credentials,
+        port=port,
+    )
+
+    if result is None:
+        console.print(
+            "\n[yellow]⚠️  Setup incomplete. Please address the issues above.[/yellow]"
+        )
         raise typer.Exit(code=1)
+    else:
+        console.print("\n".join([
+            "\n[green]✅ Setup complete![/green]",
+            "\nYou can now use the Gmail CLI and Python library.",
+            "\nVerify with: [cyan]gmail verify[/cyan]",
+            "\n" + SETUP_SEPARATOR,
+            "📊 Next Steps (Optional)",
+            SETUP_SEPARATOR,
+            "\n💡 Install shell completions for faster typing:",
+            "   [cyan]$ gmail --install-completion[/cyan]",
+            "\nThen restart your shell to enable tab-completion:",
+            "   [cyan]$ exec $SHELL[/cyan]\n",
+        ]))
+
+
+@app.command()
+@command_errors("refreshing access token")
+def daemon(
+    oauth_keys: Optional[str] = typer.Option(
+        None, "--oauth-keys", help="Path to OAuth2 client secrets (gcp-oauth.keys.json)"
+    ),
+    credentials: Optional[str] = typer.Option(
+        None,
+        "--credentials",
+        help="Path to credentials (default: ~/.gmaillm/credentials.json)",
+    ),
+) -> None:
+    """Keep the cached access token fresh in the background.
+
+    Refreshes the token 10 minutes before it expires, well ahead of the
+    5 minute margin at which other commands refresh it themselves, so they
+    normally find a fresh cached token. Commands still refresh on their
+    own if the daemon isn't running or a refresh fails.
+
+    [bold cyan]EXAMPLE[/bold cyan]:
+      [dim]$[/dim] gmail daemon &
+    """
+    client_class = _lazy("GmailClient")
+    console.print("[dim]Keeping the access token fresh; press Ctrl+C to stop[/dim]")
+
+    client = None
+    while True:
+        try:
+            # Both refresh the token once it is within DAEMON_REFRESH_BUFFER
+            # of expiry; the client is only rebuilt after a failure
+            if client is None:
+                client = client_class(
+                    credentials_file=credentials,
+                    oauth_keys_file=oauth_keys,
+                    refresh_buffer=DAEMON_REFRESH_BUFFER,
+                )
+            else:
+                client.refresh_credentials()
+            delay = client.seconds_until_refresh()
+        except RuntimeError as e:
+            console.print(f"[yellow]⚠️  {e}[/yellow]")
+            client = None
+            delay = 0
+        # Wake exactly when the refresh is due; the minimum only applies when
+        # it is due already, to avoid spinning on a token that won't refresh
+        time.sleep(delay if delay > 0 else DAEMON_MIN_SLEEP_SECONDS)
 
 
 @app.command()
+@command_errors("getting status")
 def status(
     output_format: OutputFormat = typer.Option(OutputFormat.RICH, "--output-format", help="Output format"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON (same as --output-format json)"),
 ) -> None:
     """Show Gmail account status and inbox summary.
 
@@ -188,130 +360,116 @@ def status(
       [dim]$[/dim] gmail status
       [dim]$[/dim] gmail status --output-format json
     """
-    try:
-        client = GmailClient()
-
-        # Verify authentication
-        result = client.verify_setup()
+    as_json = json_output or output_format == OutputFormat.JSON
 
-        if not result["auth"] or not result["email_address"]:
-            if output_format == OutputFormat.JSON:
-                console.print_json(data={"error": "Not authenticated", "details": result})
-            else:
-                console.print(
-                    Panel(
-                        "[red]✗ Not authenticated[/red]\n\n"
-                        + "\n".join(f"  - {error}" for error in result["errors"]),
-                        title="Authentication Failed",
-                        border_style="red",
-                    )
-                )
-            raise typer.Exit(code=1)
+    client = _get_client()
 
-        # Get folder statistics
-        folders = client.get_folders()
+    # Profile, folders and most recent email in two batched round-trips
+    result = client.get_status()
 
-        # Get most recent email
-        recent_email_data = None
-        try:
-            recent_emails = client.list_emails(folder="INBOX", max_results=1)
-            if recent_emails.emails:
-                recent = recent_emails.emails[0]
-                recent_email_data = recent.model_dump(mode='json')
-        except Exception:
-            pass
-
-        # Build JSON response
-        if output_format == OutputFormat.JSON:
-            # Calculate stats
-            total_labels = len(folders)
-            user_labels = len([f for f in folders if f.type == "user"])
-            system_labels = len([f for f in folders if f.type == "system"])
-            inbox_folder = _get_folder_by_name(folders, "INBOX")
-
-            status_data = {
-                "email_address": result["email_address"],
-                "authenticated": result["auth"],
-                "inbox_accessible": result["inbox_accessible"],
-                "folders": {
-                    "total": total_labels,
-                    "user": user_labels,
-                    "system": system_labels,
-                },
-                "unread_count": inbox_folder.unread_count if inbox_folder and inbox_folder.unread_count else 0,
-                "recent_email": recent_email_data,
-                "folder_list": [f.model_dump(mode='json') for f in folders]
-            }
-            console.print_json(data=status_data)
-        else:  # RICH
-            # Account header
+    if not result["auth"] or not result["email_address"]:
+        if as_json:
+            # Same shape as verify_setup(): folders is a count, not the list
+            details = {k: result[k] for k in ("auth", "email_address", "inbox_accessible", "errors")}
+            details["folders"] = len(result["folders"])
+            emit_json({"error": "Not authenticated", "details": details})
+        else:
             console.print(
                 Panel(
-                    f"[bold cyan]{result['email_address']}[/bold cyan]",
-                    title="📧 Gmail Account",
-                    border_style="cyan",
+                    "[red]✗ Not authenticated[/red]\n\n"
+                    + "\n".join(f"  - {error}" for error in result["errors"]),
+                    title="Authentication Failed",
+                    border_style="red",
                 )
             )
+        raise typer.Exit(code=1)
 
-            # Display folder statistics
-            stats_table = formatter.build_folder_stats_table(folders)
-            console.print(Panel(stats_table, title="📊 Folder Statistics", border_style="blue"))
-
-            # Display most recent email
-            if recent_email_data:
-                recent = recent_emails.emails[0]
-                from_display = f"{recent.from_.name or recent.from_.email}"
-                date_display = recent.date.strftime("%Y-%m-%d %H:%M")
-
-                recent_info = f"""[bold]From:[/bold] {from_display}
+    folders = result["folders"]
+    recent = result["recent_email"]
+
+    # Calculate stats
+    total_labels = len(folders)
+    user_labels, system_labels, inbox_folder = _summarize_folders(folders)
+
+    # Build JSON response
+    if as_json:
+        status_data = {
+            "email_address": result["email_address"],
+            "authenticated": result["auth"],
+            "inbox_accessible": result["inbox_accessible"],
+            "folders": {
+                "total": total_labels,
+                "user": user_labels,
+                "system": system_labels,
+            },
+            "unread_count": inbox_folder.unread_count if inbox_folder and inbox_folder.unread_count else 0,
+            "recent_email": recent,
+            "folder_list": folders,
+        }
+        emit_model_json(status_data)
+    else:  # RICH
+        # Collect every section and print them as one Group
+        renderables: List[Any] = [
+            # Account header
+            Panel(
+                f"[bold cyan]{result['email_address']}[/bold cyan]",
+                title="📧 Gmail Account",
+                border_style="cyan",
+            ),
+            # Folder statistics
+            Panel(
+                get_formatter(console).build_folder_stats_table(folders),
+                title="📊 Folder Statistics",
+                border_style="blue",
+            ),
+        ]
+
+        # Display most recent email
+        if recent:
+            from_display = f"{recent.from_.name or recent.from_.email}"
+            date_display = recent.date.strftime("%Y-%m-%d %H:%M")
+
+            recent_info = f"""[bold]From:[/bold] {from_display}
 [bold]Subject:[/bold] {recent.subject}
 [bold]Date:[/bold] {date_display}
 [bold]Preview:[/bold] {recent.snippet[:SNIPPET_PREVIEW_LENGTH]}..."""
 
-                if recent.is_unread:
-                    recent_info = "🔵 [bold yellow]UNREAD[/bold yellow]\n\n" + recent_info
+            if recent.is_unread:
+                recent_info = "🔵 [bold yellow]UNREAD[/bold yellow]\n\n" + recent_info
 
-                console.print(
-                    Panel(
-                        recent_info,
-                        title=f"📬 Most Recent Email (ID: {recent.message_id[:MESSAGE_ID_DISPLAY_LENGTH]}...)",
-                        border_style="green",
-                    )
+            renderables.append(
+                Panel(
+                    recent_info,
+                    title=f"📬 Most Recent Email (ID: {recent.message_id[:MESSAGE_ID_DISPLAY_LENGTH]}...)",
+                    border_style="green",
                 )
+            )
 
-            # Quick stats summary
-            total_labels = len(folders)
-            user_labels = len([f for f in folders if f.type == "user"])
-            system_labels = len([f for f in folders if f.type == "system"])
-
-            summary_items = [
-                f"[cyan]Total Labels:[/cyan] {total_labels}",
-                f"[blue]Custom:[/blue] {user_labels}",
-                f"[magenta]System:[/magenta] {system_labels}",
-            ]
-
-            console.print("\n" + " | ".join(summary_items))
+        # Quick stats summary
+        renderables.append(
+            STATUS_SUMMARY_TEMPLATE.format(total=total_labels, user=user_labels, system=system_labels)
+        )
 
-            # Unread indicator
-            inbox_folder = _get_folder_by_name(folders, "INBOX")
-            if inbox_folder and inbox_folder.unread_count and inbox_folder.unread_count > 0:
-                console.print(
-                    f"\n[bold yellow]⚠️  You have {inbox_folder.unread_count} unread message(s)[/bold yellow]"
-                )
-            else:
-                console.print("\n[green]✓ All caught up![/green]")
+        # Unread indicator
+        if inbox_folder and inbox_folder.unread_count and inbox_folder.unread_count > 0:
+            renderables.append(
+                f"\n[bold yellow]⚠️  You have {inbox_folder.unread_count} unread message(s)[/bold yellow]"
+            )
+        else:
+            renderables.append("\n[green]✓ All caught up![/green]")
 
-    except Exception as e:
-        console.print(f"[red]✗ Failed to get status: {e}[/red]")
-        raise typer.Exit(code=1)
+        console.print(Group(*renderables))
 
 
 @app.command()
+@command_errors("listing emails")
 def list(
     folder: str = typer.Option("ALL", "--folder", help="Folder to list from [default: ALL]"),
     max: int = typer.Option(10, "--max", "-n", help="Maximum results"),
     query: Optional[str] = typer.Option(None, "--query", "-q", help="Optional search query"),
     output_format: OutputFormat = typer.Option(OutputFormat.RICH, "--output-format", help="Output format"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON (same as --output-format json)"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON object per email (newline-delimited)"),
 ) -> None:
     """List emails from a folder.
 
@@ -319,26 +477,26 @@ def list(
       [dim]$[/dim] gmail list
       [dim]$[/dim] gmail list --folder SENT --max 20
       [dim]$[/dim] gmail list --query "is:unread"
+      [dim]$[/dim] gmail list --max 500 --ndjson
     """
-    try:
-        client = GmailClient()
-        result = client.list_emails(folder=folder, max_results=max, query=query)
-
-        if output_format == OutputFormat.JSON:
-            console.print_json(data=result.model_dump(mode='json'))
-        else:  # RICH
-            formatter.print_email_list(result.emails, folder)
-    except Exception as e:
-        console.print(f"[red]Error listing emails: {e}[/red]")
-        raise typer.Exit(code=1)
+    as_json = json_output or output_format == OutputFormat.JSON
+
+    client = _get_client()
+    if ndjson:
+        emit_ndjson(client.iter_emails(folder=folder, max_results=max, query=query))
+        return
+    result = client.list_emails(folder=folder, max_results=max, query=query)
+    _LIST_EMIT[as_json](result, folder)
 
 
 @app.command()
+@command_errors("reading email")
 def read(
     message_id: str = typer.Argument(..., help="Message ID to read"),
     full: bool = typer.Option(False, "--full", help="Show full email body"),
     full_thread: bool = typer.Option(False, "--full-thread", help="Show full email with entire thread context"),
     output_format: OutputFormat = typer.Option(OutputFormat.RICH, "--output-format", help="Output format"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON (same as --output-format json)"),
 ) -> None:
     """Read a specific email by message ID.
 
@@ -348,49 +506,45 @@ def read(
       [dim]$[/dim] gmail read msg123 --full-thread
       [dim]$[/dim] gmail read msg123 --output-format json
     """
-    try:
-        client = GmailClient()
-
-        # Determine format type
-        format_type = "full" if (full or full_thread) else "summary"
-        email = client.read_email(message_id, format=format_type)
-
-        if output_format == OutputFormat.JSON:
-            # For JSON output with --full-thread, include thread messages
-            if full_thread:
-                thread_messages = client.get_thread(message_id)
-                output_data = {
-                    "email": email.model_dump(mode='json'),
-                    "thread": [msg.model_dump(mode='json') for msg in thread_messages]
-                }
-                console.print_json(data=output_data)
-            else:
-                console.print_json(data=email.model_dump(mode='json'))
-        else:  # RICH
-            if full_thread:
-                # Display the main email
-                formatter.print_email_full(email)
-
-                # Display thread context
-                thread_messages = client.get_thread(message_id)
-                if len(thread_messages) > 1:
-                    console.print("\n[bold cyan]📧 Thread Context[/bold cyan]")
-                    console.print(f"[dim]Total messages in thread: {len(thread_messages)}[/dim]\n")
-                    formatter.print_thread(thread_messages, message_id)
-            elif full:
-                formatter.print_email_full(email)
-            else:
-                formatter.print_email_summary(email)
-    except Exception as e:
-        console.print(f"[red]Error reading email: {e}[/red]")
-        raise typer.Exit(code=1)
+    as_json = json_output or output_format == OutputFormat.JSON
+
+    client = _get_client()
+
+    # Determine format type
+    format_type = "full" if (full or full_thread) else "summary"
+    email = client.read_email(message_id, format=format_type)
+
+    if as_json:
+        # For JSON output with --full-thread, include thread messages
+        if full_thread:
+            thread_messages = client.get_thread(message_id)
+            emit_model_json({"email": email, "thread": thread_messages})
+        else:
+            emit_model_json(email)
+    else:  # RICH
+        if full_thread:
+            # Display the main email
+            get_formatter(console).print_email_full(email)
+
+            # Display thread context
+            thread_messages = client.get_thread(message_id)
+            if len(thread_messages) > 1:
+                console.print("\n[bold cyan]📧 Thread Context[/bold cyan]")
+                console.print(f"[dim]Total messages in thread: {len(thread_messages)}[/dim]\n")
+                get_formatter(console).print_thread(thread_messages, message_id)
+        elif full:
+            get_formatter(console).print_email_full(email)
+        else:
+            get_formatter(console).print_email_summary(email)
 
 
 @app.command()
+@command_errors("getting thread")
 def thread(
     message_id: str = typer.Argument(..., help="Message ID in the thread"),
     strip_quotes: bool = typer.Option(False, "--strip-quotes", help="Remove quoted content from replies"),
     output_format: OutputFormat = typer.Option(OutputFormat.RICH, "--output-format", help="Output format"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON (same as --output-format json)"),
 ) -> None:
     """Show entire email thread containing a message.
 
@@ -399,50 +553,49 @@ def thread(
       [dim]$[/dim] gmail thread msg123 --strip-quotes
       [dim]$[/dim] gmail thread msg123 --output-format json
     """
-    try:
-        from gmaillm.helpers.domain.email_parser import EmailBodyParser
-
-        client = GmailClient()
-
+    as_json = json_output or output_format == OutputFormat.JSON
+
+    from gmaillm.helpers.domain.email_parser import EmailBodyParser
+
+    client = _get_client()
+
+    if strip_quotes:
+        # Get full thread with bodies so we can strip quotes
+        thread_messages = client.get_thread_full(message_id)
+        parser = EmailBodyParser()
+
+        # Strip quotes from each message
+        for email in thread_messages:
+            if email.body_plain:
+                email.body_plain = parser.extract_new_content_plain(email.body_plain)
+            if email.body_html:
+                email.body_html = parser.extract_new_content_html(email.body_html)
+    else:
+        # Get summary thread (no bodies needed)
+        thread_messages = client.get_thread(message_id)
+
+    if as_json:
+        emit_model_json(thread_messages)
+    else:  # RICH
         if strip_quotes:
-            # Get full thread with bodies so we can strip quotes
-            thread_messages = client.get_thread_full(message_id)
-            parser = EmailBodyParser()
-
-            # Strip quotes from each message
-            for email in thread_messages:
-                if email.body_plain:
-                    email.body_plain = parser.extract_new_content_plain(email.body_plain)
-                if email.body_html:
-                    email.body_html = parser.extract_new_content_html(email.body_html)
+            # Display full emails with stripped quotes
+            for i, email in enumerate(thread_messages, 1):
+                console.print(f"\n[bold cyan]Message {i} of {len(thread_messages)}[/bold cyan]")
+                get_formatter(console).print_email_full(email)
         else:
-            # Get summary thread (no bodies needed)
-            thread_messages = client.get_thread(message_id)
-
-        if output_format == OutputFormat.JSON:
-            # thread_messages is a list, so serialize each message
-            console.print_json(data=[msg.model_dump(mode='json') for msg in thread_messages])
-        else:  # RICH
-            if strip_quotes:
-                # Display full emails with stripped quotes
-                for i, email in enumerate(thread_messages, 1):
-                    console.print(f"\n[bold cyan]Message {i} of {len(thread_messages)}[/bold cyan]")
-                    formatter.print_email_full(email)
-            else:
-                # Display summary thread
-                formatter.print_thread(thread_messages, message_id)
-
-    except Exception as e:
-        console.print(f"[red]Error getting thread: {e}[/red]")
-        raise typer.Exit(code=1)
+            # Display summary thread
+            get_formatter(console).print_thread(thread_messages, message_id)
 
 
 @app.command()
+@command_errors("searching emails")
 def search(
     query: str = typer.Argument(..., help="Gmail search query"),
     folder: str = typer.Option("INBOX", "--folder", help="Folder to search in"),
     max: int = typer.Option(10, "--max", "-n", help="Maximum results"),
     output_format: OutputFormat = typer.Option(OutputFormat.RICH, "--output-format", help="Output format"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON (same as --output-format json)"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON object per email (newline-delimited)"),
 ) -> None:
     """Search emails using Gmail query syntax.
 
@@ -450,21 +603,20 @@ def search(
       [dim]$[/dim] gmail search "from:boss@company.com"
       [dim]$[/dim] gmail search "is:unread label:important"
       [dim]$[/dim] gmail search "subject:meeting" --max 20
+      [dim]$[/dim] gmail search "has:attachment" --max 500 --ndjson
     """
-    try:
-        client = GmailClient()
-        result = client.search_emails(query=query, folder=folder, max_results=max)
-
-        if output_format == OutputFormat.JSON:
-            console.print_json(data=result.model_dump(mode='json'))
-        else:  # RICH
-            formatter.print_search_results(result)
-    except Exception as e:
-        console.print(f"[red]Error searching emails: {e}[/red]")
-        raise typer.Exit(code=1)
+    as_json = json_output or output_format == OutputFormat.JSON
+
+    client = _get_client()
+    if ndjson:
+        emit_ndjson(client.iter_emails(folder=folder, max_results=max, query=query))
+        return
+    result = client.search_emails(query=query, folder=folder, max_results=max)
+    _SEARCH_EMIT[as_json](result)
 
 
 @app.command()
+@command_errors("sending reply")
 def reply(
     message_id: str = typer.Argument(..., help="Message ID to reply to"),
     body: Optional[str] = typer.Option(None, "--body", help="Reply body text"),
@@ -475,6 +627,7 @@ def reply(
         "-j",
         help="Path to JSON file for programmatic reply"
     ),
+    yolo: bool = typer.Option(False, "--yolo", help="Send without confirmation"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be sent without actually sending"),
     schema: bool = typer.Option(False, "--schema", help="Display JSON schema and exit"),
 ) -> None:
@@ -487,89 +640,88 @@ def reply(
 
     [bold cyan]EXAMPLES[/bold cyan]:
       [dim]$[/dim] gmail reply msg123 --body "Thanks for the update!"
-      [dim]$[/dim] gmail reply msg123 --json-input-path reply.json
+      [dim]$[/dim] gmail reply msg123 --json-input-path reply.json --yolo
       [dim]$[/dim] gmail reply msg123 --schema
     """
-    try:
-        # Display schema if requested
-        if schema:
-            from gmaillm.validators.email_operations import get_reply_email_json_schema_string
-            display_schema_and_exit(
-                schema_getter=get_reply_email_json_schema_string,
-                title="Reply Email JSON Schema",
-                description="Use this schema for programmatic replies with --json-input-path",
-                usage_example="gmail reply <message_id> --json-input-path reply.json"
-            )
-            return
+    # Display schema if requested
+    if schema:
+        from gmaillm.validators.email_operations import get_reply_email_json_schema_string
+        display_schema_and_exit(
+            schema_getter=get_reply_email_json_schema_string,
+            title="Reply Email JSON Schema",
+            description="Use this schema for programmatic replies with --json-input-path",
+            usage_example="gmail reply <message_id> --json-input-path reply.json"
+        )
+        return
 
-        client = GmailClient()
+    client = _get_client()
 
-        # PROGRAMMATIC MODE: JSON input
-        if json_input_path:
-            from gmaillm.validators.email_operations import validate_reply_email_json
+    # PROGRAMMATIC MODE: JSON input
+    if json_input_path:
+        from gmaillm.validators.email_operations import validate_reply_email_json
 
-            console.print("[cyan]Sending reply from JSON file...[/cyan]")
+        console.print("[cyan]Sending reply from JSON file...[/cyan]")
 
-            # Load and validate JSON
-            json_data = load_and_validate_json(
-                json_path_str=json_input_path,
-                validator_func=validate_reply_email_json,
-                schema_help_command="gmail reply <message_id> --schema"
-            )
+        # Load and validate JSON
+        json_data = load_and_validate_json(
+            json_path_str=json_input_path,
+            validator_func=validate_reply_email_json,
+            schema_help_command="gmail reply <message_id> --schema"
+        )
 
-            # Extract from JSON
-            reply_body = json_data["body"]
-            do_reply_all = json_data.get("reply_all", False)
+        # Extract from JSON
+        reply_body = json_data["body"]
+        do_reply_all = json_data.get("reply_all", False)
+
+    # INTERACTIVE MODE: CLI arguments
+    else:
+        if body is None:
+            console.print("[red]✗ Required: --body (or use --json-input-path)[/red]")
+            console.print("\nUsage: [cyan]gmail reply <message_id> --body <text>[/cyan]")
+            console.print("   Or: [cyan]gmail reply <message_id> --json-input-path reply.json[/cyan]")
+            console.print("   Or: [cyan]gmail reply <message_id> --schema[/cyan] to view JSON schema")
+            raise typer.Exit(code=1)
 
-        # INTERACTIVE MODE: CLI arguments
-        else:
-            if body is None:
-                console.print("[red]✗ Required: --body (or use --json-input-path)[/red]")
-                console.print("\nUsage: [cyan]gmail reply <message_id> --body <text>[/cyan]")
-                console.print("   Or: [cyan]gmail reply <message_id> --json-input-path reply.json[/cyan]")
-                console.print("   Or: [cyan]gmail reply <message_id> --schema[/cyan] to view JSON schema")
-                raise typer.Exit(code=1)
-
-            reply_body = body
-            do_reply_all = reply_all
-
-        # Get original email for context
-        original = client.read_email(message_id, format="summary")
-
-        # Show preview
-        reply_details = {
-            "To": original.from_.email,
-            "Subject": f"Re: {original.subject}"
-        }
+        reply_body = body
+        do_reply_all = reply_all
+
+    # Only the sender and subject are needed for the preview
+    original = client.read_email_headers(message_id, ["From", "Subject"])
 
-        show_operation_preview("Reply Preview", reply_details)
-        if do_reply_all:
-            console.print("[yellow](Reply All mode)[/yellow]")
-        console.print(f"\n{reply_body}\n")
-        console.print("=" * 60)
+    # Show preview
+    reply_details = {
+        "To": _lazy("parse_email_address")(original["From"] or "")["email"],
+        "Subject": f"Re: {original['Subject'] or '(No subject)'}"
+    }
 
-        # Dry run mode - show preview and exit
-        if dry_run:
-            console.print("\n[yellow]🔍 DRY RUN - Reply would be sent with the above details[/yellow]")
-            console.print("[dim]Use without --dry-run to actually send[/dim]")
-            return
+    show_operation_preview("Reply Preview", reply_details)
+    preview = ["[yellow](Reply All mode)[/yellow]"] if do_reply_all else []
+    preview += [f"\n{reply_body}\n", SEPARATOR]
+    console.print("\n".join(preview))
 
-        # Confirm
-        if not confirm_or_force("\nSend this reply?", False):
-            console.print("Cancelled.")
-            return
+    # Dry run mode - show preview and exit
+    if dry_run:
+        console.print(
+            "\n[yellow]🔍 DRY RUN - Reply would be sent with the above details[/yellow]\n"
+            "[dim]Use without --dry-run to actually send[/dim]"
+        )
+        return
 
-        # Send reply
-        result = client.reply_email(message_id=message_id, body=reply_body, reply_all=do_reply_all)
+    # Confirm unless yolo
+    if yolo:
+        console.print("\n[yellow]--force: YOLO mode: Sending without confirmation...[/yellow]")
+    elif not _confirm("\nSend this reply?"):
+        console.print("Cancelled.")
+        return
 
-        console.print(f"\n[green]✅ Reply sent! Message ID: {result.message_id}[/green]")
+    # Send reply
+    result = client.reply_email(message_id=message_id, body=reply_body, reply_all=do_reply_all)
 
-    except Exception as e:
-        console.print(f"[red]Error sending reply: {e}[/red]")
-        raise typer.Exit(code=1)
+    console.print(f"\n[green]✅ Reply sent! Message ID: {result.message_id}[/green]")
 
 
 @app.command()
+@command_errors("sending email")
 def send(
     to: Optional[List[str]] = typer.Option(None, "--to", "-t", help="Recipient email(s). Can be repeated for multiple recipients or use #groupname"),
     subject: Optional[str] = typer.Option(None, "--subject", "-s", help="Email subject"),
@@ -601,124 +753,109 @@ def send(
       [dim]$[/dim] gmail send --json-input-path email.json --yolo
       [dim]$[/dim] gmail send --schema
     """
-    try:
-        # Display schema if requested
-        if schema:
-            from gmaillm.validators.email_operations import get_send_email_json_schema_string
-            display_schema_and_exit(
-                schema_getter=get_send_email_json_schema_string,
-                title="Send Email JSON Schema",
-                description="Use this schema for programmatic email sending with --json-input-path",
-                usage_example="gmail send --json-input-path email.json --yolo"
-            )
-            return
-
-        client = GmailClient()
-
-        # PROGRAMMATIC MODE: JSON input
-        if json_input_path:
-            from gmaillm.validators.email_operations import validate_send_email_json
+    # Display schema if requested
+    if schema:
+        from gmaillm.validators.email_operations import get_send_email_json_schema_string
+        display_schema_and_exit(
+            schema_getter=get_send_email_json_schema_string,
+            title="Send Email JSON Schema",
+            description="Use this schema for programmatic email sending with --json-input-path",
+            usage_example="gmail send --json-input-path email.json --yolo"
+        )
+        return
 
-            console.print("[cyan]Sending email from JSON file...[/cyan]")
+    client = _get_client()
 
-            # Load and validate JSON
-            json_data = load_and_validate_json(
-                json_path_str=json_input_path,
-                validator_func=validate_send_email_json,
-                schema_help_command="gmail send --schema"
-            )
+    # PROGRAMMATIC MODE: JSON input
+    if json_input_path:
+        from gmaillm.validators.email_operations import validate_send_email_json
 
-            # Extract from JSON
-            to_list_raw = json_data["to"]
-            email_subject = json_data["subject"]
-            email_body = json_data["body"]
-            cc_list_raw = json_data.get("cc")
-            bcc_list_raw = json_data.get("bcc")
-            attachment_list = json_data.get("attachments")
+        console.print("[cyan]Sending email from JSON file...[/cyan]")
 
-        # INTERACTIVE MODE: CLI arguments
-        else:
-            if to is None or subject is None or body is None:
-                console.print("[red]✗ Required: --to, --subject, --body (or use --json-input-path)[/red]")
-                console.print("\nUsage: [cyan]gmail send --to <email> --subject <text> --body <text>[/cyan]")
-                console.print("   Or: [cyan]gmail send --json-input-path email.json[/cyan]")
-                console.print("   Or: [cyan]gmail send --schema[/cyan] to view JSON schema")
-                raise typer.Exit(code=1)
-
-            to_list_raw = to
-            email_subject = subject
-            email_body = body
-            cc_list_raw = cc
-            bcc_list_raw = bcc
-            attachment_list = attachments
-
-        # Expand email groups first (#groupname -> actual emails)
-        to_list = expand_email_groups(to_list_raw)
-        cc_list = expand_email_groups(cc_list_raw) if cc_list_raw else None
-        bcc_list = expand_email_groups(bcc_list_raw) if bcc_list_raw else None
-
-        # Validate expanded email addresses
-        validate_email_list(to_list, "recipient")
-        if cc_list:
-            validate_email_list(cc_list, "CC")
-        if bcc_list:
-            validate_email_list(bcc_list, "BCC")
-
-        # Validate attachments
-        validated_attachments = validate_attachment_paths(attachment_list)
-
-        # Show preview
-        preview_details = {
-            "To": ', '.join(to_list),
-            "Subject": email_subject
-        }
-        if cc_list:
-            preview_details["Cc"] = ', '.join(cc_list)
-        if bcc_list:
-            preview_details["Bcc"] = ', '.join(bcc_list)
-
-        show_operation_preview("Email Preview", preview_details)
-        console.print(f"\n{email_body}\n")
-
-        if validated_attachments:
-            console.print(f"Attachments: {len(validated_attachments)} file(s)")
-            for att in validated_attachments:
-                console.print(f"  - {att}")
-        console.print("=" * 60)
-
-        # Dry run mode - show preview and exit
-        if dry_run:
-            console.print("\n[yellow]🔍 DRY RUN - Email would be sent with the above details[/yellow]")
-            console.print("[dim]Use without --dry-run to actually send[/dim]")
-            return
-
-        # Confirm unless yolo
-        if not confirm_or_force("\nSend this email?", yolo, "YOLO mode: Sending without confirmation..."):
-            console.print("Cancelled.")
-            return
-
-        # Send email
-        request = SendEmailRequest(
-            to=to_list, subject=email_subject, body=email_body, cc=cc_list, bcc=bcc_list, attachments=validated_attachments
+        # Load and validate JSON
+        json_data = load_and_validate_json(
+            json_path_str=json_input_path,
+            validator_func=validate_send_email_json,
+            schema_help_command="gmail send --schema"
         )
-        result = client.send_email(request)
 
-        console.print(f"\n[green]✅ Email sent! Message ID: {result.message_id}[/green]")
+        # Extract from JSON
+        to_list_raw = json_data["to"]
+        email_subject = json_data["subject"]
+        email_body = json_data["body"]
+        cc_list_raw = json_data.get("cc")
+        bcc_list_raw = json_data.get("bcc")
+        attachment_list = json_data.get("attachments")
+
+    # INTERACTIVE MODE: CLI arguments
+    else:
+        if to is None or subject is None or body is None:
+            console.print("[red]✗ Required: --to, --subject, --body (or use --json-input-path)[/red]")
+            console.print("\nUsage: [cyan]gmail send --to <email> --subject <text> --body <text>[/cyan]")
+            console.print("   Or: [cyan]gmail send --json-input-path email.json[/cyan]")
+            console.print("   Or: [cyan]gmail send --schema[/cyan] to view JSON schema")
+            raise typer.Exit(code=1)
 
-    except Exception as e:
-        console.print(f"[red]Error sending email: {e}[/red]")
-        raise typer.Exit(code=1)
+        to_list_raw = to
+        email_subject = subject
+        email_body = body
+        cc_list_raw = cc
+        bcc_list_raw = bcc
+        attachment_list = attachments
+
+    expand_email_groups = _lazy("expand_email_groups")
+
+    # Expand email groups first (#groupname -> actual emails)
+    to_list = expand_email_groups(to_list_raw)
+    cc_list = expand_email_groups(cc_list_raw) if cc_list_raw else None
+    bcc_list = expand_email_groups(bcc_list_raw) if bcc_list_raw else None
+
+    # Validate expanded email addresses
+    _lazy("validate_email_lists")(("recipient", to_list), ("CC", cc_list), ("BCC", bcc_list))
+
+    # Validate attachments
+    validated_attachments = _lazy("validate_attachment_paths")(attachment_list)
+
+    # Show preview
+    preview_details = {
+        "To": ', '.join(to_list),
+        "Subject": email_subject
+    }
+    if cc_list:
+        preview_details["Cc"] = ', '.join(cc_list)
+    if bcc_list:
+        preview_details["Bcc"] = ', '.join(bcc_list)
+
+    show_operation_preview("Email Preview", preview_details)
+    preview = [f"\n{email_body}\n"]
+    if validated_attachments:
+        preview.append(f"Attachments: {len(validated_attachments)} file(s)")
+        preview.extend(f"  - {att}" for att in validated_attachments)
+    preview.append(SEPARATOR)
+    console.print("\n".join(preview))
+
+    # Dry run mode - show preview and exit
+    if dry_run:
+        console.print(
+            "\n[yellow]🔍 DRY RUN - Email would be sent with the above details[/yellow]\n"
+            "[dim]Use without --dry-run to actually send[/dim]"
+        )
+        return
 
+    # Confirm unless yolo
+    if yolo:
+        console.print("\n[yellow]--force: YOLO mode: Sending without confirmation...[/yellow]")
+    elif not _confirm("\nSend this email?"):
+        console.print("Cancelled.")
+        return
 
-# ============ SUBCOMMAND REGISTRATION ============
+    # Send email
+    request = _lazy("SendEmailRequest")(
+        to=to_list, subject=email_subject, body=email_body, cc=cc_list, bcc=bcc_list, attachments=validated_attachments
+    )
+    result = client.send_email(request)
 
-# Register command modules
-app.add_typer(ask.app, name="ask")
-app.add_typer(labels.app, name="labels")
-app.add_typer(groups.app, name="groups")
-app.add_typer(styles.app, name="styles")
-app.add_typer(workflows.app, name="workflows")
-app.add_typer(config_commands.app, name="config")
+    console.print(f"\n[green]✅ Email sent! Message ID: {result.message_id}[/green]")
 
 
 # ============ MAIN ENTRY POINT ============
@@ -729,6 +866,12 @@ def main() -> None:
     Uses HelpfulGroup to automatically show help when required
     arguments are missing, providing a better user experience.
     """
+    if "_GMAIL_COMPLETE" in os.environ:
+        # Tab-completion request: register Typer's shell completion classes,
+        # which add_completion=True would otherwise have done at startup
+        from typer.completion import completion_init
+
+        completion_init()
     app()
 
 
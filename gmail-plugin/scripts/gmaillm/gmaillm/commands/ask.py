@@ -9,19 +9,26 @@ Example:
     $ gmail ask "When is the next deadline?"
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from enum import Enum
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 
-from gmaillm import GmailClient
-from gmaillm.agent import ClaudeEmailAgent
-from gmaillm.helpers.cli import HelpfulGroup
+from gmaillm.helpers.cli import HelpfulGroup, emit_json
+from gmaillm.helpers.core.lazy import lazy_importer
+
+if TYPE_CHECKING:
+    from gmaillm.agent import ClaudeEmailAgent
 
 console = Console()
 
+__getattr__ = _lazy = lazy_importer(globals(), {
+    "GmailClient": "gmaillm.gmail_client",
+    "ClaudeEmailAgent": "gmaillm.agent",
+})
+
 
 class OutputFormat(str, Enum):
     """Output format for ask command."""
@@ -37,7 +44,7 @@ app = typer.Typer(
 )
 
 
-def generate_search_query(question: str, agent: Optional[ClaudeEmailAgent] = None) -> str:
+def generate_search_query(question: str, agent: Optional["ClaudeEmailAgent"] = None) -> str:
     """Generate Gmail search query from natural language question.
 
     This is a simple approach that can be enhanced with Claude to generate
@@ -133,8 +140,8 @@ def ask_command(
         console.print(f"\n[cyan]📧 Searching email history...{' (with context)' if context else ''}[/cyan]")
 
         # Initialize clients
-        gmail_client = GmailClient()
-        agent = ClaudeEmailAgent(model="sonnet")
+        gmail_client = _lazy("GmailClient")()
+        agent = _lazy("ClaudeEmailAgent")(model="sonnet")
 
         # Generate search query from question
         search_query = generate_search_query(question, agent)
@@ -175,7 +182,7 @@ def ask_command(
 
         # Display answer
         if output_format == OutputFormat.JSON:
-            console.print_json(data={
+            emit_json({
                 "question": question,
                 "answer": answer,
                 "sources": email_count,
@@ -20,6 +20,23 @@ app = typer.Typer(
 )
 console = Console()
 
+# Static command reference shown at the end of `config show`
+_COMMANDS_HELP = """
+Style Commands:
+  [cyan]gmail styles list[/cyan]            # List all email styles
+  [cyan]gmail styles create <name>[/cyan]   # Create new style
+  [cyan]gmail styles edit <name>[/cyan]     # Edit style
+  [cyan]gmail styles validate \\[name][/cyan] # Validate style(s)
+
+Group Commands:
+  [cyan]gmail groups list[/cyan]            # List all groups
+  [cyan]gmail groups create <name>[/cyan]   # Create new group
+  [cyan]gmail groups add <group> <email>[/cyan]  # Add member
+  [cyan]gmail groups validate[/cyan]        # Validate all groups
+
+Other:
+  [cyan]gmail config show[/cyan]            # Show this information"""
+
 
 @app.command("examples")
 def show_examples() -> None:
@@ -70,25 +87,16 @@ def show_config(
 
     # Define rich output function
     def print_rich():
-        console.print("=" * 60)
-        console.print("Gmail Integration Configuration")
-        console.print("=" * 60)
-        console.print(f"\nEmail Styles:     {styles_dir}")
-        console.print(f"Email Groups:     {groups_file}")
-        console.print(f"Learned Patterns: {learned_dir}")
-        console.print(f"\nEditor: {editor} (set via $EDITOR)")
-        console.print("\nStyle Commands:")
-        console.print("  [cyan]gmail styles list[/cyan]            # List all email styles")
-        console.print("  [cyan]gmail styles create <name>[/cyan]   # Create new style")
-        console.print("  [cyan]gmail styles edit <name>[/cyan]     # Edit style")
-        console.print("  [cyan]gmail styles validate [name][/cyan] # Validate style(s)")
-        console.print("\nGroup Commands:")
-        console.print("  [cyan]gmail groups list[/cyan]            # List all groups")
-        console.print("  [cyan]gmail groups create <name>[/cyan]   # Create new group")
-        console.print("  [cyan]gmail groups add <group> <email>[/cyan]  # Add member")
-        console.print("  [cyan]gmail groups validate[/cyan]        # Validate all groups")
-        console.print("\nOther:")
-        console.print("  [cyan]gmail config show[/cyan]            # Show this information")
+        console.print("\n".join([
+            "=" * 60,
+            "Gmail Integration Configuration",
+            "=" * 60,
+            f"\nEmail Styles:     {styles_dir}",
+            f"Email Groups:     {groups_file}",
+            f"Learned Patterns: {learned_dir}",
+            f"\nEditor: {editor} (set via $EDITOR)",
+            _COMMANDS_HELP,
+        ]))
 
     # Output in appropriate format
     output_json_or_rich(format_enum, config_data, print_rich)
@@ -20,7 +20,8 @@ from gmaillm.helpers.cli import (
     ensure_item_exists,
     create_backup_with_message,
     print_success,
-    output_json_or_rich
+    output_json_or_rich,
+    emit_json,
 )
 from gmaillm.validators.email import validate_email
 from gmaillm.validators.email_operations import (
@@ -203,8 +204,8 @@ def show_group(
             console.print(f"Members: {len(emails)}")
             console.print()
 
-            for i, email in enumerate(emails, 1):
-                console.print(f"  {i}. {email}")
+            if emails:
+                console.print("\n".join(f"  {i}. {email}" for i, email in enumerate(emails, 1)))
 
             console.print()
             console.print(f"Usage: [cyan]gmail send --to #{name} ...[/cyan]")
@@ -488,6 +489,12 @@ def validate_group(
         for group_name, emails in groups_to_validate.items():
             group_errors = []
 
+            if not isinstance(emails, list):
+                group_errors.append(
+                    f"Members must be a list of email addresses, got {type(emails).__name__}"
+                )
+                emails = []
+
             # Check for invalid emails
             for email in emails:
                 if not validate_email(email):
@@ -518,7 +525,7 @@ def validate_group(
                     console.print(f"[green]✅ #{group_name}[/green]")
 
         if format_enum == OutputFormat.JSON:
-            console.print_json(data=validation_results)
+            emit_json(validation_results)
             # Set errors_found based on validation results
             errors_found = any(not r["valid"] for r in validation_results)
         else:  # RICH
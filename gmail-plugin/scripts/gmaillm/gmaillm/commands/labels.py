@@ -3,8 +3,6 @@
 import typer
 from rich.console import Console
 
-from gmaillm import GmailClient
-from gmaillm.formatters import RichFormatter
 from gmaillm.helpers.cli import (
     HelpfulGroup,
     OutputFormat,
@@ -12,8 +10,10 @@ from gmaillm.helpers.cli import (
     show_operation_preview,
     confirm_or_force,
     handle_command_error,
-    output_json_or_rich
+    emit_model_json,
+    get_formatter,
 )
+from gmaillm.helpers.core.lazy import lazy_importer
 from gmaillm.validators.email import validate_label_name
 
 # Initialize Typer app and console
@@ -23,7 +23,8 @@ app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]}
 )
 console = Console()
-formatter = RichFormatter(console)
+
+__getattr__ = _lazy = lazy_importer(globals(), {"GmailClient": "gmaillm.gmail_client"})
 
 
 @app.command("examples")
@@ -73,16 +74,15 @@ def list_labels(
       $ gmail labels list --output-format json
     """
     try:
-        client = GmailClient()
+        client = _lazy("GmailClient")()
         folders = client.get_folders()
 
         # Parse and handle output format
         format_enum = parse_output_format(output_format, console)
-        output_json_or_rich(
-            format_enum,
-            json_data=[f.model_dump(mode='json') for f in folders],
-            rich_func=lambda: formatter.print_folder_list(folders, "Gmail Labels")
-        )
+        if format_enum == OutputFormat.JSON:
+            emit_model_json(folders)
+        else:
+            get_formatter(console).print_folder_list(folders, "Gmail Labels")
 
     except Exception as e:
         console.print(f"[red]✗ Error listing labels: {e}[/red]")
@@ -105,7 +105,7 @@ def create_label(
         # Validate label name
         validate_label_name(name)
 
-        client = GmailClient()
+        client = _lazy("GmailClient")()
 
         # Show preview
         show_operation_preview(
@@ -141,7 +141,7 @@ def delete_label(
       $ gmail labels delete "Archive/2023" --force
     """
     try:
-        client = GmailClient()
+        client = _lazy("GmailClient")()
 
         # Get all folders to find the label
         folders = client.get_folders()
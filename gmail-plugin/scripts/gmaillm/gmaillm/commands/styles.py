@@ -1,8 +1,9 @@
 """Gmail email styles management commands."""
 
-import builtins
 import os
+import shutil
 import subprocess
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -15,13 +16,19 @@ from gmaillm.helpers.cli import (
     confirm_or_force,
     create_backup_with_message,
     display_schema_and_exit,
+    emit_json,
     handle_command_error,
     load_and_validate_json,
     output_json_or_rich,
     parse_output_format,
     show_operation_preview,
 )
-from gmaillm.helpers.core import create_backup, get_style_file_path, get_styles_dir
+from gmaillm.helpers.core import (
+    create_backup,
+    get_style_file_path,
+    get_styles_dir,
+    move_to_backup,
+)
 from gmaillm.helpers.domain import create_style_from_template, load_all_styles
 from gmaillm.validators.email import validate_editor
 from gmaillm.validators.styles import (
@@ -179,13 +186,15 @@ def list_styles(
                 console.print("\nCreate a new style with: [cyan]gmail styles create <name>[/cyan]")
                 return
 
+            lines = []
             for style in styles:
-                console.print(f"\n📝 [bold]{style['name']}[/bold]")
-                console.print(f"   {style['description']}")
+                lines.append(f"\n📝 [bold]{style['name']}[/bold]")
+                lines.append(f"   {style['description']}")
 
                 if show_paths:
                     style_path = get_style_file_path(style['name'])
-                    console.print(f"   [dim]Path: {style_path}[/dim]")
+                    lines.append(f"   [dim]Path: {style_path}[/dim]")
+            console.print("\n".join(lines))
 
             console.print(f"\n[dim]Total: {len(styles)} style(s)[/dim]")
             console.print("\nUsage: [cyan]gmail styles show <name>[/cyan]")
@@ -212,20 +221,19 @@ def show_style(
             console.print("\nAvailable styles: [cyan]gmail styles list[/cyan]")
             raise typer.Exit(code=1)
 
-        content = style_file.read_text()
-
         # Parse output format
         format_enum = parse_output_format(output_format, console)
 
-        # Prepare JSON data
-        style_data = {
-            "name": name,
-            "path": str(style_file),
-            "content": content
-        }
-
-        # Output in appropriate format
-        output_json_or_rich(format_enum, style_data, lambda: console.print(content))
+        if format_enum == OutputFormat.JSON:
+            emit_json({
+                "name": name,
+                "path": str(style_file),
+                "content": style_file.read_text()
+            })
+        else:
+            # Copy the file as-is: no markup parsing, so "[...]" prints verbatim
+            with style_file.open() as f:
+                shutil.copyfileobj(f, sys.stdout)
 
     except Exception as e:
         console.print(f"[red]✗ Error showing style: {e}[/red]")
@@ -492,11 +500,8 @@ def delete_style(
             console.print("Cancelled.")
             return
 
-        # Create backup before deletion
-        create_backup_with_message(style_file, create_backup)
-
-        # Delete
-        style_file.unlink()
+        # Delete by moving the file to its backup (a rename, not a copy)
+        create_backup_with_message(style_file, move_to_backup)
 
         console.print(f"\n[green]✅ Style deleted: {name}[/green]")
 
@@ -513,7 +518,9 @@ def _validate_single_style(name: str, style_file: Path, fix: bool, linter: Style
 
     if fix:
         fixed_content, errors = linter.lint_and_fix(content)
-        style_file.write_text(fixed_content)
+        # Leave already-clean files untouched (no write, mtime unchanged)
+        if fixed_content != content:
+            style_file.write_text(fixed_content)
         return {
             "name": name,
             "fixed": True,
@@ -557,7 +564,11 @@ def validate_style(
         if name is None:
             # Validate all styles
             styles_dir = get_styles_dir()
-            style_files = builtins.list(styles_dir.glob("*.md"))
+            with os.scandir(styles_dir) as entries:
+                style_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                ]
 
             if not style_files:
                 console.print("[yellow]No styles found[/yellow]")
@@ -587,7 +598,7 @@ def validate_style(
         if format_enum == OutputFormat.JSON:
             if len(results) == 1:
                 # Single style: output just the result
-                console.print_json(data=results[0])
+                emit_json(results[0])
             else:
                 # Multiple styles: output summary
                 valid_count = sum(1 for r in results if r["valid"])
@@ -598,7 +609,7 @@ def validate_style(
                     "invalid": invalid_count,
                     "results": results
                 }
-                console.print_json(data=summary)
+                emit_json(summary)
         else:  # RICH
             if len(results) == 1:
                 # Single style: detailed output
@@ -6,16 +6,17 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from gmaillm import GmailClient
-from gmaillm.formatters import RichFormatter
 from gmaillm.helpers.cli import (
     OutputFormat,
     confirm_or_force,
+    emit_model_json,
+    get_formatter,
     handle_command_error,
     output_json_or_rich,
     parse_output_format,
     show_operation_preview,
 )
+from gmaillm.helpers.core.lazy import lazy_importer
 from gmaillm.workflow_config import WorkflowConfig, WorkflowManager
 from gmaillm.workflow_state import (
     WorkflowAction,
@@ -29,7 +30,8 @@ app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]}
 )
 console = Console()
-formatter = RichFormatter(console)
+
+__getattr__ = _lazy = lazy_importer(globals(), {"GmailClient": "gmaillm.gmail_client"})
 
 
 @app.command("examples")
@@ -202,7 +204,7 @@ def run_workflow(
       $ gmail workflows run clear --output-format json
     """
     try:
-        client = GmailClient()
+        client = _lazy("GmailClient")()
 
         # Determine query and settings
         if workflow_id:
@@ -228,7 +230,7 @@ def run_workflow(
 
         # JSON output mode (programmatic)
         if output_format == OutputFormat.JSON:
-            console.print_json(data=result.model_dump(mode='json'))
+            emit_model_json(result)
             return
 
         # Interactive mode
@@ -250,7 +252,7 @@ def run_workflow(
             email = client.read_email(email_summary.message_id, format="full")
 
             # Display email
-            formatter.print_email_full(email)
+            get_formatter(console).print_email_full(email)
 
             # Prompt for action (loop until valid action)
             while True:
@@ -447,7 +449,7 @@ def start_workflow(
       gmail workflows continue <token> archive
     """
     try:
-        client = GmailClient()
+        client = _lazy("GmailClient")()
         state_manager = WorkflowStateManager()
 
         # Determine query and settings
@@ -468,7 +470,7 @@ def start_workflow(
                 message="Either workflow ID or --query is required",
                 progress={"total": 0, "processed": 0, "remaining": 0}
             )
-            console.print_json(data=response.model_dump(mode='json'))
+            emit_model_json(response)
             raise typer.Exit(code=1)
 
         # Execute search
@@ -481,7 +483,7 @@ def start_workflow(
                 progress={"total": 0, "processed": 0, "remaining": 0},
                 completed=True
             )
-            console.print_json(data=response.model_dump(mode='json'))
+            emit_model_json(response)
             return
 
         # Create workflow state
@@ -500,7 +502,7 @@ def start_workflow(
         response = WorkflowResponse(
             success=True,
             token=state.token,
-            email=first_email.model_dump(mode='json'),
+            email=first_email,
             message=f"Started workflow: {workflow_name}",
             progress={
                 "total": len(email_ids),
@@ -510,7 +512,7 @@ def start_workflow(
             }
         )
 
-        console.print_json(data=response.model_dump(mode='json'))
+        emit_model_json(response)
 
     except Exception as e:
         response = WorkflowResponse(
@@ -518,7 +520,7 @@ def start_workflow(
             message=f"Error starting workflow: {e}",
             progress={"total": 0, "processed": 0, "remaining": 0}
         )
-        console.print_json(data=response.model_dump(mode='json'))
+        emit_model_json(response)
         raise typer.Exit(code=1)
 
 
@@ -558,7 +560,7 @@ def continue_workflow(
       }
     """
     try:
-        client = GmailClient()
+        client = _lazy("GmailClient")()
         state_manager = WorkflowStateManager()
 
         # Load state
@@ -570,7 +572,7 @@ def continue_workflow(
                 message=str(e),
                 progress={"total": 0, "processed": 0, "remaining": 0}
             )
-            console.print_json(data=response.model_dump(mode='json'))
+            emit_model_json(response)
             raise typer.Exit(code=1)
 
         # Get current email
@@ -584,7 +586,7 @@ def continue_workflow(
             response = WorkflowResponse(
                 success=True,
                 token=state.token,  # Same token, no state change
-                email=current_email.model_dump(mode='json'),
+                email=current_email,
                 message="Email body returned",
                 progress={
                     "total": len(state.email_ids),
@@ -593,7 +595,7 @@ def continue_workflow(
                     "current": state.current_index + 1
                 }
             )
-            console.print_json(data=response.model_dump(mode='json'))
+            emit_model_json(response)
             return
 
         elif action == "reply":
@@ -609,7 +611,7 @@ def continue_workflow(
                         "current": state.current_index + 1
                     }
                 )
-                console.print_json(data=response.model_dump(mode='json'))
+                emit_model_json(response)
                 raise typer.Exit(code=1)
 
             # Send reply
@@ -654,7 +656,7 @@ def continue_workflow(
                 },
                 completed=True
             )
-            console.print_json(data=response.model_dump(mode='json'))
+            emit_model_json(response)
             return
 
         else:
@@ -669,7 +671,7 @@ def continue_workflow(
                     "current": state.current_index + 1
                 }
             )
-            console.print_json(data=response.model_dump(mode='json'))
+            emit_model_json(response)
             raise typer.Exit(code=1)
 
         # Check if workflow is complete
@@ -685,7 +687,7 @@ def continue_workflow(
                 },
                 completed=True
             )
-            console.print_json(data=response.model_dump(mode='json'))
+            emit_model_json(response)
             return
 
         # Save updated state
@@ -698,7 +700,7 @@ def continue_workflow(
         response = WorkflowResponse(
             success=True,
             token=state.token,
-            email=next_email.model_dump(mode='json'),
+            email=next_email,
             message=action_message,
             progress={
                 "total": len(state.email_ids),
@@ -708,7 +710,7 @@ def continue_workflow(
             }
         )
 
-        console.print_json(data=response.model_dump(mode='json'))
+        emit_model_json(response)
 
     except Exception as e:
         response = WorkflowResponse(
@@ -716,7 +718,7 @@ def continue_workflow(
             message=f"Error continuing workflow: {e}",
             progress={"total": 0, "processed": 0, "remaining": 0}
         )
-        console.print_json(data=response.model_dump(mode='json'))
+        emit_model_json(response)
         raise typer.Exit(code=1)
 
 
@@ -23,6 +23,8 @@ from .validators.runtime import validate_pydantic, validate_types
 # Constants for formatting
 SNIPPET_PREVIEW_LENGTH = 80
 MESSAGE_ID_DISPLAY_LENGTH = 12
+SEPARATOR = "=" * 60
+THREAD_RULE = "[dim]" + "─" * 60 + "[/dim]"
 
 
 class RichFormatter:
@@ -75,27 +77,28 @@ class RichFormatter:
             TypeError: If folders is not a list of Folder instances
 
         """
-        # Separate system and user folders
-        system = [f for f in folders if f.type == "system"]
-        user = [f for f in folders if f.type == "user"]
+        # Separate system and user folders in one pass
+        system: List[Folder] = []
+        user: List[Folder] = []
+        for f in folders:
+            if f.type == "system":
+                system.append(f)
+            elif f.type == "user":
+                user.append(f)
 
-        self.console.print("=" * 60)
-        self.console.print(f"{title} ({len(folders)})")
-        self.console.print("=" * 60)
+        lines = [SEPARATOR, f"{title} ({len(folders)})", SEPARATOR]
 
         if system:
-            self.console.print("\n[bold]📋 System Labels:[/bold]")
-            for folder in system:
-                self.console.print(self.format_folder(folder))
+            lines.append("\n[bold]📋 System Labels:[/bold]")
+            lines.extend(self.format_folder(folder) for folder in system)
 
         if user:
-            self.console.print("\n[bold]🏷️  Custom Labels:[/bold]")
-            for folder in user:
-                self.console.print(self.format_folder(folder))
+            lines.append("\n[bold]🏷️  Custom Labels:[/bold]")
+            lines.extend(self.format_folder(folder) for folder in user)
 
-        self.console.print(
-            f"\n[dim]Total: {len(system)} system, {len(user)} custom[/dim]"
-        )
+        lines.append(f"\n[dim]Total: {len(system)} system, {len(user)} custom[/dim]")
+
+        self.console.print("\n".join(lines))
 
     # ============ EMAIL FORMATTING ============
 
@@ -311,23 +314,25 @@ class RichFormatter:
             TypeError: If thread is not a list of EmailSummary instances
 
         """
-        self.console.print("=" * 60)
-        self.console.print(f"📧 Thread: {len(thread)} message(s)")
-        self.console.print(f"[dim]Starting from: {message_id[:MESSAGE_ID_DISPLAY_LENGTH]}...[/dim]")
-        self.console.print("=" * 60)
+        lines = [
+            SEPARATOR,
+            f"📧 Thread: {len(thread)} message(s)",
+            f"[dim]Starting from: {message_id[:MESSAGE_ID_DISPLAY_LENGTH]}...[/dim]",
+            SEPARATOR,
+        ]
 
         for i, email in enumerate(thread, 1):
             from_str = f"[cyan]{email.from_.email}[/cyan]"
 
-            self.console.print(f"\n[bold][{i}][/bold] From: {from_str}")
-            self.console.print(
-                f"[bold]Date:[/bold] {email.date.strftime('%Y-%m-%d %H:%M')}"
-            )
-            self.console.print(f"[bold]Subject:[/bold] {email.subject}")
-            self.console.print(f"[dim]Snippet:[/dim] {email.snippet[:100]}...")
+            lines.append(f"\n[bold][{i}][/bold] From: {from_str}")
+            lines.append(f"[bold]Date:[/bold] {email.date.strftime('%Y-%m-%d %H:%M')}")
+            lines.append(f"[bold]Subject:[/bold] {email.subject}")
+            lines.append(f"[dim]Snippet:[/dim] {email.snippet[:100]}...")
 
             if i < len(thread):
-                self.console.print("[dim]" + "─" * 60 + "[/dim]")
+                lines.append(THREAD_RULE)
+
+        self.console.print("\n".join(lines))
 
     # ============ SEND/REPLY RESULTS ============
 
@@ -385,9 +390,10 @@ class RichFormatter:
             ("SPAM", "🗑️  Spam", True),
         ]
 
-        # Build table rows
+        # Build table rows (index by name once rather than scanning per row)
+        folders_by_name = {f.name: f for f in folders}
         for folder_name, display_name, show_unread in FOLDER_DISPLAY_CONFIG:
-            folder = next((f for f in folders if f.name == folder_name), None)
+            folder = folders_by_name.get(folder_name)
             if folder:
                 total = folder.message_count or 0
                 unread = folder.unread_count or 0
@@ -5,17 +5,16 @@ import json
 import logging
 import os
 import re
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from email.utils import getaddresses
-from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union, overload
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Sequence, Tuple, Union, overload
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from .config import get_credentials_file, get_oauth_keys_file
+from .config import SECURE_FILE_MODE, get_credentials_file, get_oauth_keys_file
 from .models import (
     Attachment,
     EmailAddress,
@@ -27,6 +26,7 @@ from .models import (
     SendEmailResponse,
 )
 from .utils import (
+    DEFAULT_MAX_RESULTS,
     clean_snippet,
     create_mime_message,
     extract_body,
@@ -43,6 +43,29 @@ logger = logging.getLogger(__name__)
 MAX_LABEL_NAME_LENGTH = 100
 VALID_LABEL_CHARS_PATTERN = re.compile(r"^[\w\-. /]+$")
 MAX_QUERY_LENGTH = 1000
+# Null bytes and control characters (tab, newline and CR are allowed)
+QUERY_CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+VALID_LABEL_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+MAX_PAGE_SIZE = 50  # Largest page list_emails will request
+MAX_BATCH_SIZE = 100  # Gmail API limit on requests per batch
+# Refresh cached access tokens this long before they expire, so a command
+# never starts work with a token that lapses mid-way
+TOKEN_REFRESH_BUFFER = timedelta(minutes=5)
+
+
+def _time_until_refresh(
+    expiry: Optional[datetime], buffer: timedelta = TOKEN_REFRESH_BUFFER
+) -> timedelta:
+    """Time left before a token expiring at ``expiry`` is due for refresh.
+
+    A token is due once it is within ``buffer`` of expiring. A token without
+    a recorded expiry is treated as due now.
+    """
+    if expiry is None:
+        return timedelta(0)
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return expiry - buffer - now
 
 
 class GmailClient:
@@ -52,19 +75,25 @@ class GmailClient:
         self,
         credentials_file: Optional[str] = None,
         oauth_keys_file: Optional[str] = None,
+        force_refresh: bool = False,
+        refresh_buffer: timedelta = TOKEN_REFRESH_BUFFER,
     ) -> None:
         """Initialize Gmail client with OAuth2 credentials.
 
         Args:
             credentials_file: Path to saved OAuth2 credentials (default: ~/.gmaillm/credentials.json)
             oauth_keys_file: Path to OAuth2 client secrets (default: ~/.gmaillm/oauth-keys.json)
+            force_refresh: Refresh the access token even if the cached one is still valid
+            refresh_buffer: Refresh the cached token once it is this close to expiring
 
         """
         # Use config module defaults if not provided
         self.credentials_file = credentials_file or str(get_credentials_file())
         self.oauth_keys_file = oauth_keys_file or str(get_oauth_keys_file())
         self.service = None
-        self._authenticate()
+        self.credentials: Optional[Credentials] = None
+        self.refresh_buffer = refresh_buffer
+        self._authenticate(force_refresh=force_refresh)
 
     def _validate_file_exists_and_nonempty(self, file_path: str, file_type: str) -> None:
         """Validate file exists and is not empty.
@@ -162,53 +191,82 @@ class GmailClient:
         self._validate_file_exists_and_nonempty(self.credentials_file, "Credentials")
         return self._load_json_file(self.credentials_file, "Credentials")
 
-    def _refresh_credentials_if_needed(self, creds: Credentials) -> None:
-        """Refresh credentials if expired.
+    def _save_credentials(self, creds: Credentials) -> None:
+        """Atomically write credentials (including expiry) back to disk.
+
+        An flock on a sibling lock file serializes concurrent CLI invocations,
+        and the temp-file + os.replace() means readers never see a partial file.
+        The temp file is created with SECURE_FILE_MODE and removed on failure.
 
         Args:
             creds: Google OAuth2 credentials object
 
         Raises:
-            RuntimeError: If credential refresh fails
-
+            OSError: If the credentials file cannot be written
         """
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-
-                # Use file locking to prevent race conditions
-                lock_path = f"{self.credentials_file}.lock"
-                Path(lock_path).touch(exist_ok=True)
+        lock_path = f"{self.credentials_file}.lock"
+        tmp_path = f"{self.credentials_file}.tmp"
 
+        with open(lock_path, "w", encoding="utf-8") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, SECURE_FILE_MODE)
                 try:
-                    with open(lock_path, "w", encoding="utf-8") as lock_file:
-                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
-                        try:
-                            with open(self.credentials_file, "w", encoding="utf-8") as f:
-                                f.write(creds.to_json())
-                        finally:
-                            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-                finally:
-                    # Clean up lock file
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        # O_CREAT keeps the mode of a stale temp file
+                        os.fchmod(f.fileno(), SECURE_FILE_MODE)
+                        f.write(creds.to_json())
+                    os.replace(tmp_path, self.credentials_file)
+                except BaseException:
                     try:
-                        os.unlink(lock_path)
+                        os.unlink(tmp_path)
                     except OSError:
                         pass
+                    raise
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
-            except (OSError, PermissionError) as e:
-                raise RuntimeError(
-                    f"Failed to save refreshed credentials: {e}\n"
-                    f"Check file permissions for {self.credentials_file}"
-                )
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to refresh credentials: {e}\n"
-                    f"You may need to re-authenticate with Gmail MCP."
-                )
+    def _refresh_credentials_if_needed(self, creds: Credentials, force: bool = False) -> None:
+        """Refresh credentials if expired and persist the new token.
+
+        A cached token with more than ``self.refresh_buffer`` left is reused
+        as-is, so most invocations skip the network round-trip. Credentials
+        saved without an expiry (older setup-auth runs) are refreshed once so
+        the expiry gets recorded.
+
+        Args:
+            creds: Google OAuth2 credentials object
+            force: Refresh even if the cached token is still valid
+
+        Raises:
+            RuntimeError: If credential refresh fails
+
+        """
+        if not creds or not creds.refresh_token:
+            return
+        if not force and _time_until_refresh(creds.expiry, self.refresh_buffer) > timedelta(0):
+            return
+
+        try:
+            creds.refresh(Request())
+            self._save_credentials(creds)
+        except (OSError, PermissionError) as e:
+            raise RuntimeError(
+                f"Failed to save refreshed credentials: {e}\n"
+                f"Check file permissions for {self.credentials_file}"
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to refresh credentials: {e}\n"
+                f"You may need to re-authenticate with Gmail MCP."
+            )
 
-    def _authenticate(self) -> None:
+    def _authenticate(self, force_refresh: bool = False) -> None:
         """Authenticate with Gmail API using existing credentials.
 
+        Args:
+            force_refresh: Refresh the access token even if it is still valid
+
         Raises:
             RuntimeError: If authentication fails
             KeyError: If required OAuth fields are missing
@@ -236,10 +294,47 @@ class GmailClient:
         creds = Credentials.from_authorized_user_info(creds_data)
 
         # Refresh if needed
-        self._refresh_credentials_if_needed(creds)
+        self._refresh_credentials_if_needed(creds, force=force_refresh)
+        self.credentials = creds
+
+        # Build service. The discovery document ships with the client library,
+        # so skip the discovery-cache probe (it only logs a file_cache notice)
+        self.service = build("gmail", "v1", credentials=creds, cache_discovery=False)
+
+    def refresh_credentials(self) -> None:
+        """Refresh the access token if it is within ``self.refresh_buffer`` of expiry.
+
+        Raises:
+            RuntimeError: If credential refresh fails
+        """
+        if self.credentials:
+            self._refresh_credentials_if_needed(self.credentials)
+
+    def seconds_until_refresh(self) -> float:
+        """Seconds until the cached access token is due for refresh.
+
+        Returns:
+            Seconds before the token enters ``self.refresh_buffer`` (0 if already due)
+        """
+        expiry = self.credentials.expiry if self.credentials else None
+        return max(0.0, _time_until_refresh(expiry, self.refresh_buffer).total_seconds())
+
+    def _execute_batched(
+        self,
+        requests: List[Tuple[Any, Dict[str, Any]]],
+        callback: Optional[Callable[[str, Any, Exception], None]] = None,
+    ) -> None:
+        """Execute API requests as batch calls of at most MAX_BATCH_SIZE each.
 
-        # Build service
-        self.service = build("gmail", "v1", credentials=creds)
+        Args:
+            requests: (request, batch.add() keyword arguments) pairs
+            callback: Default callback for requests added without one
+        """
+        for start in range(0, len(requests), MAX_BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for request, add_kwargs in requests[start:start + MAX_BATCH_SIZE]:
+                batch.add(request, **add_kwargs)
+            batch.execute()
 
     def _parse_message_to_summary(self, msg_data: Dict[str, Any]) -> EmailSummary:
         """Parse Gmail API message into EmailSummary.
@@ -486,14 +581,8 @@ class GmailClient:
             raise ValueError(f"Query too long: {len(query)} chars (max {MAX_QUERY_LENGTH})")
 
         # Check for suspicious characters that could indicate injection attempts
-        suspicious_patterns = [
-            r"\x00",  # null bytes
-            r"[\x01-\x08\x0b\x0c\x0e-\x1f]",  # control characters
-        ]
-
-        for pattern in suspicious_patterns:
-            if re.search(pattern, query):
-                raise ValueError("Query contains invalid control characters")
+        if QUERY_CONTROL_CHARS_PATTERN.search(query):
+            raise ValueError("Query contains invalid control characters")
 
     def _validate_label_name(self, name: str) -> None:
         """Validate label name for Gmail API requirements.
@@ -538,7 +627,7 @@ class GmailClient:
                 raise ValueError(f"Invalid label ID: {label_id}")
 
             # Label IDs should be alphanumeric or Gmail system labels (all caps)
-            if not re.match(r"^[A-Za-z0-9_-]+$", label_id):
+            if not VALID_LABEL_ID_PATTERN.match(label_id):
                 raise ValueError(f"Label ID contains invalid characters: {label_id}")
 
     def list_emails(
@@ -649,6 +738,47 @@ class GmailClient:
         except HttpError as e:
             raise RuntimeError(f"Failed to list emails: {e}")
 
+    def iter_emails(
+        self,
+        folder: str = "INBOX",
+        max_results: int = 10,
+        query: Optional[str] = None,
+    ) -> Iterator[EmailSummary]:
+        """Yield email summaries page by page, following page tokens.
+
+        Unlike list_emails, max_results is the total number of emails to
+        yield and may exceed the per-page limit. Only one page is held in
+        memory at a time.
+
+        Args:
+            folder: Gmail label/folder (default: INBOX)
+            max_results: Total number of emails to yield (default: 10)
+            query: Gmail search query (optional)
+
+        Yields:
+            EmailSummary for each email, newest first
+
+        Raises:
+            ValueError: If query is invalid
+            RuntimeError: If API request fails
+
+        """
+        remaining = max_results if max_results >= 1 else DEFAULT_MAX_RESULTS
+        page_token: Optional[str] = None
+
+        while remaining > 0:
+            page = self.list_emails(
+                folder=folder,
+                max_results=min(remaining, MAX_PAGE_SIZE),
+                page_token=page_token,
+                query=query,
+            )
+            yield from page.emails[:remaining]
+            remaining -= len(page.emails)
+            page_token = page.next_page_token
+            if not page_token or not page.emails:
+                break
+
     @overload
     def read_email(
         self,
@@ -711,6 +841,42 @@ class GmailClient:
         except HttpError as e:
             raise RuntimeError(f"Failed to read email {message_id}: {e}")
 
+    def read_email_headers(
+        self,
+        message_id: str,
+        headers: Sequence[str] = ("From", "To", "Cc", "Subject"),
+    ) -> Dict[str, Optional[str]]:
+        """Read selected headers of an email without fetching its body.
+
+        Args:
+            message_id: Gmail message ID
+            headers: Header names to fetch
+
+        Returns:
+            Dictionary mapping each requested header name to its value (None if absent)
+
+        Raises:
+            RuntimeError: If API request fails
+
+        """
+        try:
+            msg_data = (
+                self.service.users()
+                .messages()
+                .get(
+                    userId="me",
+                    id=message_id,
+                    format="metadata",
+                    metadataHeaders=list(headers),
+                )
+                .execute()
+            )
+        except HttpError as e:
+            raise RuntimeError(f"Failed to read email {message_id}: {e}")
+
+        msg_headers = msg_data.get("payload", {}).get("headers", [])
+        return {name: get_header(msg_headers, name) for name in headers}
+
     def search_emails(
         self,
         query: str,
@@ -741,6 +907,17 @@ class GmailClient:
             query=query,
         )
 
+    @staticmethod
+    def _folder_from_label(label: Dict[str, Any]) -> Folder:
+        """Build a Folder from a Gmail API label resource."""
+        return Folder(
+            id=label["id"],
+            name=label["name"],
+            type=label["type"].lower(),
+            message_count=label.get("messagesTotal"),
+            unread_count=label.get("messagesUnread"),
+        )
+
     def get_folders(self) -> List[Folder]:
         """Get list of all Gmail labels/folders.
 
@@ -762,10 +939,9 @@ class GmailClient:
                 # No labels to fetch
                 pass
             else:
-                # Use batch request to fetch all label details at once
+                # Use batch requests to fetch all label details
                 # Note: labels.list() does NOT return messagesTotal/messagesUnread
                 # We need to call labels.get() for each label to get counts
-                batch = self.service.new_batch_http_request()
 
                 # Track results
                 batch_results: Dict[str, Any] = {}
@@ -787,30 +963,22 @@ class GmailClient:
                             batch_results[label_id] = response
                     return callback
 
-                # Add all label fetch requests to batch
-                for label in labels:
-                    label_id = label["id"]
-                    batch.add(
-                        self.service.users().labels().get(userId="me", id=label_id),
-                        callback=make_callback(label_id, label.get("name", "unknown"), label.get("type", "user")),
+                # Fetch every label, split into as few batches as the API allows
+                self._execute_batched([
+                    (
+                        self.service.users().labels().get(userId="me", id=label["id"]),
+                        {"callback": make_callback(
+                            label["id"], label.get("name", "unknown"), label.get("type", "user")
+                        )},
                     )
-
-                # Execute all requests in one batch
-                batch.execute()
+                    for label in labels
+                ])
 
                 # Parse results in original order
                 for label in labels:
                     label_id = label["id"]
                     if label_id in batch_results:
-                        full_label = batch_results[label_id]
-                        folder = Folder(
-                            id=full_label["id"],
-                            name=full_label["name"],
-                            type=full_label["type"].lower(),
-                            message_count=full_label.get("messagesTotal"),
-                            unread_count=full_label.get("messagesUnread"),
-                        )
-                        folders.append(folder)
+                        folders.append(self._folder_from_label(batch_results[label_id]))
 
             return folders
 
@@ -900,6 +1068,105 @@ class GmailClient:
 
         return results
 
+    def get_status(self) -> Dict[str, Any]:
+        """Get account status in two batched round-trips.
+
+        The first batch fetches the profile, the label list and the newest
+        INBOX message ID; the second fetches label counts and that message's
+        metadata (split further if there are more than MAX_BATCH_SIZE labels).
+
+        Returns:
+            Dictionary with account status:
+            {
+                'auth': bool,
+                'email_address': str,
+                'inbox_accessible': bool,
+                'folders': List[Folder],
+                'recent_email': Optional[EmailSummary],
+                'errors': List[str]
+            }
+
+        """
+        results: Dict[str, Any] = {
+            "auth": False,
+            "email_address": None,
+            "inbox_accessible": False,
+            "folders": [],
+            "recent_email": None,
+            "errors": [],
+        }
+        users = self.service.users()
+
+        try:
+            overview: Dict[str, Any] = {}
+
+            def collect_overview(request_id: str, response: Any, exception: Exception) -> None:
+                if exception:
+                    results["errors"].append(f"Gmail API error: {exception}")
+                else:
+                    overview[request_id] = response
+
+            batch = self.service.new_batch_http_request(callback=collect_overview)
+            batch.add(users.getProfile(userId="me"), request_id="profile")
+            batch.add(users.labels().list(userId="me"), request_id="labels")
+            batch.add(
+                users.messages().list(userId="me", q="label:INBOX", maxResults=1),
+                request_id="inbox",
+            )
+            batch.execute()
+
+            if "profile" in overview:
+                results["auth"] = True
+                results["email_address"] = overview["profile"].get("emailAddress")
+            results["inbox_accessible"] = "inbox" in overview
+
+            labels = overview.get("labels", {}).get("labels", [])
+            inbox_messages = overview.get("inbox", {}).get("messages", [])
+            if not labels and not inbox_messages:
+                return results
+
+            details: Dict[str, Any] = {}
+
+            def collect_details(request_id: str, response: Any, exception: Exception) -> None:
+                if exception:
+                    logger.warning(f"Failed to fetch {request_id}: {exception}")
+                else:
+                    details[request_id] = response
+
+            requests = [
+                (users.labels().get(userId="me", id=label["id"]), {"request_id": f"label:{label['id']}"})
+                for label in labels
+            ]
+            if inbox_messages:
+                requests.append((
+                    users.messages().get(
+                        userId="me",
+                        id=inbox_messages[0]["id"],
+                        format="metadata",
+                        metadataHeaders=["From", "To", "Cc", "Subject", "Date"],
+                    ),
+                    {"request_id": "recent"},
+                ))
+            # More than MAX_BATCH_SIZE labels needs more than one batch call
+            self._execute_batched(requests, callback=collect_details)
+
+            # Fall back to the list entry (no counts) if a label fetch failed
+            results["folders"] = [
+                self._folder_from_label(details.get(f"label:{label['id']}", label))
+                for label in labels
+            ]
+            if "recent" in details:
+                results["recent_email"] = self._parse_message_to_summary(details["recent"])
+
+        except HttpError as e:
+            results["errors"].append(f"Gmail API error: {str(e)}")
+        except (OSError, PermissionError) as e:
+            results["errors"].append(f"File access error: {str(e)}")
+        except Exception as e:
+            results["errors"].append(f"Unexpected error: {str(e)}")
+
+        return results
+
     def get_thread(self, message_id: str) -> List[EmailSummary]:
         """Get all emails in a thread.
 
@@ -6,14 +6,7 @@ Organized into three layers:
 - cli: CLI-specific utilities (UI, interaction, validation)
 """
 
-# Convenience re-exports of commonly used helpers
-from gmaillm.helpers.cli import (
-    HelpfulGroup,
-    confirm_or_force,
-    print_success,
-    show_operation_preview,
-)
-from gmaillm.helpers.domain import expand_email_groups, load_email_groups
+from gmaillm.helpers.core.lazy import lazy_importer
 
 __all__ = [
     # Most commonly used helpers (for backward compatibility)
@@ -24,3 +17,12 @@ __all__ = [
     "load_email_groups",
     "expand_email_groups",
 ]
+
+__getattr__ = lazy_importer(globals(), {
+    "show_operation_preview": "gmaillm.helpers.cli",
+    "print_success": "gmaillm.helpers.cli",
+    "confirm_or_force": "gmaillm.helpers.cli",
+    "HelpfulGroup": "gmaillm.helpers.cli",
+    "load_email_groups": "gmaillm.helpers.domain",
+    "expand_email_groups": "gmaillm.helpers.domain",
+})
@@ -1,6 +1,6 @@
 """CLI-specific utilities for gmaillm."""
 
-from gmaillm.helpers.cli.errors import handle_command_error
+from gmaillm.helpers.cli.errors import command_errors, handle_command_error
 from gmaillm.helpers.cli.interaction import (
     confirm_or_force,
     create_backup_with_message,
@@ -8,10 +8,19 @@ from gmaillm.helpers.cli.interaction import (
 )
 from gmaillm.helpers.cli.typer_extras import (
     HelpfulGroup,
+    LazyTyperGroup,
     OutputFormat,
     parse_output_format,
 )
-from gmaillm.helpers.cli.ui import print_success, show_operation_preview, output_json_or_rich
+from gmaillm.helpers.cli.ui import (
+    emit_json,
+    emit_model_json,
+    emit_ndjson,
+    get_formatter,
+    output_json_or_rich,
+    print_success,
+    show_operation_preview,
+)
 from gmaillm.helpers.cli.validation import display_schema_and_exit, load_and_validate_json
 
 __all__ = [
@@ -19,17 +28,23 @@ __all__ = [
     "show_operation_preview",
     "print_success",
     "output_json_or_rich",
+    "emit_json",
+    "emit_model_json",
+    "emit_ndjson",
+    "get_formatter",
     # Interaction
     "confirm_or_force",
     "ensure_item_exists",
     "create_backup_with_message",
     # Error handling
     "handle_command_error",
+    "command_errors",
     # Validation
     "load_and_validate_json",
     "display_schema_and_exit",
     # Typer extras
     "HelpfulGroup",
+    "LazyTyperGroup",
     "OutputFormat",
     "parse_output_format",
 ]
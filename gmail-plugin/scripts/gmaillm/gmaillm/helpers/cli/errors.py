@@ -1,10 +1,17 @@
 """Error handling utilities for CLI commands."""
 
+import functools
+import os
+from typing import Any, Callable, TypeVar
+
+import click
 import typer
 from rich.console import Console
 
 console = Console()
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 def handle_command_error(
     operation: str,
@@ -26,3 +33,35 @@ def handle_command_error(
     """
     console.print(f"[red]✗ Error {operation}: {exception}[/red]")
     raise typer.Exit(code=exit_code)
+
+
+def command_errors(operation: str) -> Callable[[F], F]:
+    """Decorator that reports a command's unexpected errors via handle_command_error.
+
+    Click exits and aborts (e.g. ``raise typer.Exit(code=1)`` after a usage
+    message) pass through unchanged. Set ``GMAIL_DEBUG`` to also print the
+    traceback.
+
+    Args:
+        operation: Description of the operation (e.g., "listing emails")
+
+    Example:
+        @app.command()
+        @command_errors("listing emails")
+        def list(...):
+            ...
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except (click.exceptions.Exit, click.exceptions.Abort, click.ClickException):
+                raise
+            except Exception as e:
+                if os.environ.get("GMAIL_DEBUG"):
+                    console.print_exception()
+                handle_command_error(operation, e)
+
+        return wrapper  # type: ignore[return-value]
+    return decorator
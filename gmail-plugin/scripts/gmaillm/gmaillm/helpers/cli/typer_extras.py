@@ -1,11 +1,16 @@
 """Typer customizations and utilities for CLI."""
 
+import functools
+import importlib
+import inspect
 import sys
 from enum import Enum
+from typing import Dict, List, Optional
 
 import click
 import typer
 from rich.console import Console
+from typer.models import TyperInfo
 
 
 class OutputFormat(str, Enum):
@@ -34,6 +39,12 @@ def parse_output_format(format_str: str, console: Console) -> OutputFormat:
         raise typer.Exit(code=1)
 
 
+@functools.lru_cache(maxsize=None)
+def _group_from_info_params() -> frozenset:
+    """Keyword names accepted by this Typer's ``get_group_from_info``."""
+    return frozenset(inspect.signature(typer.main.get_group_from_info).parameters)
+
+
 class HelpfulGroup(typer.core.TyperGroup):
     """Typer group that shows help when no subcommand is provided.
 
@@ -58,3 +69,64 @@ class HelpfulGroup(typer.core.TyperGroup):
             click.echo(ctx.get_help(), file=sys.stderr)
             ctx.exit(0)
         return super().invoke(ctx)
+
+
+class LazyTyperGroup(HelpfulGroup):
+    """HelpfulGroup whose sub-apps are imported only when they are used.
+
+    Subclasses map command names to modules exposing a Typer ``app``. A module
+    is imported the first time its command is looked up, so running one
+    command doesn't pay the import cost of every other command module.
+
+    Listing a sub-app in the parent's help only needs its one-line help, so
+    names with an entry in ``lazy_subcommand_help`` are shown from that text
+    without importing their module.
+
+    Example:
+        class RootGroup(LazyTyperGroup):
+            lazy_subcommands = {"labels": "gmaillm.commands.labels"}
+            lazy_subcommand_help = {"labels": "Manage Gmail labels"}
+
+        app = typer.Typer(cls=RootGroup)
+    """
+
+    lazy_subcommands: Dict[str, str] = {}
+    lazy_subcommand_help: Dict[str, str] = {}
+    _formatting_help = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager commands first, then lazy sub-apps in declaration order."""
+        eager = [name for name in super().list_commands(ctx) if name not in self.lazy_subcommands]
+        return eager + list(self.lazy_subcommands)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Format help, listing lazy sub-apps without importing them."""
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Import and register a lazy sub-app on first lookup."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            if self._formatting_help and cmd_name in self.lazy_subcommand_help:
+                # Stand-in carrying just what the commands panel displays
+                return click.Command(cmd_name, help=self.lazy_subcommand_help[cmd_name])
+            module = importlib.import_module(self.lazy_subcommands[cmd_name])
+            sub_app = module.app
+            # Build the group the way app.add_typer() would, inheriting the
+            # parent's markup mode. get_group_from_info is Typer-internal and
+            # its keywords vary across releases, so pass only those it takes.
+            options = {
+                "pretty_exceptions_short": getattr(sub_app, "pretty_exceptions_short", True),
+                "rich_markup_mode": self.rich_markup_mode,
+                "suggest_commands": getattr(sub_app, "suggest_commands", True),
+            }
+            accepted = _group_from_info_params()
+            group = typer.main.get_group_from_info(
+                TyperInfo(sub_app, name=cmd_name),
+                **{k: v for k, v in options.items() if k in accepted},
+            )
+            self.add_command(group)
+        return super().get_command(ctx, cmd_name)
@@ -1,14 +1,31 @@
 """User interface helpers for CLI commands."""
 
-from typing import Any, Callable, Dict, List, Optional
+import functools
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 from rich.console import Console
 
 from gmaillm.helpers.cli.typer_extras import OutputFormat
 
+if TYPE_CHECKING:
+    from gmaillm.formatters import RichFormatter
+
 console = Console()
 
 
+@functools.lru_cache(maxsize=None)
+def get_formatter(console: Console) -> "RichFormatter":
+    """Return the RichFormatter for ``console``, importing formatters on first use.
+
+    Args:
+        console: Console the formatter prints to (one formatter per console)
+    """
+    from gmaillm.formatters import RichFormatter
+
+    return RichFormatter(console)
+
+
 def show_operation_preview(
     title: str,
     details: Dict[str, Any],
@@ -31,19 +48,18 @@ def show_operation_preview(
             }
         )
     """
-    console.print("=" * width)
-    console.print(title)
-    console.print("=" * width)
+    separator = "=" * width
+    lines = [separator, title, separator]
 
     for key, value in details.items():
         if isinstance(value, list):
-            console.print(f"{key}: {len(value)}")
-            for item in value:
-                console.print(f"  - {item}")
+            lines.append(f"{key}: {len(value)}")
+            lines.extend(f"  - {item}" for item in value)
         else:
-            console.print(f"{key}: {value}")
+            lines.append(f"{key}: {value}")
 
-    console.print("=" * width)
+    lines.append(separator)
+    console.print("\n".join(lines))
 
 
 def print_success(
@@ -77,6 +93,60 @@ def print_success(
             console.print(f"  [cyan]{step}[/cyan]")
 
 
+def emit_json(data: Any) -> None:
+    """Print data as JSON.
+
+    On a terminal this uses Rich's highlighted output. When stdout is piped
+    (the usual case for --output-format json) the JSON is encoded by
+    pydantic-core's native serializer and written directly, skipping Rich's
+    tokenizing and styling.
+
+    Args:
+        data: JSON-serializable data (non-serializable values fall back to str)
+    """
+    if console.is_terminal:
+        console.print_json(data=data, default=str)
+    else:
+        from pydantic_core import to_json  # keeps `gmail --help` from loading it
+
+        sys.stdout.write(to_json(data, indent=2, fallback=str).decode())
+        sys.stdout.write("\n")
+
+
+def emit_model_json(value: Any) -> None:
+    """Print pydantic models (or lists/dicts of them) as JSON.
+
+    Serializes straight to a JSON string with pydantic-core instead of
+    building a ``model_dump(mode='json')`` dict and encoding it again.
+
+    Args:
+        value: A model, or a list/dict containing models
+    """
+    from pydantic_core import to_json
+
+    text = to_json(value, indent=2, by_alias=False).decode()
+    if console.is_terminal:
+        console.print_json(text)
+    else:
+        sys.stdout.write(text)
+        sys.stdout.write("\n")
+
+
+def emit_ndjson(models: Iterable[Any]) -> None:
+    """Stream pydantic models as newline-delimited JSON, one per line.
+
+    Each line is flushed as soon as its model arrives, so consumers can
+    start reading before the whole result set has been fetched.
+
+    Args:
+        models: Iterable of pydantic models (e.g. a generator)
+    """
+    for model in models:
+        sys.stdout.write(model.model_dump_json())
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
 def output_json_or_rich(
     format_enum: OutputFormat,
     json_data: Any,
@@ -86,17 +156,17 @@ def output_json_or_rich(
 
     Args:
         format_enum: The output format (OutputFormat.JSON or OutputFormat.RICH)
-        json_data: Data to output as JSON (will be passed to console.print_json)
+        json_data: Data to output as JSON (will be passed to emit_json)
         rich_func: Function to call for Rich output (should take no arguments)
 
     Example:
         output_json_or_rich(
             format_enum,
-            json_data=[f.model_dump(mode='json') for f in folders],
-            rich_func=lambda: formatter.print_folder_list(folders, "Gmail Labels")
+            json_data=groups_list,
+            rich_func=print_rich
         )
     """
     if format_enum == OutputFormat.JSON:
-        console.print_json(data=json_data)
+        emit_json(json_data)
     else:
         rich_func()
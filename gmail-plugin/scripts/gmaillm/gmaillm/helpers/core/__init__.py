@@ -1,19 +1,15 @@
 """Core infrastructure for gmaillm helpers."""
 
-from gmaillm.helpers.core.io import create_backup, load_json_config, save_json_config
-from gmaillm.helpers.core.paths import (
-    get_groups_dir,
-    get_groups_file_path,
-    get_plugin_config_dir,
-    get_style_file_path,
-    get_styles_dir,
-)
+from gmaillm.helpers.core.lazy import lazy_importer
 
 __all__ = [
     # I/O operations
     "load_json_config",
     "save_json_config",
     "create_backup",
+    "move_to_backup",
+    # Deferred imports
+    "lazy_importer",
     # Path management
     "get_plugin_config_dir",
     "get_groups_dir",
@@ -21,3 +17,15 @@ __all__ = [
     "get_styles_dir",
     "get_style_file_path",
 ]
+
+__getattr__ = lazy_importer(globals(), {
+    "load_json_config": "gmaillm.helpers.core.io",
+    "save_json_config": "gmaillm.helpers.core.io",
+    "create_backup": "gmaillm.helpers.core.io",
+    "move_to_backup": "gmaillm.helpers.core.io",
+    "get_plugin_config_dir": "gmaillm.helpers.core.paths",
+    "get_groups_dir": "gmaillm.helpers.core.paths",
+    "get_groups_file_path": "gmaillm.helpers.core.paths",
+    "get_styles_dir": "gmaillm.helpers.core.paths",
+    "get_style_file_path": "gmaillm.helpers.core.paths",
+})
@@ -1,6 +1,8 @@
 """Generic file I/O operations for gmaillm."""
 
 import json
+import os
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
@@ -54,7 +56,29 @@ def create_backup(file_path: Path) -> Path:
     Returns:
         Path to backup file
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = file_path.parent / f"{file_path.stem}.backup.{timestamp}{file_path.suffix}"
-    backup_path.write_text(file_path.read_text())
+    backup_path = _backup_path(file_path)
+    shutil.copyfile(file_path, backup_path)
+    return backup_path
+
+
+def move_to_backup(file_path: Path) -> Path:
+    """Move a file aside to a timestamped backup instead of copying it.
+
+    The backup lives next to the original, so this is a rename rather than
+    a byte copy. Use it when the original is about to be deleted anyway.
+
+    Args:
+        file_path: Path to file to move
+
+    Returns:
+        Path to backup file
+    """
+    backup_path = _backup_path(file_path)
+    os.replace(file_path, backup_path)
     return backup_path
+
+
+def _backup_path(file_path: Path) -> Path:
+    """Timestamped backup path alongside the original file."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return file_path.parent / f"{file_path.stem}.backup.{timestamp}{file_path.suffix}"
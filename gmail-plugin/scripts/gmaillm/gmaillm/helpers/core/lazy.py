@@ -0,0 +1,53 @@
+"""Deferred imports for packages and command modules.
+
+The Google API client, pydantic models and the Rich formatter stack take
+most of the CLI's start-up time, yet ``gmail --help``, completion and
+argument errors never use them. Modules that need them list the names in
+a table passed to :func:`lazy_importer` (or, for the formatter, call
+``gmaillm.helpers.cli.get_formatter``) so they are imported on first use.
+Package ``__init__`` modules use the same hook for their re-exports, so
+importing one submodule doesn't load its siblings.
+
+This module must stay free of third-party imports: every package
+``__init__`` imports it.
+"""
+
+import importlib
+from typing import Any, Callable, Dict
+
+
+def lazy_importer(module_globals: Dict[str, Any], imports: Dict[str, str]) -> Callable[[str], Any]:
+    """Build a resolver that imports module-level names on first use.
+
+    Assign the result to the module's ``__getattr__`` (PEP 562) so the names
+    are importable and patchable from outside, and call it directly from
+    inside the module, where a missing global doesn't reach ``__getattr__``.
+    Resolved values are cached in the module's globals, so patching e.g.
+    ``gmaillm.cli.GmailClient`` from tests is seen by later lookups.
+
+    Args:
+        module_globals: The calling module's ``globals()``
+        imports: Mapping of attribute name to the module that defines it
+
+    Returns:
+        Function mapping a name to its (possibly patched) value
+
+    Example:
+        __getattr__ = _lazy = lazy_importer(globals(), {"GmailClient": "gmaillm.gmail_client"})
+        client = _lazy("GmailClient")()
+    """
+    def resolve(name: str) -> Any:
+        try:
+            return module_globals[name]
+        except KeyError:
+            pass
+        module_name = imports.get(name)
+        if module_name is None:
+            raise AttributeError(
+                f"module {module_globals['__name__']!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(module_name), name)
+        module_globals[name] = value
+        return value
+
+    return resolve
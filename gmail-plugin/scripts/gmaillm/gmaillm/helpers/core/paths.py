@@ -1,8 +1,19 @@
 """Path and directory management for gmaillm configuration."""
 
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a config directory once per process and return it.
+
+    Later calls for the same path skip the mkdir syscall entirely.
+    """
+    path.mkdir(parents=True, exist_ok=True, mode=0o755)
+    return path
+
+
 def get_plugin_config_dir() -> Path:
     """Get the plugin config directory path.
 
@@ -11,9 +22,7 @@ def get_plugin_config_dir() -> Path:
     Returns:
         Path to config directory (~/.gmaillm/)
     """
-    config_dir = Path.home() / ".gmaillm"
-    config_dir.mkdir(parents=True, exist_ok=True, mode=0o755)
-    return config_dir
+    return _ensure_dir(Path.home() / ".gmaillm")
 
 
 def get_groups_dir() -> Path:
@@ -22,10 +31,7 @@ def get_groups_dir() -> Path:
     Returns:
         Path to email groups directory
     """
-    config_dir = get_plugin_config_dir()
-    groups_dir = config_dir / "email-groups"
-    groups_dir.mkdir(parents=True, exist_ok=True, mode=0o755)
-    return groups_dir
+    return _ensure_dir(get_plugin_config_dir() / "email-groups")
 
 
 def get_groups_file_path() -> Path:
@@ -44,10 +50,7 @@ def get_styles_dir() -> Path:
     Returns:
         Path to email styles directory
     """
-    config_dir = get_plugin_config_dir()
-    styles_dir = config_dir / "email-styles"
-    styles_dir.mkdir(parents=True, exist_ok=True, mode=0o755)
-    return styles_dir
+    return _ensure_dir(get_plugin_config_dir() / "email-styles")
 
 
 def get_style_file_path(name: str) -> Path:
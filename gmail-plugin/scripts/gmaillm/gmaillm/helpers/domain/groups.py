@@ -1,7 +1,9 @@
 """Email group business logic for gmaillm."""
 
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 from rich.console import Console
 
@@ -29,22 +31,54 @@ def normalize_group_name(name: str) -> str:
     return name.lstrip('#')
 
 
+@functools.lru_cache(maxsize=8)
+def _load_groups_cached(
+    groups_file: Path, mtime_ns: int, size: int
+) -> Mapping[str, Tuple[str, ...]]:
+    """Parse a groups file, memoized on (path, mtime, size).
+
+    Returned read-only so the cached value can't be mutated by callers.
+    Member lists are frozen as tuples; malformed values (null, numbers,
+    strings) are kept as-is so ``groups validate`` can report them.
+    """
+    groups = load_json_config(groups_file)
+    # Filter out metadata/comment keys
+    return MappingProxyType({
+        k: tuple(v) if isinstance(v, list) else v
+        for k, v in groups.items() if not k.startswith("_")
+    })
+
+
+def _cached_email_groups(groups_file: Optional[Path] = None) -> Mapping[str, Sequence[str]]:
+    """Return the cached, read-only groups mapping for a groups file."""
+    if groups_file is None:
+        groups_dir = get_groups_dir()
+        groups_file = groups_dir / "groups.json"
+
+    try:
+        stat = groups_file.stat()
+    except OSError:
+        return MappingProxyType({})
+
+    return _load_groups_cached(groups_file, stat.st_mtime_ns, stat.st_size)
+
+
 def load_email_groups(groups_file: Optional[Path] = None) -> Dict[str, List[str]]:
     """Load email distribution groups from config.
 
+    The parsed file is cached until its mtime or size changes, so repeated
+    calls (e.g. expanding to/cc/bcc) only read the file once.
+
     Args:
         groups_file: Optional path to groups file (for testing)
 
     Returns:
         Dictionary mapping group names to email lists
     """
-    if groups_file is None:
-        groups_dir = get_groups_dir()
-        groups_file = groups_dir / "groups.json"
-
-    groups = load_json_config(groups_file)
-    # Filter out metadata/comment keys
-    return {k: v for k, v in groups.items() if not k.startswith("_")}
+    return {
+        k: list(v) if isinstance(v, tuple) else v
+        for k, v in _cached_email_groups(groups_file).items()
+    }
 
 
 def save_email_groups(groups: Dict[str, List[str]], groups_file: Optional[Path] = None) -> None:
@@ -59,9 +93,12 @@ def save_email_groups(groups: Dict[str, List[str]], groups_file: Optional[Path]
         groups_file = groups_dir / "groups.json"
 
     save_json_config(groups_file, groups)
+    _load_groups_cached.cache_clear()
 
 
-def expand_email_groups(recipients: List[str], groups: Optional[Dict[str, List[str]]] = None) -> List[str]:
+def expand_email_groups(
+    recipients: List[str], groups: Optional[Mapping[str, Sequence[str]]] = None
+) -> List[str]:
     """Expand #groupname references to actual email addresses.
 
     Args:
@@ -71,32 +108,32 @@ def expand_email_groups(recipients: List[str], groups: Optional[Dict[str, List[s
     Returns:
         Expanded list with all #group references resolved (duplicates removed)
     """
+    if not any(recipient.startswith("#") for recipient in recipients):
+        # Plain addresses only: don't touch the groups file at all
+        return list(dict.fromkeys(recipients))
+
     if groups is None:
-        groups = load_email_groups()
+        # Read-only view of the cache; no per-call copy of every group
+        groups = _cached_email_groups()
+
+    # Warn about unknown groups up front so the expansion itself is a flat loop
+    unknown = [
+        recipient for recipient in dict.fromkeys(recipients)
+        if recipient.startswith("#") and recipient[1:] not in groups
+    ]
+    if unknown:
+        available = ", ".join("#" + k for k in groups.keys())
+        for recipient in unknown:
+            console.print(
+                f"[yellow]Warning: Unknown group '{recipient}', available: {available}[/yellow]"
+            )
 
     expanded = []
-    seen = set()
-
     for recipient in recipients:
         if recipient.startswith("#"):
-            # This is a group reference
-            group_name = recipient[1:]  # Remove # prefix
-            if group_name in groups:
-                for email in groups[group_name]:
-                    if email not in seen:
-                        expanded.append(email)
-                        seen.add(email)
-            else:
-                available = ", ".join("#" + k for k in groups.keys())
-                console.print(
-                    f"[yellow]Warning: Unknown group '#{group_name}', available: {available}[/yellow]"
-                )
-                if recipient not in seen:
-                    expanded.append(recipient)  # Keep as-is if group not found
-                    seen.add(recipient)
+            # Unknown groups are kept as-is
+            expanded.extend(groups.get(recipient[1:], (recipient,)))
         else:
-            if recipient not in seen:
-                expanded.append(recipient)
-                seen.add(recipient)
+            expanded.append(recipient)
 
-    return expanded
+    return list(dict.fromkeys(expanded))
@@ -1,15 +1,20 @@
 """Email style business logic for gmaillm."""
 
-import yaml
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from rich.console import Console
 
 from gmaillm.helpers.core.paths import get_styles_dir
+from gmaillm.validators.styles import parse_style_frontmatter
 
 console = Console()
 
+# Frontmatter sits at the top of a style file, so only this many characters
+# are read up front when listing styles.
+FRONTMATTER_READ_SIZE = 4096
+
 
 def load_all_styles(styles_dir: Path) -> List[Dict[str, Any]]:
     """Load all style files and extract metadata.
@@ -21,20 +26,23 @@ def load_all_styles(styles_dir: Path) -> List[Dict[str, Any]]:
         List of style metadata dictionaries (excludes backup files)
     """
     styles = []
-    for style_file in styles_dir.glob("*.md"):
-        # Skip backup files (*.backup.*.md)
-        if ".backup." in style_file.name:
-            continue
-
-        try:
-            metadata = extract_style_metadata(style_file)
-            styles.append({
-                'name': style_file.stem,
-                'description': metadata.get('description', 'No description'),
-                'path': style_file,
-            })
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not load {style_file}: {e}[/yellow]")
+    with os.scandir(styles_dir) as entries:
+        for entry in entries:
+            # Skip backup files (*.backup.*.md)
+            if not entry.name.endswith(".md") or ".backup." in entry.name:
+                continue
+
+            try:
+                if not entry.is_file():
+                    continue
+                metadata = _read_style_metadata(entry.path, entry.name[:-3])
+                styles.append({
+                    'name': entry.name[:-3],
+                    'description': metadata.get('description', 'No description'),
+                    'path': Path(entry.path),
+                })
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not load {entry.path}: {e}[/yellow]")
     return sorted(styles, key=lambda x: x['name'])
 
 
@@ -47,19 +55,32 @@ def extract_style_metadata(style_file: Path) -> Dict[str, str]:
     Returns:
         Dictionary of metadata fields
     """
-    content = style_file.read_text()
+    return _read_style_metadata(style_file, style_file.stem)
+
 
-    # Check for YAML frontmatter
-    if content.startswith('---'):
-        try:
-            end_idx = content.index('\n---\n', 3)
-            frontmatter = content[3:end_idx]
-            return yaml.safe_load(frontmatter)
-        except Exception:
-            pass
+def _read_style_metadata(path: Union[str, Path], stem: str) -> Dict[str, str]:
+    """Parse frontmatter from the head of a style file.
+
+    Only the first ``FRONTMATTER_READ_SIZE`` characters are read; the rest of
+    the file is read only when the closing ``---`` isn't within that block.
+    """
+    with open(path) as f:
+        content = f.read(FRONTMATTER_READ_SIZE)
+
+        # Check for YAML frontmatter
+        if content.startswith('---'):
+            end_idx = content.find('\n---\n', 3)
+            if end_idx == -1:
+                content += f.read()
+                end_idx = content.find('\n---\n', 3)
+            if end_idx != -1:
+                try:
+                    return parse_style_frontmatter(content[3:end_idx])
+                except Exception:
+                    pass
 
     # Fallback: minimal metadata
-    return {'name': style_file.stem, 'description': 'No description'}
+    return {'name': stem, 'description': 'No description'}
 
 
 def create_style_from_template(name: str, output_path: Path) -> None:
@@ -188,15 +188,9 @@ def setup_authentication(
             open_browser=True,
         )
 
-        # Save credentials
-        creds_data = {
-            "token": creds.token,
-            "refresh_token": creds.refresh_token,
-            "token_uri": creds.token_uri,
-            "client_id": creds.client_id,
-            "client_secret": creds.client_secret,
-            "scopes": creds.scopes,
-        }
+        # Save credentials (to_json() includes the token expiry, which lets
+        # GmailClient reuse the access token instead of refreshing every run)
+        creds_data = json.loads(creds.to_json())
 
         # Write with secure permissions
         creds_path.touch(mode=SECURE_FILE_MODE, exist_ok=True)
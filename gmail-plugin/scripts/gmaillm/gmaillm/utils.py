@@ -3,8 +3,8 @@
 import base64
 import binascii
 import mimetypes
+import mmap
 import re
-from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -14,6 +14,9 @@ from typing import Any, Dict, List, Optional, Tuple
 # Constants
 BASE64_PADDING_SIZE = 4
 MAX_ATTACHMENT_SIZE = 25 * 1024 * 1024  # 25MB Gmail limit
+# Raw bytes base64-encoded per step when attaching a file; a multiple of the
+# 57 bytes that make one 76-char line, so chunks concatenate to whole lines
+ATTACHMENT_ENCODE_CHUNK = 57 * 1024
 DEFAULT_MAX_RESULTS = 10
 DEFAULT_TRUNCATE_LENGTH = 100
 DEFAULT_TRUNCATE_SUFFIX = "..."
@@ -21,6 +24,11 @@ DEFAULT_TRUNCATE_SUFFIX = "..."
 # Email validation pattern
 EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
+# Patterns used on every parsed header and snippet
+NAME_ADDR_PATTERN = re.compile(r"^(.*?)\s*<(.+?)>$")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+IMAGE_PLACEHOLDER_PATTERN = re.compile(r"\[image:.*?\]")
+
 # Base64 valid characters set for O(1) lookup
 BASE64_VALID_CHARS = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=")
 
@@ -51,11 +59,11 @@ def parse_email_address(email_str: str) -> Dict[str, Optional[str]]:
         ValueError: If email format is invalid
 
     """
-    match = re.match(r"^(.*?)\s*<(.+?)>$", email_str.strip())
+    match = NAME_ADDR_PATTERN.match(email_str.strip())
     if match:
         # Clean name: remove quotes, newlines, and extra whitespace
         name = match.group(1).strip().strip('"').strip("'")
-        name = re.sub(r'\s+', ' ', name)  # Replace multiple whitespace (including \n) with single space
+        name = WHITESPACE_PATTERN.sub(' ', name)  # Replace multiple whitespace (including \n) with single space
         email = match.group(2).strip()
         if not validate_email(email):
             raise ValueError(f"Invalid email address: {email}")
@@ -117,9 +125,9 @@ def clean_snippet(snippet: str) -> str:
 
     """
     # Remove common email artifacts first
-    snippet = re.sub(r"\[image:.*?\]", "", snippet)
+    snippet = IMAGE_PLACEHOLDER_PATTERN.sub("", snippet)
     # Remove extra whitespace
-    snippet = re.sub(r"\s+", " ", snippet.strip())
+    snippet = WHITESPACE_PATTERN.sub(" ", snippet.strip())
     return snippet
 
 
@@ -174,14 +182,21 @@ def _attach_file(message: MIMEMultipart, file_path: str) -> None:
         main_type = "application"
         sub_type = "octet-stream"
 
-    # Read file content inside with block
+    # Base64-encode a chunk at a time from a read-only mapping of the file, so
+    # neither the raw content nor encodebytes' per-line pieces for the whole
+    # file are held in memory (same output as email.encoders.encode_base64)
+    encoded_bytes = bytearray()
     with open(file_path, "rb") as f:
-        content = f.read()
+        if file_size:  # mmap can't map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for start in range(0, file_size, ATTACHMENT_ENCODE_CHUNK):
+                    encoded_bytes += base64.encodebytes(mapped[start:start + ATTACHMENT_ENCODE_CHUNK])
+    encoded = encoded_bytes.decode("ascii")
+    del encoded_bytes
 
     attachment = MIMEBase(main_type, sub_type)
-    attachment.set_payload(content)
-
-    encoders.encode_base64(attachment)
+    attachment.set_payload(encoded)
+    attachment["Content-Transfer-Encoding"] = "base64"
 
     # Sanitize filename for security
     safe_filename = Path(file_path).name.replace('"', '').replace('\r', '').replace('\n', '')
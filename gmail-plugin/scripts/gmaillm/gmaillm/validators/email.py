@@ -1,8 +1,11 @@
 """Email validation utilities for gmaillm."""
 
+import os
 import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 import typer
 from rich.console import Console
@@ -10,7 +13,17 @@ from rich.console import Console
 console = Console()
 
 # Email validation regex
-EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+EMAIL_REGEX = re.compile(rf'^{_EMAIL_PATTERN}$')
+
+# Matches newline-terminated addresses, so a whole batch is checked in one call
+_EMAIL_LINES_REGEX = re.compile(rf'(?:{_EMAIL_PATTERN}\n)*')
+
+# Upper bound on threads used to stat several attachments at once
+MAX_STAT_WORKERS = 8
+
+# Characters Gmail rejects in label names
+INVALID_LABEL_CHARS = re.compile(r'[<>&"\'`]')
 
 
 def validate_email(email: str) -> bool:
@@ -25,9 +38,19 @@ def validate_email(email: str) -> bool:
     return bool(EMAIL_REGEX.match(email))
 
 
+def _all_valid_emails(addresses: Sequence[str]) -> bool:
+    """Check a batch of addresses with one regex scan over their joined text."""
+    joined = "".join(email + "\n" for email in addresses)
+    # The line count guards against an address with an embedded newline
+    return joined.count("\n") == len(addresses) and bool(_EMAIL_LINES_REGEX.fullmatch(joined))
+
+
 def validate_email_list(emails: List[str], field_name: str = "email") -> None:
     """Validate list of email addresses.
 
+    The whole list is checked in a single regex scan; addresses are only
+    matched one at a time when that fails, to report the invalid one.
+
     Args:
         emails: List of email addresses to validate
         field_name: Name of field for error messages
@@ -35,12 +58,57 @@ def validate_email_list(emails: List[str], field_name: str = "email") -> None:
     Raises:
         typer.Exit: If any email is invalid
     """
-    for email in emails:
-        if not email.startswith("#") and not validate_email(email):
+    addresses = [email for email in emails if not email.startswith("#")]
+    if _all_valid_emails(addresses):
+        return
+
+    match = EMAIL_REGEX.match
+    for email in addresses:
+        if not match(email):
             console.print(f"[red]Error: Invalid {field_name} address: {email}[/red]")
             raise typer.Exit(code=1)
 
 
+def validate_email_lists(*groups: Tuple[str, Optional[Sequence[str]]]) -> None:
+    """Validate several labelled email lists with a single regex scan.
+
+    All addresses are joined into one newline-terminated string and matched
+    at once. Only when that fails are the lists re-checked one address at a
+    time, to report the offending address and field.
+
+    Args:
+        groups: (field_name, emails) pairs; empty or None lists are skipped
+
+    Raises:
+        typer.Exit: If any email is invalid
+
+    Example:
+        validate_email_lists(("recipient", to_list), ("CC", cc_list))
+    """
+    addresses = [
+        email for _, emails in groups for email in emails or () if not email.startswith("#")
+    ]
+    if _all_valid_emails(addresses):
+        return
+
+    for field_name, emails in groups:
+        if emails:
+            validate_email_list(list(emails), field_name)
+
+
+def _stat_attachment(path: str) -> Tuple[Path, Optional[os.stat_result]]:
+    """Resolve an attachment path and stat it.
+
+    Returns:
+        Tuple of (resolved path, stat result or None if it can't be stat'ed)
+    """
+    file_path = Path(path).resolve()
+    try:
+        return file_path, file_path.stat()
+    except OSError:
+        return file_path, None
+
+
 def validate_attachment_paths(attachments: Optional[List[str]]) -> Optional[List[str]]:
     """Validate and resolve attachment file paths.
 
@@ -56,13 +124,24 @@ def validate_attachment_paths(attachments: Optional[List[str]]) -> Optional[List
     if not attachments:
         return None
 
+    # Resolve and stat each distinct path once; with several attachments the
+    # (possibly slow, e.g. network-mounted) lookups run concurrently
+    unique_paths = list(dict.fromkeys(attachments))
+    if len(unique_paths) == 1:
+        results = [_stat_attachment(unique_paths[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(unique_paths), MAX_STAT_WORKERS)) as pool:
+            results = list(pool.map(_stat_attachment, unique_paths))
+    stats = dict(zip(unique_paths, results))
+
+    # Report problems in the order the attachments were given
     validated = []
     for path in attachments:
-        file_path = Path(path).resolve()
-        if not file_path.exists():
+        file_path, file_stat = stats[path]
+        if file_stat is None:
             console.print(f"[red]Attachment not found: {path}[/red]")
             raise typer.Exit(code=1)
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             console.print(f"[red]Not a file: {path}[/red]")
             raise typer.Exit(code=1)
         validated.append(str(file_path))
@@ -79,8 +158,6 @@ def validate_label_name(name: str, max_length: int = 225) -> None:
     Raises:
         typer.Exit: If label name is invalid
     """
-    invalid_chars = r'[<>&"\'`]'
-
     if len(name) == 0:
         console.print("[red]Error: Label name cannot be empty[/red]")
         raise typer.Exit(code=1)
@@ -91,8 +168,10 @@ def validate_label_name(name: str, max_length: int = 225) -> None:
         )
         raise typer.Exit(code=1)
 
-    if re.search(invalid_chars, name):
-        console.print(f"[red]Error: Label name contains invalid characters: {invalid_chars}[/red]")
+    if INVALID_LABEL_CHARS.search(name):
+        console.print(
+            f"[red]Error: Label name contains invalid characters: {INVALID_LABEL_CHARS.pattern}[/red]"
+        )
         raise typer.Exit(code=1)
 
 
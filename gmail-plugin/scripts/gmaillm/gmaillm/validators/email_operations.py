@@ -1,9 +1,13 @@
 """JSON schema validators for email operations (send, reply, groups)."""
 
 import json
+import re
 from pathlib import Path
 from typing import Any, Dict, List
 
+# Group names: lowercase letters, numbers, hyphens, underscores
+GROUP_NAME_PATTERN = re.compile(r'^[a-z0-9-_]+$')
+
 # JSON Schema for sending emails
 SEND_EMAIL_JSON_SCHEMA = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
@@ -73,7 +77,7 @@ GROUP_JSON_SCHEMA = {
         "name": {
             "type": "string",
             "minLength": 1,
-            "pattern": "^[a-z0-9-_]+$",
+            "pattern": GROUP_NAME_PATTERN.pattern,
             "description": "Group name (lowercase, numbers, hyphens, underscores only)"
         },
         "members": {
@@ -262,9 +266,7 @@ def validate_group_json(json_data: Dict[str, Any]) -> List[str]:
         else:
             if not name.strip():
                 errors.append("Field 'name' cannot be empty")
-            # Check pattern (lowercase, numbers, hyphens, underscores)
-            import re
-            if not re.match(r'^[a-z0-9-_]+$', name):
+            if not GROUP_NAME_PATTERN.match(name):
                 errors.append("Field 'name' must contain only lowercase letters, numbers, hyphens, and underscores")
 
     # Validate 'members' field
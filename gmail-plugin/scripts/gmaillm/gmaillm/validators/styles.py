@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import typer
-import yaml
 from rich.console import Console
 
 console = Console()
@@ -17,7 +16,8 @@ STYLE_NAME_MIN_LENGTH = 3
 STYLE_NAME_MAX_LENGTH = 50
 STYLE_DESC_MIN_LENGTH = 30
 STYLE_DESC_MAX_LENGTH = 200
-INVALID_STYLE_CHARS = r'[/\\<>&"\'\`\s]'  # No slashes, spaces, or special chars
+INVALID_STYLE_CHARS = re.compile(r'[/\\<>&"\'\`\s]')  # No slashes, spaces, or special chars
+STYLE_NAME_PATTERN = re.compile(r'^[a-z0-9-]+$')
 RESERVED_STYLE_NAMES = {'default', 'template', 'base', 'system'}
 REQUIRED_STYLE_SECTIONS = ['examples', 'greeting', 'body', 'closing', 'do', 'dont']
 STYLE_SECTION_ORDER = ['examples', 'greeting', 'body', 'closing', 'do', 'dont']
@@ -36,7 +36,7 @@ STYLE_JSON_SCHEMA = {
             "type": "string",
             "minLength": STYLE_NAME_MIN_LENGTH,
             "maxLength": STYLE_NAME_MAX_LENGTH,
-            "pattern": "^[a-z0-9-]+$",
+            "pattern": STYLE_NAME_PATTERN.pattern,
             "description": "Style identifier (lowercase, hyphens only, no special chars or spaces)"
         },
         "description": {
@@ -154,7 +154,7 @@ def validate_json_against_schema(json_data: Dict[str, Any]) -> List[str]:
                 errors.append(f"Field 'name' too short (min {STYLE_NAME_MIN_LENGTH} chars)")
             if len(name) > STYLE_NAME_MAX_LENGTH:
                 errors.append(f"Field 'name' too long (max {STYLE_NAME_MAX_LENGTH} chars)")
-            if not re.match(r'^[a-z0-9-]+$', name):
+            if not STYLE_NAME_PATTERN.match(name):
                 errors.append(f"Field 'name' contains invalid characters (only lowercase, numbers, hyphens)")
 
     # Validate description
@@ -311,7 +311,7 @@ def validate_style_name(name: str) -> None:
         console.print(f"[red]Error: Style name too long (max {STYLE_NAME_MAX_LENGTH} characters)[/red]")
         raise typer.Exit(code=1)
 
-    if re.search(INVALID_STYLE_CHARS, name):
+    if INVALID_STYLE_CHARS.search(name):
         console.print("[red]Error: Style name contains invalid characters (no spaces or special chars)[/red]")
         raise typer.Exit(code=1)
 
@@ -334,9 +334,95 @@ class StyleLintError:
         return f"[{self.section}] {self.message}"
 
 
+class StyleFrontmatterError(Exception):
+    """Raised when style frontmatter is not valid YAML."""
+
+
+# One "name: ..." or "description: ..." line of flat frontmatter. Values are a
+# double-quoted string without escapes, a single-quoted string without
+# embedded quotes, or a plain scalar starting with a letter.
+_FRONTMATTER_FIELD_RE = re.compile(
+    r'(name|description): +(?:"([^"\\\n]*)"|\'([^\'\n]*)\'|([A-Za-z][^\n]*?)) *'
+)
+
+# Plain scalars that YAML resolves to something other than a string
+_YAML_NON_STRING_WORDS = {
+    'y', 'yes', 'n', 'no', 'true', 'false', 'on', 'off', 'null',
+}
+
+
+def _fast_frontmatter(frontmatter_text: str) -> Optional[Dict[str, str]]:
+    """Parse flat name/description frontmatter without the YAML loader.
+
+    Returns None whenever the text is anything other than ``name:`` and
+    ``description:`` lines with plain string values, so the caller can
+    fall back to ``yaml.safe_load`` and get identical results.
+    """
+    lines = frontmatter_text.split('\n')
+    # Tabs, control characters and Unicode line breaks have YAML-specific rules
+    if not all(line.isprintable() for line in lines):
+        return None
+
+    metadata = {}
+    for line in lines:
+        if not line.strip(' '):
+            continue
+        match = _FRONTMATTER_FIELD_RE.fullmatch(line)
+        if match is None:
+            return None
+        key, double_quoted, single_quoted, plain = match.groups()
+        if plain is not None:
+            if (
+                ': ' in plain
+                or ' #' in plain
+                or plain.endswith(':')
+                or plain.lower() in _YAML_NON_STRING_WORDS
+            ):
+                return None
+            value = plain
+        elif double_quoted is not None:
+            value = double_quoted
+        else:
+            value = single_quoted
+        metadata[key] = value
+    return metadata or None
+
+
+def parse_style_frontmatter(frontmatter_text: str) -> Any:
+    """Parse the frontmatter block of a style file.
+
+    Flat name/description frontmatter (what style files use) is read
+    directly; anything else goes through ``yaml.safe_load``.
+
+    Raises:
+        StyleFrontmatterError: If the frontmatter is not valid YAML
+    """
+    metadata = _fast_frontmatter(frontmatter_text)
+    if metadata is None:
+        import yaml  # Deferred: only needed for frontmatter the fast path rejects
+
+        try:
+            metadata = yaml.safe_load(frontmatter_text)
+        except yaml.YAMLError as e:
+            raise StyleFrontmatterError(str(e)) from e
+    return metadata
+
+
+@dataclass
+class _SectionSpan:
+    """Where a section's tags were found by StyleLinter._scan_sections."""
+    open_pos: Optional[int] = None  # Position of the first <section> tag
+    closed: bool = False  # Whether any </section> tag exists
+    body: Optional[str] = None  # Text between the first <section> and the next </section>
+
+
 class StyleLinter:
     """Linter for email style files with strict XML format validation."""
 
+    # List items written as "-item" instead of "- item" (auto-fixed); a dash
+    # followed by another dash is a "---" delimiter, not a list item
+    _LIST_ITEM_NO_SPACE = re.compile(r'^-([^\s-])', re.MULTILINE)
+
     def lint(self, content: str) -> List[StyleLintError]:
         """Run all linting checks on style content.
 
@@ -351,14 +437,17 @@ class StyleLinter:
         # 1. Check YAML frontmatter
         errors.extend(self._lint_frontmatter(content))
 
+        # Locate every section tag in one sweep; checks 2-4 work from this
+        sections = self._scan_sections(content)
+
         # 2. Check XML sections exist
-        errors.extend(self._lint_sections_exist(content))
+        errors.extend(self._lint_sections_exist(sections))
 
         # 3. Check XML sections order
-        errors.extend(self._lint_sections_order(content))
+        errors.extend(self._lint_sections_order(sections))
 
         # 4. Check section content
-        errors.extend(self._lint_section_content(content))
+        errors.extend(self._lint_section_content(sections))
 
         # 5. Check formatting
         errors.extend(self._lint_formatting(content))
@@ -382,7 +471,7 @@ class StyleLinter:
         fixed_content = '\n'.join(fixed_lines)
 
         # Auto-fix list item spacing
-        fixed_content = re.sub(r'^-([^ ])', r'- \1', fixed_content, flags=re.MULTILINE)
+        fixed_content = self._LIST_ITEM_NO_SPACE.sub(r'- \1', fixed_content)
 
         # Run lint on fixed content
         errors = self.lint(fixed_content)
@@ -408,7 +497,7 @@ class StyleLinter:
             end_idx = content.index('\n---\n', 3)
             frontmatter_text = content[3:end_idx]
 
-            metadata = yaml.safe_load(frontmatter_text)
+            metadata = parse_style_frontmatter(frontmatter_text)
 
             # Check required fields
             if 'name' not in metadata:
@@ -439,50 +528,74 @@ class StyleLinter:
 
         except ValueError:
             errors.append(StyleLintError('frontmatter', 'Invalid YAML frontmatter (missing closing ---)'))
-        except yaml.YAMLError as e:
+        except StyleFrontmatterError as e:
             errors.append(StyleLintError('frontmatter', f'Invalid YAML syntax: {e}'))
 
         return errors
 
-    def _lint_sections_exist(self, content: str) -> List[StyleLintError]:
+    def _scan_sections(self, content: str) -> Dict[str, _SectionSpan]:
+        """Find the section tags in a single pass over the content.
+
+        Matches the semantics of searching for each section separately: the
+        first <section> tag marks the section's position, and its body runs
+        to the first </section> tag after it.
+        """
+        sections = {section: _SectionSpan() for section in REQUIRED_STYLE_SECTIONS}
+
+        pos = content.find('<')
+        while pos != -1:
+            end = content.find('>', pos + 1)
+            if end == -1:
+                break
+            tag = content[pos + 1:end]
+            if tag.startswith('/'):
+                span = sections.get(tag[1:])
+                if span is not None:
+                    span.closed = True
+                    if span.open_pos is not None and span.body is None:
+                        span.body = content[span.open_pos + len(tag) + 1:pos]
+            else:
+                span = sections.get(tag)
+                if span is not None and span.open_pos is None:
+                    span.open_pos = pos
+            pos = content.find('<', pos + 1)
+
+        return sections
+
+    def _lint_sections_exist(self, sections: Dict[str, _SectionSpan]) -> List[StyleLintError]:
         """Check that all required sections exist."""
         errors = []
 
         for section in REQUIRED_STYLE_SECTIONS:
-            if f'<{section}>' not in content:
+            span = sections[section]
+            if span.open_pos is None:
                 errors.append(StyleLintError(section, f'Missing required section: <{section}>'))
-            elif f'</{section}>' not in content:
+            elif not span.closed:
                 errors.append(StyleLintError(section, f'Section not properly closed: <{section}>'))
 
         return errors
 
-    def _lint_sections_order(self, content: str) -> List[StyleLintError]:
+    def _lint_sections_order(self, sections: Dict[str, _SectionSpan]) -> List[StyleLintError]:
         """Check that sections appear in correct order (STRICT)."""
         errors = []
 
-        section_positions = {}
-        for section in REQUIRED_STYLE_SECTIONS:
-            match = re.search(f'<{section}>', content)
-            if match:
-                section_positions[section] = match.start()
-
         # Check STRICT order
         prev_pos = -1
         for section in STYLE_SECTION_ORDER:
-            if section in section_positions:
-                pos = section_positions[section]
+            pos = sections[section].open_pos
+            if pos is not None:
                 if pos < prev_pos:
                     errors.append(StyleLintError(section, f'Section <{section}> out of order (must follow {STYLE_SECTION_ORDER})'))
                 prev_pos = pos
 
         return errors
 
-    def _lint_section_content(self, content: str) -> List[StyleLintError]:
+    def _lint_section_content(self, sections: Dict[str, _SectionSpan]) -> List[StyleLintError]:
         """Validate content within each section."""
         errors = []
 
         for section in REQUIRED_STYLE_SECTIONS:
-            section_content = self._extract_section_content(content, section)
+            section_content = sections[section].body
             if section_content is None:
                 continue  # Already caught by _lint_sections_exist
 
@@ -517,13 +630,6 @@ class StyleLinter:
 
         return errors
 
-    def _extract_section_content(self, content: str, section: str) -> Optional[str]:
-        """Extract content between <section> and </section>."""
-        match = re.search(f'<{section}>(.*?)</{section}>', content, re.DOTALL)
-        if match:
-            return match.group(1)
-        return None
-
     def _lint_formatting(self, content: str) -> List[StyleLintError]:
         """Check general formatting issues."""
         errors = []
@@ -5,7 +5,6 @@ email processing workflows.
 """
 
 import base64
-import json
 import secrets
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -13,6 +12,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from gmaillm.models import EmailFull
+
 
 class WorkflowState(BaseModel):
     """State for a workflow session."""
@@ -62,7 +63,7 @@ class WorkflowResponse(BaseModel):
 
     success: bool = Field(..., description="Whether operation was successful")
     token: Optional[str] = Field(None, description="Continuation token")
-    email: Optional[Dict[str, Any]] = Field(None, description="Current email data")
+    email: Optional[EmailFull] = Field(None, description="Current email data")
     message: str = Field(..., description="Status message")
     progress: Dict[str, Any] = Field(..., description="Progress information")
     available_actions: List[str] = Field(
@@ -131,10 +132,7 @@ class WorkflowStateManager:
         if not state_file.exists():
             raise ValueError(f"Invalid or expired token: {token}")
 
-        with open(state_file) as f:
-            data = json.load(f)
-
-        state = WorkflowState(**data)
+        state = WorkflowState.model_validate_json(state_file.read_bytes())
 
         if state.is_expired:
             self._delete_state(token)
@@ -167,9 +165,7 @@ class WorkflowStateManager:
         deleted = 0
         for state_file in self.state_dir.glob("*.json"):
             try:
-                with open(state_file) as f:
-                    data = json.load(f)
-                state = WorkflowState(**data)
+                state = WorkflowState.model_validate_json(state_file.read_bytes())
                 if state.is_expired:
                     state_file.unlink()
                     deleted += 1
@@ -197,8 +193,7 @@ class WorkflowStateManager:
             state: WorkflowState to save
         """
         state_file = self.state_dir / f"{state.token}.json"
-        with open(state_file, 'w') as f:
-            json.dump(state.model_dump(mode='json'), f, default=str)
+        state_file.write_text(state.model_dump_json())
 
     def _delete_state(self, token: str) -> None:
         """Delete state from disk.
@@ -1,7 +1,10 @@
 """Tests for cli.py module."""
 
 import json
-from datetime import datetime
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -126,6 +129,24 @@ class TestExpandEmailGroups:
         result = expand_email_groups(emails, groups)
         assert len(result) == 3  # alice, bob (once), charlie
 
+    def test_expand_preserves_first_occurrence_order(self):
+        """Test that expansion keeps the order in which addresses first appear."""
+        groups = {"team": ["bob@example.com", "alice@example.com"]}
+        emails = ["alice@example.com", "#team", "#missing", "carol@example.com", "#missing"]
+
+        result = expand_email_groups(emails, groups)
+        assert result == [
+            "alice@example.com", "bob@example.com", "#missing", "carol@example.com",
+        ]
+
+    def test_expand_warns_once_per_unknown_group(self, capsys):
+        """Test that a repeated unknown group is reported once."""
+        expand_email_groups(["#missing", "#missing"], {"team": ["a@example.com"]})
+
+        out = capsys.readouterr().out
+        assert out.count("Unknown group '#missing'") == 1
+        assert "available: #team" in out
+
 
 class TestCLICommands:
     """Tests for CLI command handling."""
@@ -164,17 +185,16 @@ class TestCLICommands:
     def test_status_command(self, mock_client_class):
         """Test status command."""
         mock_client = Mock()
-        # Updated to match new verify_setup return format
-        mock_client.verify_setup.return_value = {
+        mock_client.get_status.return_value = {
             "auth": True,
             "email_address": "user@gmail.com",
-            "folders": 10,
             "inbox_accessible": True,
+            "folders": [
+                Mock(name="INBOX", unread_count=5, message_count=100),
+            ],
+            "recent_email": None,
             "errors": [],
         }
-        mock_client.get_folders.return_value = [
-            Mock(name="INBOX", unread_count=5, message_count=100),
-        ]
         mock_client_class.return_value = mock_client
 
         with patch("sys.argv", ["gmail", "status"]):
@@ -279,10 +299,10 @@ class TestCLICommands:
         mock_client.search_emails.assert_called_once()
 
     @patch("gmaillm.cli.GmailClient")
-    @patch("typer.confirm")
-    def test_send_command_with_confirmation(self, mock_confirm, mock_client_class):
+    @patch("builtins.input")
+    def test_send_command_with_confirmation(self, mock_input, mock_client_class):
         """Test send command with user confirmation."""
-        mock_confirm.return_value = True
+        mock_input.return_value = "y"
         mock_client = Mock()
         mock_response = Mock(success=True, message_id="msg123")
         mock_response.to_markdown.return_value = "✅ Sent"
@@ -308,10 +328,10 @@ class TestCLICommands:
         mock_client.send_email.assert_called_once()
 
     @patch("gmaillm.cli.GmailClient")
-    @patch("typer.confirm")
-    def test_send_command_cancelled(self, mock_confirm, mock_client_class):
+    @patch("builtins.input")
+    def test_send_command_cancelled(self, mock_input, mock_client_class):
         """Test send command cancelled by user."""
-        mock_confirm.return_value = False
+        mock_input.return_value = "n"
         mock_client = Mock()
         mock_client_class.return_value = mock_client
 
@@ -363,17 +383,17 @@ class TestCLICommands:
         mock_client.send_email.assert_called_once()
 
     @patch("gmaillm.cli.GmailClient")
-    @patch("typer.confirm")
-    def test_reply_command(self, mock_confirm, mock_client_class):
+    @patch("builtins.input")
+    def test_reply_command(self, mock_input, mock_client_class):
         """Test reply command."""
-        mock_confirm.return_value = True
+        mock_input.return_value = "y"
         mock_client = Mock()
 
-        # Mock the read_email call that reply command uses to get original message
-        mock_original = Mock()
-        mock_original.from_.email = "original@example.com"
-        mock_original.subject = "Original Subject"
-        mock_client.read_email.return_value = mock_original
+        # Mock the header read that reply uses to preview the original message
+        mock_client.read_email_headers.return_value = {
+            "From": "original@example.com",
+            "Subject": "Original Subject",
+        }
 
         mock_response = Mock(success=True, message_id="reply123")
         mock_response.to_markdown.return_value = "✅ Sent"
@@ -429,6 +449,265 @@ class TestCLICommands:
             assert "alice@example.com" in result
 
 
+class TestJsonOutput:
+    """Tests for JSON output when stdout is not a terminal."""
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_list_json_is_plain_when_piped(self, mock_client_class, capsys):
+        """Test that piped JSON output is unstyled and parseable."""
+        from gmaillm.models import SearchResult
+
+        mock_client = Mock()
+        mock_client.list_emails.return_value = SearchResult(
+            emails=[
+                EmailSummary(
+                    message_id="msg1",
+                    thread_id="thread1",
+                    from_=EmailAddress(email="sender@example.com"),
+                    subject="Hello",
+                    date=datetime(2025, 1, 15, 10, 30),
+                    snippet="Hi",
+                )
+            ],
+            total_count=1,
+            query="label:INBOX",
+        )
+        mock_client_class.return_value = mock_client
+
+        with patch("sys.argv", ["gmail", "list", "--output-format", "json"]):
+            with patch("sys.exit"):
+                main()
+
+        out = capsys.readouterr().out
+        assert "\x1b[" not in out
+        assert json.loads(out)["emails"][0]["message_id"] == "msg1"
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_search_json_matches_model_dump(self, mock_client_class, capsys):
+        """Test that search JSON output is plain JSON equal to model_dump(mode='json')."""
+        from gmaillm.models import SearchResult
+
+        result = SearchResult(
+            emails=[
+                EmailSummary(
+                    message_id="msg1",
+                    thread_id="thread1",
+                    from_=EmailAddress(email="boss@company.com", name="Zoë"),
+                    subject="Meeting",
+                    date=datetime(2025, 1, 15, 10, 30),
+                    snippet="Agenda",
+                )
+            ],
+            total_count=1,
+            query="from:boss@company.com",
+        )
+        mock_client = Mock()
+        mock_client.search_emails.return_value = result
+        mock_client_class.return_value = mock_client
+
+        with patch("sys.argv", ["gmail", "search", "from:boss@company.com", "--output-format", "json"]):
+            with patch("sys.exit"):
+                main()
+
+        out = capsys.readouterr().out
+        assert "\x1b[" not in out
+        assert json.loads(out) == result.model_dump(mode="json")
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_list_ndjson_streams_one_email_per_line(self, mock_client_class, capsys):
+        """Test that --ndjson writes each email as its own JSON line."""
+        emails = [
+            EmailSummary(
+                message_id=f"msg{i}",
+                thread_id="thread1",
+                from_=EmailAddress(email="sender@example.com"),
+                subject="Hello",
+                date=datetime(2025, 1, 15, 10, 30),
+                snippet="Hi",
+            )
+            for i in range(3)
+        ]
+        mock_client = Mock()
+        mock_client.iter_emails.return_value = iter(emails)
+        mock_client_class.return_value = mock_client
+
+        with patch("sys.argv", ["gmail", "list", "--max", "300", "--ndjson"]):
+            with patch("sys.exit"):
+                main()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["message_id"] for line in lines] == ["msg0", "msg1", "msg2"]
+        mock_client.iter_emails.assert_called_once_with(folder="ALL", max_results=300, query=None)
+        mock_client.list_emails.assert_not_called()
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_read_json_matches_model_dump(self, mock_client_class, capsys):
+        """Test that read JSON output is the same as model_dump(mode='json')."""
+        email = EmailSummary(
+            message_id="msg1",
+            thread_id="thread1",
+            from_=EmailAddress(email="sender@example.com", name="Zoë"),
+            subject="Hello",
+            date=datetime(2025, 1, 15, 10, 30),
+            snippet="Hi",
+        )
+        mock_client = Mock()
+        mock_client.read_email.return_value = email
+        mock_client.get_thread.return_value = [email]
+        mock_client_class.return_value = mock_client
+
+        with patch("sys.argv", ["gmail", "read", "msg1", "--full-thread", "--json"]):
+            with patch("sys.exit"):
+                main()
+
+        out = capsys.readouterr().out
+        assert json.loads(out) == {
+            "email": email.model_dump(mode="json"),
+            "thread": [email.model_dump(mode="json")],
+        }
+        assert "Zoë" in out
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_json_flag_matches_output_format_json(self, mock_client_class, capsys):
+        """Test that --json is shorthand for --output-format json."""
+        mock_client = Mock()
+        mock_client.verify_setup.return_value = {
+            "auth": True,
+            "email_address": "user@gmail.com",
+            "folders": 3,
+            "inbox_accessible": True,
+            "errors": [],
+        }
+        mock_client_class.return_value = mock_client
+
+        with patch("sys.argv", ["gmail", "verify", "--json"]):
+            with patch("sys.exit"):
+                main()
+
+        assert json.loads(capsys.readouterr().out)["email_address"] == "user@gmail.com"
+
+
+class TestCommandErrors:
+    """Tests for the shared command error handling."""
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_unexpected_error_reported_with_operation(self, mock_client_class, capsys):
+        """Test that an unexpected error names the failed operation and exits 1."""
+        mock_client = Mock()
+        mock_client.list_emails.side_effect = RuntimeError("quota exceeded")
+        mock_client_class.return_value = mock_client
+
+        with patch("sys.argv", ["gmail", "list"]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        assert "Error listing emails: quota exceeded" in capsys.readouterr().out
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_explicit_exit_passes_through(self, mock_client_class, capsys):
+        """Test that a command's own typer.Exit isn't reported as an error."""
+        mock_client = Mock()
+        mock_client.get_status.return_value = {
+            "auth": False,
+            "email_address": None,
+            "inbox_accessible": False,
+            "folders": [],
+            "recent_email": None,
+            "errors": ["Authentication failed"],
+        }
+        mock_client_class.return_value = mock_client
+
+        with patch("sys.argv", ["gmail", "status"]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        assert "Error getting status" not in capsys.readouterr().out
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_force_refresh_failure_reported(self, mock_client_class, capsys):
+        """Test that a failed setup-auth --force-refresh goes through command_errors."""
+        mock_client_class.side_effect = RuntimeError("Failed to refresh credentials")
+
+        with patch("sys.argv", ["gmail", "setup-auth", "--force-refresh"]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        output = capsys.readouterr().out
+        assert "Error setting up authentication: Failed to refresh credentials" in output
+
+
+class TestDaemon:
+    """Tests for the token-refresh daemon."""
+
+    @patch("gmaillm.cli.time.sleep")
+    @patch("gmaillm.cli.GmailClient")
+    def test_sleeps_until_refresh_is_due(self, mock_client_class, mock_sleep, capsys):
+        """Test that the daemon reuses one client and sleeps until refresh time."""
+        mock_client_class.return_value.seconds_until_refresh.side_effect = [3000.0, 12.5, 0.0]
+        mock_sleep.side_effect = [None, None, KeyboardInterrupt]
+
+        with patch("sys.argv", ["gmail", "daemon", "--credentials", "/tmp/creds.json"]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 130  # Ctrl+C
+        mock_client_class.assert_called_once()
+        assert mock_client_class.return_value.refresh_credentials.call_count == 2
+        # Refreshes with a larger lead time than ordinary commands
+        mock_client_class.assert_called_with(
+            credentials_file="/tmp/creds.json",
+            oauth_keys_file=None,
+            refresh_buffer=timedelta(minutes=10),
+        )
+        # Wakes exactly when due and never busy-loops once the token is due
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [3000.0, 12.5, 30]
+
+    @patch("gmaillm.cli.time.sleep")
+    @patch("gmaillm.cli.GmailClient")
+    def test_failed_refresh_is_retried(self, mock_client_class, mock_sleep, capsys):
+        """Test that a failed refresh is reported and retried rather than fatal."""
+        mock_client_class.side_effect = [RuntimeError("Failed to refresh credentials"), Mock()]
+        mock_sleep.side_effect = [None, KeyboardInterrupt]
+
+        with patch("sys.argv", ["gmail", "daemon"]):
+            with pytest.raises(SystemExit):
+                main()
+
+        assert "Failed to refresh credentials" in capsys.readouterr().out
+        assert mock_client_class.call_count == 2
+
+    @patch("gmaillm.cli.time.sleep")
+    @patch("gmaillm.cli.GmailClient")
+    def test_client_rebuilt_after_failed_refresh(self, mock_client_class, mock_sleep, capsys):
+        """Test that a refresh failure on the kept client rebuilds it next time."""
+        mock_client_class.return_value.seconds_until_refresh.return_value = 0.0
+        mock_client_class.return_value.refresh_credentials.side_effect = RuntimeError("network down")
+        mock_sleep.side_effect = [None, None, KeyboardInterrupt]
+
+        with patch("sys.argv", ["gmail", "daemon"]):
+            with pytest.raises(SystemExit):
+                main()
+
+        assert "network down" in capsys.readouterr().out
+        # Built, refresh fails, rebuilt
+        assert mock_client_class.call_count == 2
+
+
+class TestClientCache:
+    """Tests for the shared GmailClient instance."""
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_client_constructed_once_per_process(self, mock_client_class):
+        """Test that repeated commands reuse the same GmailClient."""
+        from gmaillm.cli import _get_client
+
+        assert _get_client() is _get_client()
+        mock_client_class.assert_called_once_with()
+
+
 class TestArgumentParsing:
     """Tests for argument parsing."""
 
@@ -444,6 +723,88 @@ class TestArgumentParsing:
             with pytest.raises(SystemExit):
                 main()
 
+    def test_subcommand_imports_only_its_module(self):
+        """Test that dispatching to a subcommand leaves sibling modules unloaded."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from gmaillm.cli import app\n"
+            "CliRunner().invoke(app, ['labels', '--help'])\n"
+            "print(sorted(m for m in sys.modules if m.startswith('gmaillm.commands.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "['gmaillm.commands.labels']"
+
+    def test_root_help_imports_no_subcommand_modules(self):
+        """Test that the root help imports neither sub-apps nor the API/model stack."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from gmaillm.cli import app\n"
+            "result = CliRunner().invoke(app, ['--help'])\n"
+            "assert 'Manage Gmail labels' in result.output, result.output\n"
+            "print(sorted(m for m in sys.modules if m.startswith('gmaillm.commands.')))\n"
+            "print(sorted(m for m in sys.modules if m.startswith(('googleapiclient', 'pydantic'))))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["[]", "[]"]
+
+    @pytest.mark.parametrize("subcommand", ["labels", "workflows", "ask"])
+    def test_subcommand_help_skips_google_api_client(self, subcommand):
+        """Test that sub-app help doesn't import the Google API client."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from gmaillm.cli import app\n"
+            f"result = CliRunner().invoke(app, [{subcommand!r}, '--help'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "print(sorted(m for m in sys.modules if m.startswith('googleapiclient')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_shell_completion_still_served(self):
+        """Test that tab-completion works without Typer's add_completion."""
+        import os
+
+        env = dict(
+            os.environ,
+            _GMAIL_COMPLETE="complete_zsh",
+            _TYPER_COMPLETE_ARGS="gmail lab",
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys; sys.argv = ['gmail']; from gmaillm.cli import main; main()"],
+            capture_output=True, text=True, env=env,
+        )
+        assert '"labels":"Manage Gmail labels"' in result.stdout
+
+    def test_root_help_lists_completion_options(self, capsys):
+        """Test that --install-completion/--show-completion are still offered."""
+        with patch("sys.argv", ["gmail", "--help"]):
+            with pytest.raises(SystemExit):
+                main()
+
+        out = capsys.readouterr().out
+        assert "--install-completion" in out
+        assert "--show-completion" in out
+
+    def test_lazy_subcommand_help_matches_sub_apps(self):
+        """Test that the static root-help text hasn't drifted from the sub-apps."""
+        import importlib
+
+        from gmaillm.cli import GmailGroup
+
+        assert set(GmailGroup.lazy_subcommand_help) == set(GmailGroup.lazy_subcommands)
+        for name, module_name in GmailGroup.lazy_subcommands.items():
+            sub_app = importlib.import_module(module_name).app
+            assert GmailGroup.lazy_subcommand_help[name] == sub_app.info.help, name
+
 
 class TestStylesCommands:
     """Tests for styles management commands."""
@@ -533,7 +894,7 @@ Example
 """
 
     @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
-    def test_styles_list(self, mock_config_dir, tmp_path):
+    def test_styles_list(self, mock_config_dir, tmp_path, capsys):
         """Test listing all styles."""
         mock_config_dir.return_value = tmp_path
         styles_dir = tmp_path / "email-styles"
@@ -547,6 +908,12 @@ Example
             with patch("sys.exit"):
                 main()
 
+        out = capsys.readouterr().out
+        assert "📝 formal" in out
+        assert "📝 casual" in out
+        assert out.count("Path:") == 2
+        assert "Total: 2 style(s)" in out
+
     @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
     def test_styles_list_empty(self, mock_config_dir, tmp_path):
         """Test listing styles when directory is empty."""
@@ -572,6 +939,38 @@ Example
             with patch("sys.exit"):
                 main()
 
+    @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
+    def test_styles_show_prints_brackets_verbatim(self, mock_config_dir, tmp_path, capsys):
+        """Test that [...] in a style is printed as written, not as Rich markup."""
+        mock_config_dir.return_value = tmp_path
+        styles_dir = tmp_path / "email-styles"
+        styles_dir.mkdir()
+
+        content = self.VALID_STYLE.replace("Example email 1", "Dear [Name], see [/link] [bold]now[/bold]")
+        (styles_dir / "formal.md").write_text(content)
+
+        with patch("sys.argv", ["gmail", "styles", "show", "formal"]):
+            with patch("sys.exit"):
+                main()
+
+        assert capsys.readouterr().out == content
+
+    @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
+    def test_styles_show_json(self, mock_config_dir, tmp_path, capsys):
+        """Test showing a style as JSON."""
+        mock_config_dir.return_value = tmp_path
+        styles_dir = tmp_path / "email-styles"
+        styles_dir.mkdir()
+        (styles_dir / "formal.md").write_text(self.VALID_STYLE)
+
+        with patch("sys.argv", ["gmail", "styles", "show", "formal", "--output-format", "json"]):
+            with patch("sys.exit"):
+                main()
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["name"] == "formal"
+        assert data["content"] == self.VALID_STYLE
+
     @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
     def test_styles_show_not_found(self, mock_config_dir, tmp_path):
         """Test showing non-existent style."""
@@ -726,6 +1125,7 @@ Example
         # Verify backup was created
         backups = list(styles_dir.glob("old-style.backup.*"))
         assert len(backups) == 1
+        assert backups[0].read_text() == self.VALID_STYLE
 
     @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
     @patch("typer.confirm")
@@ -821,6 +1221,24 @@ Example
         fixed_content = style_file.read_text()
         assert not any(line.endswith("   ") for line in fixed_content.split('\n'))
 
+    @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
+    def test_styles_validate_fix_skips_clean_file(self, mock_config_dir, tmp_path):
+        """Test that --fix doesn't rewrite a style that needs no fixes."""
+        mock_config_dir.return_value = tmp_path
+        styles_dir = tmp_path / "email-styles"
+        styles_dir.mkdir()
+
+        style_file = styles_dir / "clean-style.md"
+        style_file.write_text(self.VALID_STYLE)
+        os.utime(style_file, ns=(0, 0))
+
+        with patch("sys.argv", ["gmail", "styles", "validate", "clean-style", "--fix"]):
+            with patch("sys.exit"):
+                main()
+
+        assert style_file.stat().st_mtime_ns == 0
+        assert style_file.read_text() == self.VALID_STYLE
+
     @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
     def test_styles_validate_not_found(self, mock_config_dir, tmp_path):
         """Test validating non-existent style."""
@@ -884,6 +1302,25 @@ Example
             # Check no lines have 3 or more trailing spaces
             assert not any(len(line) - len(line.rstrip()) >= 3 for line in lines)
 
+    @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
+    def test_styles_validate_all_skips_non_style_entries(self, mock_config_dir, tmp_path, capsys):
+        """Test validating all styles ignores directories and non-.md files."""
+        mock_config_dir.return_value = tmp_path
+        styles_dir = tmp_path / "email-styles"
+        styles_dir.mkdir()
+
+        (styles_dir / "valid.md").write_text(self.VALID_STYLE)
+        (styles_dir / "notes.txt").write_text("not a style")
+        (styles_dir / "archive.md").mkdir()
+
+        with patch("sys.argv", ["gmail", "styles", "validate", "--output-format", "json"]):
+            with patch("sys.exit"):
+                main()
+
+        result = json.loads(capsys.readouterr().out)
+        assert result["name"] == "valid"
+        assert result["valid"] is True
+
     @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
     def test_styles_validate_all_empty(self, mock_config_dir, tmp_path):
         """Test validating all styles when directory is empty."""
@@ -7,7 +7,7 @@ import pytest
 from typer.testing import CliRunner
 
 from gmaillm.cli import app
-from gmaillm.models import EmailSummary, EmailAddress, SendEmailResponse
+from gmaillm.models import SendEmailResponse
 
 runner = CliRunner()
 
@@ -376,7 +376,7 @@ class TestSendErrorHandling:
         """Test error with invalid email in TO field."""
         mock_expand.side_effect = lambda x: x if x else None
 
-        with patch("gmaillm.cli.validate_email_list") as mock_validate:
+        with patch("gmaillm.cli.validate_email_lists") as mock_validate:
             mock_validate.side_effect = ValueError("Invalid email")
 
             result = runner.invoke(app, [
@@ -419,14 +419,10 @@ class TestReplyCommand:
     def test_reply_basic(self, mock_client_class):
         """Test basic reply."""
         mock_client = Mock()
-        mock_client.read_email.return_value = EmailSummary(
-            message_id="original123",
-            thread_id="thread123",
-            **{"from": EmailAddress(email="sender@example.com", name="Sender")},
-            subject="Original Subject",
-            date="2025-01-01T00:00:00Z",
-            snippet="Original message"
-        )
+        mock_client.read_email_headers.return_value = {
+            "From": "Sender <sender@example.com>",
+            "Subject": "Original Subject",
+        }
         mock_client.reply_email.return_value = SendEmailResponse(
             message_id="reply123",
             thread_id="thread123"
@@ -447,14 +443,10 @@ class TestReplyCommand:
     def test_reply_all(self, mock_client_class):
         """Test reply all."""
         mock_client = Mock()
-        mock_client.read_email.return_value = EmailSummary(
-            message_id="original123",
-            thread_id="thread123",
-            **{"from": EmailAddress(email="sender@example.com")},
-            subject="Group Discussion",
-            date="2025-01-01T00:00:00Z",
-            snippet="Original"
-        )
+        mock_client.read_email_headers.return_value = {
+            "From": "sender@example.com",
+            "Subject": "Group Discussion",
+        }
         mock_client.reply_email.return_value = SendEmailResponse(
             message_id="reply123",
             thread_id="thread123"
@@ -478,14 +470,10 @@ class TestReplyCommand:
     def test_reply_cancelled(self, mock_client_class):
         """Test cancelling reply."""
         mock_client = Mock()
-        mock_client.read_email.return_value = EmailSummary(
-            message_id="original123",
-            thread_id="thread123",
-            **{"from": EmailAddress(email="sender@example.com")},
-            subject="Test",
-            date="2025-01-01T00:00:00Z",
-            snippet="Test"
-        )
+        mock_client.read_email_headers.return_value = {
+            "From": "sender@example.com",
+            "Subject": "Test",
+        }
         mock_client_class.return_value = mock_client
 
         result = runner.invoke(app, [
@@ -498,6 +486,33 @@ class TestReplyCommand:
         assert "Cancelled" in result.stdout
         mock_client.reply_email.assert_not_called()
 
+    @patch("gmaillm.cli.GmailClient")
+    def test_reply_yolo_skips_confirmation(self, mock_client_class):
+        """Test that --yolo sends the reply without prompting."""
+        mock_client = Mock()
+        mock_client.read_email_headers.return_value = {
+            "From": "sender@example.com",
+            "Subject": "Test",
+        }
+        mock_client.reply_email.return_value = SendEmailResponse(
+            message_id="reply123",
+            thread_id="thread123"
+        )
+        mock_client_class.return_value = mock_client
+
+        with patch("builtins.input") as mock_input:
+            result = runner.invoke(app, [
+                "reply",
+                "original123",
+                "--body", "Reply text",
+                "--yolo"
+            ])
+
+        assert result.exit_code == 0
+        assert "Reply sent" in result.stdout
+        mock_input.assert_not_called()
+        mock_client.reply_email.assert_called_once()
+
 
 class TestReplyJSONInput:
     """Test reply with JSON input."""
@@ -511,14 +526,10 @@ class TestReplyJSONInput:
             "reply_all": False
         }
         mock_client = Mock()
-        mock_client.read_email.return_value = EmailSummary(
-            message_id="original123",
-            thread_id="thread123",
-            **{"from": EmailAddress(email="sender@example.com")},
-            subject="Test",
-            date="2025-01-01T00:00:00Z",
-            snippet="Test"
-        )
+        mock_client.read_email_headers.return_value = {
+            "From": "sender@example.com",
+            "Subject": "Test",
+        }
         mock_client.reply_email.return_value = SendEmailResponse(
             message_id="reply123",
             thread_id="thread123"
@@ -544,14 +555,10 @@ class TestReplyJSONInput:
             "reply_all": True
         }
         mock_client = Mock()
-        mock_client.read_email.return_value = EmailSummary(
-            message_id="original123",
-            thread_id="thread123",
-            **{"from": EmailAddress(email="sender@example.com")},
-            subject="Test",
-            date="2025-01-01T00:00:00Z",
-            snippet="Test"
-        )
+        mock_client.read_email_headers.return_value = {
+            "From": "sender@example.com",
+            "Subject": "Test",
+        }
         mock_client.reply_email.return_value = SendEmailResponse(
             message_id="reply123",
             thread_id="thread123"
@@ -595,7 +602,7 @@ class TestReplyErrorHandling:
     def test_reply_nonexistent_message(self, mock_client_class):
         """Test replying to nonexistent message."""
         mock_client = Mock()
-        mock_client.read_email.side_effect = Exception("Message not found")
+        mock_client.read_email_headers.side_effect = Exception("Message not found")
         mock_client_class.return_value = mock_client
 
         result = runner.invoke(app, [
@@ -611,14 +618,10 @@ class TestReplyErrorHandling:
     def test_reply_api_error(self, mock_client_class):
         """Test API error during reply."""
         mock_client = Mock()
-        mock_client.read_email.return_value = EmailSummary(
-            message_id="original123",
-            thread_id="thread123",
-            **{"from": EmailAddress(email="sender@example.com")},
-            subject="Test",
-            date="2025-01-01T00:00:00Z",
-            snippet="Test"
-        )
+        mock_client.read_email_headers.return_value = {
+            "From": "sender@example.com",
+            "Subject": "Test",
+        }
         mock_client.reply_email.side_effect = Exception("API error")
         mock_client_class.return_value = mock_client
 
@@ -652,14 +655,10 @@ class TestReplyPreview:
     def test_reply_shows_preview(self, mock_client_class):
         """Test that reply shows preview before sending."""
         mock_client = Mock()
-        mock_client.read_email.return_value = EmailSummary(
-            message_id="original123",
-            thread_id="thread123",
-            **{"from": EmailAddress(email="alice@example.com", name="Alice")},
-            subject="Meeting Tomorrow",
-            date="2025-01-01T00:00:00Z",
-            snippet="Can we meet?"
-        )
+        mock_client.read_email_headers.return_value = {
+            "From": "Alice <alice@example.com>",
+            "Subject": "Meeting Tomorrow",
+        }
         mock_client.reply_email.return_value = SendEmailResponse(
             message_id="reply123",
             thread_id="thread123"
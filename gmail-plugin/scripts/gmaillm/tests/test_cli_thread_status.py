@@ -1,12 +1,13 @@
 """Tests for thread and status CLI commands."""
 
+import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 from typer.testing import CliRunner
 
-from gmaillm.cli import app
-from gmaillm.models import EmailAddress, EmailSummary, Folder, SearchResult
+from gmaillm.cli import _summarize_folders, app
+from gmaillm.models import EmailAddress, EmailSummary, Folder
 
 runner = CliRunner()
 
@@ -117,52 +118,91 @@ class TestStatusCommand:
     def test_status_authenticated(self, mock_client_class):
         """Test status with authenticated user."""
         mock_client = Mock()
-        mock_client.verify_setup.return_value = {
+        mock_client.get_status.return_value = {
             "auth": True,
             "email_address": "test@example.com",
-            "folders": 5,
             "inbox_accessible": True,
+            "folders": [
+                Folder(id="INBOX", name="INBOX", type="system", message_count=50, unread_count=5),
+                Folder(id="SENT", name="SENT", type="system", message_count=30, unread_count=0),
+            ],
+            "recent_email": EmailSummary(
+                message_id="msg1",
+                thread_id="thread1",
+                **{"from": EmailAddress(email="sender@example.com")},
+                subject="Test",
+                date=datetime.now(),
+                snippet="Test email",
+                labels=["INBOX", "UNREAD"],
+                has_attachments=False,
+                is_unread=True
+            ),
             "errors": []
         }
-        mock_client.get_folders.return_value = [
-            Folder(id="INBOX", name="INBOX", type="system", message_count=50, unread_count=5),
-            Folder(id="SENT", name="SENT", type="system", message_count=30, unread_count=0),
-        ]
-        mock_client.list_emails.return_value = SearchResult(
-            emails=[
-                EmailSummary(
-                    message_id="msg1",
-                    thread_id="thread1",
-                    **{"from": EmailAddress(email="sender@example.com")},
-                    subject="Test",
-                    date=datetime.now(),
-                    snippet="Test email",
-                    labels=["INBOX", "UNREAD"],
-                    has_attachments=False,
-                    is_unread=True
-                )
-            ],
-            total_count=50,
-            next_page_token=None,
-            query="label:INBOX"
-        )
         mock_client_class.return_value = mock_client
 
         result = runner.invoke(app, ["status"])
 
         assert result.exit_code == 0
         assert "test@example.com" in result.output
-        mock_client.verify_setup.assert_called_once()
+        assert "sender@example.com" in result.output
+        assert "Total Labels: 2 | Custom: 0 | System: 2" in result.output
+        mock_client.get_status.assert_called_once()
+        # Everything comes from the batched call, not per-resource round-trips
+        mock_client.verify_setup.assert_not_called()
+        mock_client.get_folders.assert_not_called()
+        mock_client.list_emails.assert_not_called()
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_status_json(self, mock_client_class):
+        """Test status JSON output with and without a recent email."""
+        inbox = Folder(id="INBOX", name="INBOX", type="system", message_count=50, unread_count=5)
+        label = Folder(id="Label_1", name="Work", type="user", message_count=3, unread_count=0)
+        recent = EmailSummary(
+            message_id="msg1",
+            thread_id="thread1",
+            **{"from": EmailAddress(email="sender@example.com")},
+            subject="Test",
+            date=datetime(2025, 1, 15, 10, 30),
+            snippet="Test email",
+        )
+        status = {
+            "auth": True,
+            "email_address": "test@example.com",
+            "inbox_accessible": True,
+            "folders": [inbox, label],
+            "recent_email": recent,
+            "errors": []
+        }
+        mock_client = Mock()
+        mock_client.get_status.return_value = status
+        mock_client_class.return_value = mock_client
+
+        result = runner.invoke(app, ["status", "--json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["folders"] == {"total": 2, "user": 1, "system": 1}
+        assert data["unread_count"] == 5
+        assert data["recent_email"] == recent.model_dump(mode="json")
+        assert data["folder_list"] == [inbox.model_dump(mode="json"), label.model_dump(mode="json")]
+
+        status["recent_email"] = None
+        result = runner.invoke(app, ["status", "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["recent_email"] is None
 
     @patch("gmaillm.cli.GmailClient")
     def test_status_not_authenticated(self, mock_client_class):
         """Test status when not authenticated."""
         mock_client = Mock()
-        mock_client.verify_setup.return_value = {
+        mock_client.get_status.return_value = {
             "auth": False,
             "email_address": None,
-            "folders": 0,
             "inbox_accessible": False,
+            "folders": [],
+            "recent_email": None,
             "errors": ["Authentication failed"]
         }
         mock_client_class.return_value = mock_client
@@ -171,3 +211,44 @@ class TestStatusCommand:
 
         assert result.exit_code == 1
         assert "not authenticated" in result.output.lower() or "authentication failed" in result.output.lower()
+
+    @patch("gmaillm.cli.GmailClient")
+    def test_status_not_authenticated_json(self, mock_client_class):
+        """Test unauthenticated JSON status keeps the verify_setup() details shape."""
+        mock_client = Mock()
+        mock_client.get_status.return_value = {
+            "auth": True,
+            "email_address": None,
+            "inbox_accessible": False,
+            "folders": [Folder(id="INBOX", name="INBOX", type="system")],
+            "recent_email": None,
+            "errors": ["Failed to get profile"]
+        }
+        mock_client_class.return_value = mock_client
+
+        result = runner.invoke(app, ["status", "--json"])
+
+        assert result.exit_code == 1
+        data, _ = json.JSONDecoder().raw_decode(result.stdout)
+        assert data["details"] == {
+            "auth": True,
+            "email_address": None,
+            "folders": 1,
+            "inbox_accessible": False,
+            "errors": ["Failed to get profile"],
+        }
+
+    def test_summarize_folders(self):
+        """Test label counts and INBOX lookup come from one pass."""
+        folders = [
+            Folder(id="Label_1", name="Work", type="user"),
+            Folder(id="INBOX", name="INBOX", type="system", message_count=50),
+            Folder(id="Label_2", name="Home", type="user"),
+            Folder(id="SENT", name="SENT", type="system"),
+        ]
+
+        user_labels, system_labels, inbox_folder = _summarize_folders(folders)
+
+        assert (user_labels, system_labels) == (2, 2)
+        assert inbox_folder is folders[1]
+        assert _summarize_folders([]) == (0, 0, None)
@@ -45,3 +45,16 @@ class TestShowCommand:
 
         assert result.exit_code == 1
         assert "Invalid output format" in result.stdout
+
+    @patch("gmaillm.helpers.core.paths.get_plugin_config_dir")
+    def test_show_config_rich_output(self, mock_config_dir, runner, tmp_path):
+        """Test that config show prints paths and the full command reference."""
+        mock_config_dir.return_value = tmp_path
+
+        result = runner.invoke(app, ["show"])
+
+        assert result.exit_code == 0
+        assert "Email Styles:" in result.stdout
+        assert "email-styles" in result.stdout
+        assert "gmail styles validate [name]" in result.stdout
+        assert "gmail config show" in result.stdout
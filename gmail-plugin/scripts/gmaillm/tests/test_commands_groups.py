@@ -640,6 +640,44 @@ class TestValidateGroup:
         assert "✗ #duplicate" in result.stdout
         assert "Validation failed" in result.stdout
 
+    @patch("gmaillm.commands.groups.load_email_groups")
+    def test_validate_reports_non_list_members(self, mock_load):
+        """Test that malformed group values are reported instead of crashing."""
+        mock_load.return_value = {
+            "team": None,
+            "solo": "a@b.com",
+            "ok": ["alice@example.com"],
+        }
+
+        result = runner.invoke(app, ["validate", "--output-format", "json"])
+
+        assert result.exit_code == 1
+        results, _ = json.JSONDecoder().raw_decode(result.stdout)
+        assert results == [
+            {"group": "team", "valid": False,
+             "errors": ["Members must be a list of email addresses, got NoneType"]},
+            {"group": "solo", "valid": False,
+             "errors": ["Members must be a list of email addresses, got str"]},
+            {"group": "ok", "valid": True, "errors": []},
+        ]
+
+    @patch("gmaillm.commands.groups.load_email_groups")
+    def test_validate_json_output(self, mock_load):
+        """Test JSON validation results are written as plain JSON when piped."""
+        mock_load.return_value = {
+            "team": ["alice@example.com"],
+            "clients": ["client@example.com"],
+        }
+
+        result = runner.invoke(app, ["validate", "--output-format", "json"])
+
+        assert result.exit_code == 0
+        assert "\x1b[" not in result.stdout
+        assert json.loads(result.stdout) == [
+            {"group": "team", "valid": True, "errors": []},
+            {"group": "clients", "valid": True, "errors": []},
+        ]
+
 
 class TestShowSchema:
     """Test schema command."""
@@ -1,5 +1,6 @@
 """Tests for gmaillm.commands.labels module."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -35,6 +36,22 @@ class TestListLabels:
         assert result.exit_code == 0
         mock_client.get_folders.assert_called_once()
 
+    @patch("gmaillm.commands.labels.GmailClient")
+    def test_list_labels_json(self, mock_client_class):
+        """Test JSON output matches the models' JSON dump."""
+        mock_folders = [
+            Folder(id="INBOX", name="INBOX", type="system", message_count=10, unread_count=2),
+            Folder(id="Label_1", name="Work", type="user"),
+        ]
+        mock_client = Mock()
+        mock_client.get_folders.return_value = mock_folders
+        mock_client_class.return_value = mock_client
+
+        result = runner.invoke(app, ["list", "--output-format", "json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output) == [f.model_dump(mode="json") for f in mock_folders]
+
     @patch("gmaillm.commands.labels.GmailClient")
     def test_list_labels_empty(self, mock_client_class):
         """Test listing when no labels exist."""
@@ -1,5 +1,6 @@
 """Tests for commands/workflows.py module."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -9,6 +10,7 @@ import typer
 from typer.testing import CliRunner
 
 from gmaillm.commands.workflows import app
+from gmaillm.models import SearchResult
 from gmaillm.workflow_config import WorkflowConfig
 
 
@@ -417,17 +419,18 @@ class TestRunCommand:
 
         # Setup Gmail client
         mock_client = Mock()
-        mock_result = Mock()
-        mock_result.emails = []
-        mock_result.model_dump.return_value = {"emails": [], "total_count": 0}
-        mock_client.search_emails.return_value = mock_result
+        mock_client.search_emails.return_value = SearchResult(
+            emails=[], total_count=0, query="is:unread in:inbox"
+        )
         mock_client_class.return_value = mock_client
 
         result = runner.invoke(app, ["run", "clear", "--output-format", "json"])
 
         assert result.exit_code == 0
         # JSON mode should return immediately after printing JSON
-        mock_result.model_dump.assert_called_once()
+        data = json.loads(result.stdout)
+        assert data["emails"] == []
+        assert data["total_count"] == 0
 
     def test_run_without_workflow_or_query(self, runner):
         """Test running without workflow ID or query fails."""
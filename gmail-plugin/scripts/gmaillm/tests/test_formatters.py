@@ -6,7 +6,7 @@ from io import StringIO
 from rich.console import Console
 
 from gmaillm.formatters import RichFormatter
-from gmaillm.models import EmailAddress, EmailSummary
+from gmaillm.models import EmailAddress, EmailSummary, Folder
 
 
 class TestRichFormatterEmailSummary:
@@ -77,3 +77,106 @@ class TestRichFormatterEmailSummary:
 
         # Should not raise any exceptions
         formatter.print_email_summary(email)
+
+
+class TestRichFormatterFolderStats:
+    """Test RichFormatter.build_folder_stats_table() method."""
+
+    def test_rows_follow_display_order_and_skip_missing(self):
+        """Test that known folders are shown in display order, others ignored."""
+        string_io = StringIO()
+        console = Console(file=string_io, force_terminal=False, width=80)
+        formatter = RichFormatter(console)
+        folders = [
+            Folder(id="Label_1", name="Work", type="user", message_count=7),
+            Folder(id="SENT", name="SENT", type="system", message_count=5),
+            Folder(id="INBOX", name="INBOX", type="system", message_count=10, unread_count=3),
+        ]
+
+        console.print(formatter.build_folder_stats_table(folders))
+
+        output = string_io.getvalue()
+        assert output.index("Inbox") < output.index("Sent")
+        assert "Drafts" not in output
+        assert "Work" not in output
+
+
+class TestRichFormatterFolderList:
+    """Test RichFormatter.print_folder_list() method."""
+
+    def test_groups_system_and_custom_labels(self):
+        """Test that labels are split into system and custom sections, in order."""
+        string_io = StringIO()
+        console = Console(file=string_io, force_terminal=False, width=80)
+        formatter = RichFormatter(console)
+        folders = [
+            Folder(id="Label_1", name="Work", type="user"),
+            Folder(id="INBOX", name="INBOX", type="system"),
+            Folder(id="Label_2", name="Travel", type="user"),
+            Folder(id="SENT", name="SENT", type="system"),
+        ]
+
+        formatter.print_folder_list(folders, "Gmail Labels")
+
+        output = string_io.getvalue()
+        assert "Gmail Labels (4)" in output
+        assert output.index("System Labels") < output.index("INBOX") < output.index("SENT")
+        assert output.index("Custom Labels") < output.index("Work") < output.index("Travel")
+        assert "Total: 2 system, 2 custom" in output
+
+    def test_renders_complete_listing(self):
+        """Test the full rendered listing: header, both sections and totals."""
+        string_io = StringIO()
+        console = Console(file=string_io, force_terminal=False, width=80)
+        formatter = RichFormatter(console)
+        folders = [
+            Folder(id="Label_1", name="Work", type="user", message_count=12, unread_count=3),
+            Folder(id="INBOX", name="INBOX", type="system", message_count=50, unread_count=5),
+            Folder(id="SENT", name="SENT", type="system"),
+        ]
+
+        formatter.print_folder_list(folders, "Gmail Labels")
+
+        assert string_io.getvalue() == (
+            "============================================================\n"
+            "Gmail Labels (3)\n"
+            "============================================================\n"
+            "\n"
+            "📋 System Labels:\n"
+            "  INBOX (50 messages, 5 unread, ID: INBOX)\n"
+            "  SENT (ID: SENT)\n"
+            "\n"
+            "🏷️  Custom Labels:\n"
+            "  Work (12 messages, 3 unread, ID: Label_1)\n"
+            "\n"
+            "Total: 2 system, 1 custom\n"
+        )
+
+
+class TestRichFormatterThread:
+    """Test RichFormatter.print_thread() method."""
+
+    def test_prints_messages_in_order_with_rules_between(self):
+        """Test that each message is listed in order with a rule between messages."""
+        string_io = StringIO()
+        console = Console(file=string_io, force_terminal=False, width=100)
+        formatter = RichFormatter(console)
+        thread = [
+            EmailSummary(
+                message_id=f"msg{i}",
+                thread_id="thread1",
+                from_=EmailAddress(email=f"sender{i}@example.com"),
+                subject=f"Subject {i}",
+                date=datetime(2025, 1, 15, 10, i),
+                snippet=f"Snippet {i}",
+            )
+            for i in range(3)
+        ]
+
+        formatter.print_thread(thread, "msg0")
+
+        output = string_io.getvalue()
+        assert "Thread: 3 message(s)" in output
+        assert output.index("[1] From: sender0") < output.index("[2] From: sender1") < output.index("[3] From: sender2")
+        assert "Date: 2025-01-15 10:02" in output
+        assert output.count("─" * 60) == 2
@@ -1,13 +1,17 @@
 """Tests for gmail_client.py module."""
 
 import json
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import pytest
 
 from gmaillm.gmail_client import GmailClient
 from gmaillm.models import (
+    EmailAddress,
     EmailFormat,
+    EmailSummary,
+    SearchResult,
     SendEmailRequest,
 )
 
@@ -18,6 +22,7 @@ def mock_credentials():
     creds = Mock()
     creds.valid = True
     creds.expired = False
+    creds.expiry = datetime.utcnow() + timedelta(hours=1)
     creds.refresh_token = "refresh_token"
     return creds
 
@@ -92,6 +97,7 @@ class TestGmailClientInit:
             mock_creds = Mock()
             mock_creds.valid = True
             mock_creds.expired = False
+            mock_creds.expiry = datetime.utcnow() + timedelta(hours=1)
             mock_creds_class.from_authorized_user_info.return_value = mock_creds
             mock_build.return_value = Mock()
 
@@ -101,6 +107,133 @@ class TestGmailClientInit:
             )
             assert client.service is not None
 
+    def test_init_builds_service_without_discovery_cache(self, tmp_path):
+        """Test that the bundled discovery document is used without a cache probe."""
+        creds_file = tmp_path / "credentials.json"
+        oauth_file = tmp_path / "oauth-keys.json"
+        creds_file.write_text(json.dumps({"token": "t", "refresh_token": "r"}))
+        oauth_file.write_text(json.dumps({"client_id": "id", "client_secret": "secret"}))
+
+        with patch("gmaillm.gmail_client.Credentials") as mock_creds_class, \
+             patch("gmaillm.gmail_client.build") as mock_build:
+            mock_creds = Mock(refresh_token="r", expiry=datetime.utcnow() + timedelta(hours=1))
+            mock_creds_class.from_authorized_user_info.return_value = mock_creds
+
+            GmailClient(credentials_file=str(creds_file), oauth_keys_file=str(oauth_file))
+
+        mock_build.assert_called_once_with(
+            "gmail", "v1", credentials=mock_creds, cache_discovery=False
+        )
+
+    def test_init_skips_refresh_for_valid_cached_token(self, tmp_path):
+        """Test that a still-valid token with a known expiry is reused."""
+        creds_file = tmp_path / "credentials.json"
+        oauth_file = tmp_path / "oauth-keys.json"
+        creds_file.write_text(json.dumps({"token": "t", "refresh_token": "r"}))
+        oauth_file.write_text(json.dumps({"client_id": "id", "client_secret": "secret"}))
+
+        with patch("gmaillm.gmail_client.Credentials") as mock_creds_class, \
+             patch("gmaillm.gmail_client.build"):
+            mock_creds = Mock(
+                expired=False, refresh_token="r", expiry=datetime.utcnow() + timedelta(hours=1)
+            )
+            mock_creds_class.from_authorized_user_info.return_value = mock_creds
+
+            GmailClient(credentials_file=str(creds_file), oauth_keys_file=str(oauth_file))
+
+            mock_creds.refresh.assert_not_called()
+
+    def test_init_refreshes_token_about_to_expire(self, tmp_path):
+        """Test that a token inside the refresh buffer is refreshed early."""
+        creds_file = tmp_path / "credentials.json"
+        oauth_file = tmp_path / "oauth-keys.json"
+        creds_file.write_text(json.dumps({"token": "t", "refresh_token": "r"}))
+        oauth_file.write_text(json.dumps({"client_id": "id", "client_secret": "secret"}))
+
+        with patch("gmaillm.gmail_client.Credentials") as mock_creds_class, \
+             patch("gmaillm.gmail_client.build"), \
+             patch("gmaillm.gmail_client.Request"):
+            mock_creds = Mock(
+                expired=False, refresh_token="r", expiry=datetime.utcnow() + timedelta(minutes=2)
+            )
+            mock_creds.to_json.return_value = json.dumps({"token": "new"})
+            mock_creds_class.from_authorized_user_info.return_value = mock_creds
+
+            GmailClient(credentials_file=str(creds_file), oauth_keys_file=str(oauth_file))
+
+            mock_creds.refresh.assert_called_once()
+
+    def test_seconds_until_refresh(self, gmail_client, mock_credentials):
+        """Test the delay until the token enters the refresh buffer."""
+        mock_credentials.expiry = datetime.utcnow() + timedelta(minutes=65)
+        assert 3590 < gmail_client.seconds_until_refresh() <= 3600
+
+        mock_credentials.expiry = datetime.utcnow() + timedelta(minutes=2)
+        assert gmail_client.seconds_until_refresh() == 0.0
+
+    def test_refresh_credentials_only_when_due(self, gmail_client, mock_credentials):
+        """Test that refresh_credentials leaves a token outside the buffer alone."""
+        mock_credentials.refresh_token = "r"
+        mock_credentials.expiry = datetime.utcnow() + timedelta(minutes=65)
+        with patch.object(gmail_client, "_save_credentials"), \
+             patch("gmaillm.gmail_client.Request"):
+            gmail_client.refresh_credentials()
+            mock_credentials.refresh.assert_not_called()
+
+            mock_credentials.expiry = datetime.utcnow() + timedelta(minutes=2)
+            gmail_client.refresh_credentials()
+            mock_credentials.refresh.assert_called_once()
+
+    def test_seconds_until_refresh_custom_buffer(self, gmail_client, mock_credentials):
+        """Test that a larger refresh buffer makes the token due earlier."""
+        gmail_client.refresh_buffer = timedelta(minutes=10)
+        mock_credentials.expiry = datetime.utcnow() + timedelta(minutes=65)
+        assert 3290 < gmail_client.seconds_until_refresh() <= 3300
+
+        mock_credentials.expiry = datetime.utcnow() + timedelta(minutes=8)
+        assert gmail_client.seconds_until_refresh() == 0.0
+
+    def test_init_refreshes_and_persists_expired_token(self, tmp_path):
+        """Test that an expired token is refreshed and written back atomically."""
+        creds_file = tmp_path / "credentials.json"
+        oauth_file = tmp_path / "oauth-keys.json"
+        creds_file.write_text(json.dumps({"token": "old", "refresh_token": "r"}))
+        oauth_file.write_text(json.dumps({"client_id": "id", "client_secret": "secret"}))
+
+        with patch("gmaillm.gmail_client.Credentials") as mock_creds_class, \
+             patch("gmaillm.gmail_client.build"), \
+             patch("gmaillm.gmail_client.Request"):
+            mock_creds = Mock(expired=True, refresh_token="r", expiry=datetime.utcnow())
+            mock_creds.to_json.return_value = json.dumps({"token": "new"})
+            mock_creds_class.from_authorized_user_info.return_value = mock_creds
+
+            GmailClient(credentials_file=str(creds_file), oauth_keys_file=str(oauth_file))
+
+            mock_creds.refresh.assert_called_once()
+        assert json.loads(creds_file.read_text()) == {"token": "new"}
+        assert not (tmp_path / "credentials.json.tmp").exists()
+        assert creds_file.stat().st_mode & 0o777 == 0o600
+
+    def test_failed_credentials_write_removes_temp_file(self, tmp_path):
+        """Test that a failed write leaves the old credentials and no temp file."""
+        creds_file = tmp_path / "credentials.json"
+        oauth_file = tmp_path / "oauth-keys.json"
+        creds_file.write_text(json.dumps({"token": "old", "refresh_token": "r"}))
+        oauth_file.write_text(json.dumps({"client_id": "id", "client_secret": "secret"}))
+
+        with patch("gmaillm.gmail_client.Credentials") as mock_creds_class, \
+             patch("gmaillm.gmail_client.build"), \
+             patch("gmaillm.gmail_client.Request"):
+            mock_creds = Mock(expired=True, refresh_token="r", expiry=datetime.utcnow())
+            mock_creds.to_json.side_effect = ValueError("cannot serialize")
+            mock_creds_class.from_authorized_user_info.return_value = mock_creds
+
+            with pytest.raises(RuntimeError, match="cannot serialize"):
+                GmailClient(credentials_file=str(creds_file), oauth_keys_file=str(oauth_file))
+
+        assert json.loads(creds_file.read_text())["token"] == "old"
+        assert not (tmp_path / "credentials.json.tmp").exists()
+
     def test_init_without_credentials_file(self):
         """Test initialization fails without credentials file."""
         with pytest.raises(FileNotFoundError):
@@ -143,6 +276,118 @@ class TestVerifySetup:
         assert any("API Error" in error for error in result["errors"])
 
 
+class TestGetStatus:
+    """Tests for get_status method."""
+
+    @staticmethod
+    def _fake_batches(mock_gmail_service, responses):
+        """Make new_batch_http_request() answer each request_id from responses."""
+        batches = []
+
+        def new_batch(callback):
+            batch = MagicMock()
+            added = []
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+
+            def execute():
+                for request_id in added:
+                    response = responses.get(request_id)
+                    if isinstance(response, Exception):
+                        callback(request_id, None, response)
+                    else:
+                        callback(request_id, response, None)
+
+            batch.execute.side_effect = execute
+            batches.append(added)
+            return batch
+
+        mock_gmail_service.new_batch_http_request.side_effect = new_batch
+        return batches
+
+    def test_get_status_success(self, gmail_client, mock_gmail_service):
+        """Test that status is assembled from two batches."""
+        batches = self._fake_batches(mock_gmail_service, {
+            "profile": {"emailAddress": "user@gmail.com"},
+            "labels": {"labels": [{"id": "INBOX", "name": "INBOX", "type": "system"}]},
+            "inbox": {"messages": [{"id": "msg1", "threadId": "t1"}]},
+            "label:INBOX": {
+                "id": "INBOX", "name": "INBOX", "type": "system",
+                "messagesTotal": 10, "messagesUnread": 2,
+            },
+            "recent": {
+                "id": "msg1",
+                "threadId": "t1",
+                "snippet": "Hello",
+                "labelIds": ["INBOX", "UNREAD"],
+                "payload": {"headers": [
+                    {"name": "From", "value": "sender@example.com"},
+                    {"name": "Subject", "value": "Hi"},
+                ]},
+            },
+        })
+
+        result = gmail_client.get_status()
+
+        assert batches == [["profile", "labels", "inbox"], ["label:INBOX", "recent"]]
+        assert result["auth"] is True
+        assert result["email_address"] == "user@gmail.com"
+        assert result["inbox_accessible"] is True
+        assert result["folders"][0].unread_count == 2
+        assert result["recent_email"].message_id == "msg1"
+        assert result["errors"] == []
+
+    def test_get_status_auth_failure(self, gmail_client, mock_gmail_service):
+        """Test that a failed profile fetch is reported without a second batch."""
+        batches = self._fake_batches(mock_gmail_service, {
+            "profile": Exception("Unauthorized"),
+            "labels": Exception("Unauthorized"),
+            "inbox": Exception("Unauthorized"),
+        })
+
+        result = gmail_client.get_status()
+
+        assert len(batches) == 1
+        assert result["auth"] is False
+        assert result["inbox_accessible"] is False
+        assert any("Unauthorized" in error for error in result["errors"])
+
+    def test_get_status_splits_large_label_batches(self, gmail_client, mock_gmail_service):
+        """Test that label fetches respect the 100-requests-per-batch limit."""
+        labels = [{"id": f"Label_{i}", "name": f"L{i}", "type": "user"} for i in range(150)]
+        responses = {f"label:{label['id']}": dict(label, messagesTotal=1) for label in labels}
+        responses.update({
+            "profile": {"emailAddress": "user@gmail.com"},
+            "labels": {"labels": labels},
+            "inbox": {"messages": [{"id": "msg1", "threadId": "t1"}]},
+            "recent": Exception("Not Found"),
+        })
+        batches = self._fake_batches(mock_gmail_service, responses)
+
+        result = gmail_client.get_status()
+
+        assert [len(b) for b in batches] == [3, 100, 51]
+        assert batches[-1][-1] == "recent"
+        assert result["errors"] == []
+        assert len(result["folders"]) == 150
+
+    def test_get_status_recent_email_failure(self, gmail_client, mock_gmail_service):
+        """Test that a failed recent-email fetch just leaves recent_email unset."""
+        self._fake_batches(mock_gmail_service, {
+            "profile": {"emailAddress": "user@gmail.com"},
+            "labels": {"labels": [{"id": "INBOX", "name": "INBOX", "type": "system"}]},
+            "inbox": {"messages": [{"id": "msg1", "threadId": "t1"}]},
+            "label:INBOX": {"id": "INBOX", "name": "INBOX", "type": "system"},
+            "recent": Exception("Not Found"),
+        })
+
+        result = gmail_client.get_status()
+
+        assert result["auth"] is True
+        assert [f.name for f in result["folders"]] == ["INBOX"]
+        assert result["recent_email"] is None
+        assert result["errors"] == []
+
+
 class TestListEmails:
     """Tests for list_emails method."""
 
@@ -265,6 +510,21 @@ class TestReadEmail:
         assert email.subject == "Test Email"
         assert email.is_unread is True
 
+    def test_read_email_headers_requests_metadata_only(self, gmail_client, mock_gmail_service):
+        """Test that reading headers fetches just the requested metadata."""
+        messages = mock_gmail_service.users().messages()
+        messages.get().execute.return_value = {
+            "id": "msg123",
+            "payload": {"headers": [{"name": "from", "value": "Alice <alice@example.com>"}]},
+        }
+
+        headers = gmail_client.read_email_headers("msg123", ["From", "Subject"])
+
+        assert headers == {"From": "Alice <alice@example.com>", "Subject": None}
+        messages.get.assert_called_with(
+            userId="me", id="msg123", format="metadata", metadataHeaders=["From", "Subject"]
+        )
+
     def test_read_email_full(self, gmail_client, mock_gmail_service):
         """Test reading email in FULL format."""
         import base64
@@ -346,6 +606,110 @@ class TestSearchEmails:
         assert result.total_count == 1
         assert len(result.emails) == 1
 
+    def test_search_fetches_all_hits_in_one_batch(self, gmail_client, mock_gmail_service):
+        """Test that hits are fetched in a single batch call, not one request each."""
+        ids = ["msg1", "msg2", "msg3"]
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": msg_id, "threadId": "t"} for msg_id in ids],
+            "resultSizeEstimate": 3,
+        }
+        mock_gmail_service.users().messages().get.reset_mock()
+
+        added = []
+        mock_batch = MagicMock()
+        mock_batch.add.side_effect = lambda request, callback: added.append(callback)
+
+        def execute_batch():
+            # Answer out of order, with one failed fetch
+            for msg_id, callback in reversed(list(zip(ids, added))):
+                if msg_id == "msg2":
+                    callback(None, None, Exception("boom"))
+                else:
+                    callback(None, {
+                        "id": msg_id,
+                        "threadId": "t",
+                        "payload": {"headers": [
+                            {"name": "From", "value": "sender@example.com"},
+                            {"name": "Subject", "value": msg_id},
+                            {"name": "Date", "value": "Mon, 15 Jan 2025 10:30:00 +0000"},
+                        ]},
+                        "labelIds": ["INBOX"],
+                    }, None)
+
+        mock_batch.execute.side_effect = execute_batch
+        mock_gmail_service.new_batch_http_request.return_value = mock_batch
+
+        result = gmail_client.search_emails("has:attachment")
+
+        assert mock_gmail_service.new_batch_http_request.call_count == 1
+        assert mock_batch.execute.call_count == 1
+        assert [call.kwargs["format"] for call in
+                mock_gmail_service.users().messages().get.call_args_list] == ["metadata"] * 3
+        mock_gmail_service.users().messages().get().execute.assert_not_called()
+        assert [email.message_id for email in result.emails] == ["msg1", "msg3"]
+
+    def test_search_rejects_control_characters(self, gmail_client):
+        """Test that null bytes and control characters are rejected, whitespace is not."""
+        for query in ("from:a\x00b", "subject:\x1bx"):
+            with pytest.raises(ValueError, match="control characters"):
+                gmail_client._validate_query(query)
+        gmail_client._validate_query("from:a\tsubject:b\n")
+
+
+class TestIterEmails:
+    """Tests for iter_emails method."""
+
+    @staticmethod
+    def _page(ids, next_page_token=None):
+        return SearchResult(
+            emails=[
+                EmailSummary(
+                    message_id=msg_id,
+                    thread_id=msg_id,
+                    from_=EmailAddress(email="sender@example.com"),
+                    subject="Subject",
+                    date="2025-01-15T10:30:00",
+                    snippet="",
+                )
+                for msg_id in ids
+            ],
+            total_count=100,
+            next_page_token=next_page_token,
+            query="label:INBOX",
+        )
+
+    def test_follows_page_tokens_up_to_max(self, gmail_client):
+        """Test that pages are fetched lazily until max_results is reached."""
+        pages = [
+            self._page([f"a{i}" for i in range(50)], next_page_token="p2"),
+            self._page([f"b{i}" for i in range(50)], next_page_token="p3"),
+        ]
+        with patch.object(gmail_client, "list_emails", side_effect=pages) as mock_list:
+            emails = gmail_client.iter_emails(max_results=60, query="is:unread")
+            assert next(emails).message_id == "a0"
+            assert mock_list.call_count == 1
+
+            rest = list(emails)
+
+        assert len(rest) == 59
+        assert rest[-1].message_id == "b9"
+        assert mock_list.call_args_list[1].kwargs == {
+            "folder": "INBOX",
+            "max_results": 10,
+            "page_token": "p2",
+            "query": "is:unread",
+        }
+
+    def test_stops_without_next_page(self, gmail_client):
+        """Test that iteration ends when the API has no more pages."""
+        with patch.object(
+            gmail_client, "list_emails", return_value=self._page(["a", "b"])
+        ) as mock_list:
+            emails = list(gmail_client.iter_emails(max_results=200))
+
+        assert [e.message_id for e in emails] == ["a", "b"]
+        mock_list.assert_called_once()
+
 
 class TestSendEmail:
     """Tests for send_email method."""
@@ -552,6 +916,12 @@ class TestModifyLabels:
                 add_labels=["Label_1"],
             )
 
+    def test_rejects_invalid_label_ids(self, gmail_client):
+        """Test label ID validation."""
+        gmail_client._validate_label_ids(["INBOX", "Label_12-a"])
+        with pytest.raises(ValueError, match="invalid characters"):
+            gmail_client._validate_label_ids(["Label 1"])
+
 
 class TestDeleteEmail:
     """Tests for delete_email method."""
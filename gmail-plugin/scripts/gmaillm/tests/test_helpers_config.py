@@ -11,7 +11,8 @@ from gmaillm.helpers.core import (
     get_groups_file_path,
     get_styles_dir,
     get_style_file_path,
-    create_backup
+    create_backup,
+    move_to_backup
 )
 from gmaillm.helpers.domain import (
     load_email_groups,
@@ -42,6 +43,21 @@ class TestConfigDirFunctions:
         assert styles_dir.exists()
         assert styles_dir.is_dir()
 
+    def test_get_styles_dir_creates_directory_once(self, temp_dir, monkeypatch):
+        """Test that repeated lookups don't re-issue mkdir for the same directory."""
+        monkeypatch.setattr('gmaillm.helpers.core.paths.get_plugin_config_dir', lambda: temp_dir)
+        mkdir_calls = []
+        original_mkdir = Path.mkdir
+
+        def counting_mkdir(self, *args, **kwargs):
+            mkdir_calls.append(self)
+            return original_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, 'mkdir', counting_mkdir)
+
+        assert get_styles_dir() == get_styles_dir() == temp_dir / "email-styles"
+        assert mkdir_calls == [temp_dir / "email-styles"]
+
     def test_get_style_file_path(self, temp_dir, monkeypatch):
         """Test that get_style_file_path returns correct path."""
         def mock_styles_dir():
@@ -136,6 +152,69 @@ class TestEmailGroups:
         assert "_comment" not in result
         assert "_version" not in result
 
+    def test_load_email_groups_cached_until_file_changes(self, temp_dir):
+        """Test that groups are re-read only when the file changes."""
+        groups_file = temp_dir / "email-groups.json"
+        groups_file.write_text(json.dumps({"team": ["a@example.com"]}))
+
+        first = load_email_groups(groups_file)
+        first["team"].append("mutated@example.com")
+        assert load_email_groups(groups_file) == {"team": ["a@example.com"]}
+
+        save_email_groups({"team": ["b@example.com"]}, groups_file)
+        assert load_email_groups(groups_file) == {"team": ["b@example.com"]}
+
+    def test_load_email_groups_keeps_malformed_values(self, temp_dir):
+        """Test that non-list group values are returned unchanged, not split or rejected."""
+        groups_file = temp_dir / "email-groups.json"
+        groups_file.write_text(json.dumps({
+            "team": None,
+            "x": 5,
+            "s": "a@b.com",
+            "ok": ["a@example.com"],
+        }))
+
+        assert load_email_groups(groups_file) == {
+            "team": None,
+            "x": 5,
+            "s": "a@b.com",
+            "ok": ["a@example.com"],
+        }
+
+    def test_expand_email_groups_reads_cached_file_once(self, temp_dir, monkeypatch):
+        """Test that expanding several recipient lists parses the file once."""
+        from unittest.mock import patch
+
+        from gmaillm.helpers.domain import groups as groups_module
+
+        groups_file = temp_dir / "groups.json"
+        groups_file.write_text(json.dumps({"team": ["a@example.com", "b@example.com"]}))
+        monkeypatch.setattr(groups_module, "get_groups_dir", lambda: temp_dir)
+        groups_module._load_groups_cached.cache_clear()
+
+        with patch.object(
+            groups_module, "load_json_config", wraps=groups_module.load_json_config
+        ) as mock_load:
+            assert expand_email_groups(["#team"]) == ["a@example.com", "b@example.com"]
+            assert expand_email_groups(["#team", "c@example.com"]) == [
+                "a@example.com", "b@example.com", "c@example.com"
+            ]
+
+        assert mock_load.call_count == 1
+
+    def test_expand_email_groups_plain_addresses_skip_groups_file(self):
+        """Test that recipients without #group references never load groups."""
+        from unittest.mock import patch
+
+        from gmaillm.helpers.domain import groups as groups_module
+
+        with patch.object(groups_module, "_cached_email_groups") as mock_groups:
+            assert expand_email_groups(["a@example.com", "b@example.com", "a@example.com"]) == [
+                "a@example.com", "b@example.com"
+            ]
+
+        mock_groups.assert_not_called()
+
     def test_save_email_groups(self, temp_dir):
         """Test saving email groups to file."""
         groups_file = temp_dir / "email-groups.json"
@@ -293,6 +372,29 @@ class TestUtilityFunctions:
         assert "backup" in backup_path.name
         assert original_file.stem in backup_path.name
 
+    def test_create_backup_copies_bytes_verbatim(self, temp_dir):
+        """Test that backup is a byte-for-byte copy (line endings, non-UTF-8)."""
+        original_file = temp_dir / "test.md"
+        original_file.write_bytes(b"line one\r\nline two\xff\n")
+
+        backup_path = create_backup(original_file)
+
+        assert backup_path.read_bytes() == b"line one\r\nline two\xff\n"
+
+    def test_move_to_backup(self, temp_dir):
+        """Test that the original is moved (not copied) to the backup path."""
+        original_file = temp_dir / "test.md"
+        original_file.write_text("Original content")
+        inode = original_file.stat().st_ino
+
+        backup_path = move_to_backup(original_file)
+
+        assert not original_file.exists()
+        assert backup_path.read_text() == "Original content"
+        assert backup_path.stat().st_ino == inode
+        assert backup_path.name.startswith("test.backup.")
+        assert backup_path.suffix == ".md"
+
     def test_create_backup_preserves_extension(self, temp_dir):
         """Test that backup preserves file extension."""
         original_file = temp_dir / "test.json"
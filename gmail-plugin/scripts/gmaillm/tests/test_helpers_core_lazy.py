@@ -0,0 +1,47 @@
+"""Tests for gmaillm.helpers.core.lazy module."""
+
+import subprocess
+import sys
+
+import pytest
+
+from gmaillm.helpers.core import lazy_importer
+
+
+class TestLazyImporter:
+    """Tests for lazy_importer function."""
+
+    def test_resolves_and_caches_in_globals(self):
+        """Test that a name is imported on first use and cached in the module globals."""
+        module_globals = {"__name__": "fake_module"}
+        resolve = lazy_importer(module_globals, {"OrderedDict": "collections"})
+
+        from collections import OrderedDict
+
+        assert resolve("OrderedDict") is OrderedDict
+        assert module_globals["OrderedDict"] is OrderedDict
+
+    def test_prefers_existing_global(self):
+        """Test that a patched global wins over the lazy import."""
+        sentinel = object()
+        module_globals = {"__name__": "fake_module", "OrderedDict": sentinel}
+        resolve = lazy_importer(module_globals, {"OrderedDict": "collections"})
+
+        assert resolve("OrderedDict") is sentinel
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that names outside the mapping raise AttributeError like a module would."""
+        resolve = lazy_importer({"__name__": "fake_module"}, {})
+
+        with pytest.raises(AttributeError, match="module 'fake_module' has no attribute 'missing'"):
+            resolve("missing")
+
+    def test_package_imports_stay_light(self):
+        """Test that importing gmaillm and its helper packages loads no heavy dependencies."""
+        code = (
+            "import sys, gmaillm, gmaillm.helpers, gmaillm.helpers.core; "
+            "print(sorted(m for m in ('rich', 'googleapiclient', 'pydantic') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"
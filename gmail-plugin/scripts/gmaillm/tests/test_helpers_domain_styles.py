@@ -1,9 +1,13 @@
 """Tests for helpers/domain/styles.py module."""
 
-import pytest
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from gmaillm.helpers.domain.styles import (
+    FRONTMATTER_READ_SIZE,
     load_all_styles,
     extract_style_metadata,
 )
@@ -62,6 +66,45 @@ Example 1
         assert len(styles) == 1
         assert styles[0]['name'] == 'style'
 
+    def test_frontmatter_longer_than_read_size(self, tmp_path):
+        """Test frontmatter spanning past the bounded header read."""
+        description = "x" * (FRONTMATTER_READ_SIZE + 100)
+        (tmp_path / "long.md").write_text(
+            f'---\nname: Long\ndescription: "{description}"\n---\n\n<body>\n</body>\n'
+        )
+
+        styles = load_all_styles(tmp_path)
+
+        assert styles[0]['description'] == description
+
+    def test_subdirectories_ignored(self, tmp_path):
+        """Test directories named like style files are skipped."""
+        (tmp_path / "style.md").write_text("---\nname: Style\n---\n")
+        (tmp_path / "nested.md").mkdir()
+
+        styles = load_all_styles(tmp_path)
+
+        assert [s['name'] for s in styles] == ['style']
+
+    def test_flat_frontmatter_does_not_import_yaml(self, tmp_path):
+        """Test listing plain name/description styles never loads PyYAML."""
+        (tmp_path / "formal.md").write_text(
+            '---\nname: "formal"\ndescription: "When to use: Faculty."\n---\n'
+        )
+        code = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from gmaillm.commands.styles import app\n"
+            "from gmaillm.helpers.domain import load_all_styles\n"
+            f"styles = load_all_styles(Path({str(tmp_path)!r}))\n"
+            "assert styles[0]['description'] == 'When to use: Faculty.', styles\n"
+            "print('yaml' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
 
 class TestExtractStyleMetadata:
     """Test extract_style_metadata function."""
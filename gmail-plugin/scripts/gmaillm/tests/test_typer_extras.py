@@ -7,12 +7,14 @@ from io import StringIO
 
 import typer
 import click
+from typer.testing import CliRunner
 from rich.console import Console
 
 from gmaillm.helpers.cli.typer_extras import (
     OutputFormat,
     parse_output_format,
     HelpfulGroup,
+    LazyTyperGroup,
 )
 
 
@@ -138,3 +140,95 @@ class TestHelpfulGroup:
 
             # Verify it was called with stderr
             mock_echo.assert_called_once_with("Help text", file=sys.stderr)
+
+
+class TestLazyTyperGroup:
+    """Test LazyTyperGroup subcommand loading."""
+
+    def _make_app(self):
+        class RootGroup(LazyTyperGroup):
+            lazy_subcommands = {"labels": "gmaillm.commands.labels"}
+
+        app = typer.Typer(cls=RootGroup)
+
+        @app.command()
+        def hello():
+            """Say hello."""
+
+        return app
+
+    def test_lazy_subcommand_listed_after_eager_commands(self):
+        """Test that lazy sub-apps appear in the command list."""
+        group = typer.main.get_group(self._make_app())
+        ctx = click.Context(group)
+
+        assert group.list_commands(ctx) == ["hello", "labels"]
+
+    def test_lazy_subcommand_resolved_on_lookup(self):
+        """Test that looking up a lazy sub-app returns a named group."""
+        group = typer.main.get_group(self._make_app())
+        ctx = click.Context(group)
+
+        assert "labels" not in group.commands
+        command = group.get_command(ctx, "labels")
+
+        assert isinstance(command, click.Group)
+        assert command.name == "labels"
+        assert "list" in command.commands
+
+    def test_lazy_subcommand_with_older_typer_signature(self):
+        """Test that keywords an older get_group_from_info lacks are not passed."""
+        from gmaillm.helpers.cli import typer_extras
+
+        real = typer.main.get_group_from_info
+
+        def old_get_group_from_info(group_info, *, pretty_exceptions_short, rich_markup_mode):
+            return real(
+                group_info,
+                pretty_exceptions_short=pretty_exceptions_short,
+                rich_markup_mode=rich_markup_mode,
+                suggest_commands=True,
+            )
+
+        group = typer.main.get_group(self._make_app())
+        ctx = click.Context(group)
+
+        typer_extras._group_from_info_params.cache_clear()
+        try:
+            with patch.object(typer.main, "get_group_from_info", old_get_group_from_info):
+                command = group.get_command(ctx, "labels")
+        finally:
+            typer_extras._group_from_info_params.cache_clear()
+
+        assert isinstance(command, click.Group)
+        assert "list" in command.commands
+
+    def test_unknown_command_returns_none(self):
+        """Test that unknown names still resolve to None."""
+        group = typer.main.get_group(self._make_app())
+        ctx = click.Context(group)
+
+        assert group.get_command(ctx, "missing") is None
+
+    def test_help_lists_lazy_subcommand_from_static_text(self):
+        """Test that help formatting uses lazy_subcommand_help without loading."""
+
+        class RootGroup(LazyTyperGroup):
+            lazy_subcommands = {"labels": "gmaillm.commands.labels"}
+            lazy_subcommand_help = {"labels": "Static labels help"}
+
+        app = typer.Typer(cls=RootGroup)
+
+        @app.command()
+        def hello():
+            """Say hello."""
+
+        @app.command()
+        def bye():
+            """Say bye."""
+
+        result = CliRunner().invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "Static labels help" in result.output
+        assert "Manage Gmail labels" not in result.output
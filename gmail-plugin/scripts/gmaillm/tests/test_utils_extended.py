@@ -165,6 +165,37 @@ class TestAttachFile:
         # Verify attachment was added
         assert len(message.get_payload()) > 0
 
+    def test_encoding_matches_email_encoders(self, tmp_path, monkeypatch):
+        """Test that the mmap-based encoding matches encoders.encode_base64."""
+        from email import encoders
+        from email.mime.base import MIMEBase
+
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(bytes(range(256)) * 40)
+        message = MIMEMultipart()
+
+        # Several chunks plus a partial one, to cover the chunk boundaries
+        monkeypatch.setattr("gmaillm.utils.ATTACHMENT_ENCODE_CHUNK", 57 * 4)
+        _attach_file(message, str(file_path))
+
+        expected = MIMEBase("application", "octet-stream")
+        expected.set_payload(file_path.read_bytes())
+        encoders.encode_base64(expected)
+        attachment = message.get_payload()[0]
+        assert attachment["Content-Transfer-Encoding"] == "base64"
+        assert attachment.get_payload() == expected.get_payload()
+        assert attachment.get_payload(decode=True) == file_path.read_bytes()
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file is attached with an empty payload."""
+        file_path = tmp_path / "empty.txt"
+        file_path.write_bytes(b"")
+        message = MIMEMultipart()
+
+        _attach_file(message, str(file_path))
+
+        assert message.get_payload()[0].get_payload(decode=True) == b""
+
 
 class TestCreateMimeMessage:
     """Test create_mime_message edge cases."""
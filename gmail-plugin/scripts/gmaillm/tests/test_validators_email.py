@@ -6,6 +6,7 @@ from pathlib import Path
 from gmaillm.validators.email import (
     validate_email,
     validate_email_list,
+    validate_email_lists,
     validate_attachment_paths,
     validate_label_name,
     validate_editor
@@ -75,6 +76,48 @@ class TestValidateEmailList:
         with pytest.raises(typer.Exit):
             validate_email_list(emails, field_name="recipient")
 
+    def test_reports_first_invalid_email(self, capsys):
+        """Test that the batch check still reports the offending address."""
+        import typer
+        emails = ["a@example.com", "bad-one", "b@example.com", "bad-two"]
+        with pytest.raises(typer.Exit):
+            validate_email_list(emails, field_name="recipient")
+        out = capsys.readouterr().out
+        assert "recipient address: bad-one" in out
+        assert "bad-two" not in out
+
+    def test_embedded_newline_rejected(self):
+        """Test that an address can't smuggle a second line past the batch scan."""
+        import typer
+        with pytest.raises(typer.Exit):
+            validate_email_list(["a@example.com\nb@example.com"])
+
+
+class TestValidateEmailLists:
+    """Tests for validate_email_lists function."""
+
+    def test_valid_lists(self):
+        """Test that valid lists, group references and None lists pass."""
+        # Should not raise
+        validate_email_lists(
+            ("recipient", ["a@example.com", "#team"]),
+            ("CC", None),
+            ("BCC", ["b@example.co.uk"]),
+        )
+
+    def test_invalid_email_reports_field(self, capsys):
+        """Test that the offending field and address are reported."""
+        import typer
+        with pytest.raises(typer.Exit):
+            validate_email_lists(("recipient", ["a@example.com"]), ("CC", ["bad-address"]))
+        assert "CC address: bad-address" in capsys.readouterr().out
+
+    def test_embedded_newline_rejected(self):
+        """Test that an address can't smuggle a second line past the batch scan."""
+        import typer
+        with pytest.raises(typer.Exit):
+            validate_email_lists(("recipient", ["a@example.com\nb@example.com"]))
+
 
 class TestValidateAttachmentPaths:
     """Tests for validate_attachment_paths function."""
@@ -116,6 +159,33 @@ class TestValidateAttachmentPaths:
         with pytest.raises(typer.Exit):
             validate_attachment_paths(paths)
 
+    def test_many_paths_keep_order_and_duplicates(self, temp_dir):
+        """Test that concurrently stat'ed paths come back in input order."""
+        files = []
+        for i in range(12):
+            path = temp_dir / f"file{i}.txt"
+            path.write_text("test")
+            files.append(str(path))
+        paths = files + [files[0]]
+
+        result = validate_attachment_paths(paths)
+
+        assert result == [str(Path(p).resolve()) for p in paths]
+
+    def test_reports_first_bad_path_in_order(self, temp_dir, capsys):
+        """Test that the first invalid attachment is the one reported."""
+        import typer
+        good = temp_dir / "good.txt"
+        good.write_text("test")
+        paths = [str(good), str(temp_dir), str(temp_dir / "missing.txt")]
+
+        with pytest.raises(typer.Exit):
+            validate_attachment_paths(paths)
+
+        output = capsys.readouterr().out
+        assert "Not a file" in output
+        assert "missing.txt" not in output
+
 
 class TestValidateLabelName:
     """Tests for validate_label_name function."""
@@ -3,7 +3,9 @@
 import pytest
 
 from gmaillm.validators.styles import (
+    parse_style_frontmatter,
     validate_style_name,
+    StyleFrontmatterError,
     StyleLinter,
     StyleLintError
 )
@@ -155,6 +157,16 @@ invalid yaml: [unclosed
         errors = linter.lint(content)
         assert any('Invalid YAML' in str(e) for e in errors)
 
+    def test_invalid_yaml_syntax(self, linter):
+        """Test that a YAML syntax error inside closed frontmatter is reported."""
+        content = """---
+name: test
+invalid yaml: [unclosed
+---
+"""
+        errors = linter.lint(content)
+        assert any('Invalid YAML syntax' in str(e) for e in errors)
+
     def test_missing_name_field(self, linter):
         """Test that missing name field is detected."""
         content = """---
@@ -283,6 +295,21 @@ Test
         errors = linter.lint(content)
         assert any('out of order' in str(e) for e in errors)
 
+    def test_section_order_uses_first_open_tag(self, linter):
+        """Test that order is judged by each section's first tag, skipping missing ones."""
+        content = """<examples>
+Mentions <closing> before the real sections
+</examples>
+<greeting>
+- Hi,
+</greeting>
+<closing>
+- Best,
+</closing>
+"""
+        errors = linter._lint_sections_order(linter._scan_sections(content))
+        assert [e.section for e in errors] == ['closing']
+
     def test_lint_and_fix_trailing_whitespace(self, linter):
         """Test that trailing whitespace is auto-fixed."""
         content = """---
@@ -321,6 +348,68 @@ Test
         assert '   \n' not in fixed_content
         assert '  \n' not in fixed_content
 
+    def test_lint_and_fix_keeps_delimiters(self, linter):
+        """Test that --- delimiters survive while "-item" gets its space."""
+        content = """---
+name: "test"
+description: "When to use: Test"
+---
+
+<examples>
+One
+---
+Two
+</examples>
+
+<do>
+-Do
+- This
+</do>
+"""
+        fixed_content, _ = linter.lint_and_fix(content)
+
+        assert fixed_content == content.replace("-Do", "- Do")
+        assert linter.lint_and_fix(fixed_content)[0] == fixed_content
+
+
+class TestParseStyleFrontmatter:
+    """Tests for parse_style_frontmatter function."""
+
+    @pytest.mark.parametrize("text", [
+        '\nname: "formal"\ndescription: "When to use: Emails to faculty."\n',
+        "\nname: 'formal'\ndescription: When to use - anything\n",
+        '\nname: test-style\n\ndescription: Test description\n',
+    ])
+    def test_flat_frontmatter_matches_yaml(self, text, monkeypatch):
+        """Test flat frontmatter is parsed without the YAML loader, identically."""
+        import yaml
+        expected = yaml.safe_load(text)
+
+        def fail(_text):
+            raise AssertionError("YAML loader should not be used")
+
+        monkeypatch.setattr(yaml, "safe_load", fail)
+        assert parse_style_frontmatter(text) == expected
+
+    @pytest.mark.parametrize("text", [
+        '\nname: yes\n',
+        '\nname: 12\n',
+        '\nname: Test # comment\n',
+        '\nname: "Test"\ntags:\n  - formal\n',
+        '\nname: "Line\\nbreak"\n',
+        '\nname: Test\n\t\n',
+    ])
+    def test_other_yaml_falls_back_to_loader(self, text):
+        """Test YAML-specific syntax still goes through yaml.safe_load."""
+        import yaml
+        try:
+            expected = yaml.safe_load(text)
+        except yaml.YAMLError:
+            with pytest.raises(StyleFrontmatterError):
+                parse_style_frontmatter(text)
+        else:
+            assert parse_style_frontmatter(text) == expected
+
 
 class TestConvertJsonToMarkdownStyle:
     """Tests for create_style_from_json function."""
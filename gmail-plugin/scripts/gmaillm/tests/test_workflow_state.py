@@ -5,7 +5,8 @@ from pathlib import Path
 
 import pytest
 
-from gmaillm.workflow_state import WorkflowState, WorkflowStateManager
+from gmaillm.models import EmailAddress, EmailFull
+from gmaillm.workflow_state import WorkflowResponse, WorkflowState, WorkflowStateManager
 
 
 @pytest.fixture
@@ -189,6 +190,22 @@ class TestWorkflowStateManager:
         assert loaded_state.email_ids == original_state.email_ids
         assert loaded_state.current_index == original_state.current_index
 
+    def test_saved_state_round_trips_exactly(self, state_manager, temp_state_dir):
+        """Test that the state file is plain JSON and reloads to an equal model."""
+        import json
+
+        state = state_manager.create_state(
+            workflow_id="test-workflow",
+            query="is:unread",
+            email_ids=["email1", "email2"],
+        )
+        state.advance()
+        state_manager.save_state(state)
+
+        data = json.loads((temp_state_dir / f"{state.token}.json").read_text())
+        assert data == state.model_dump(mode="json")
+        assert state_manager.load_state(state.token) == state
+
     def test_load_invalid_token(self, state_manager):
         """Test loading with invalid token."""
         with pytest.raises(ValueError, match="Invalid or expired token"):
@@ -356,3 +373,24 @@ class TestWorkflowStateManager:
         # Skip to end
         state.current_index = 5
         assert not state.has_more
+
+
+class TestWorkflowResponse:
+    """Tests for WorkflowResponse model."""
+
+    def test_email_serializes_without_intermediate_dict(self):
+        """Test the email model is kept as-is and dumps like model_dump(mode='json')."""
+        email = EmailFull(
+            message_id="msg1",
+            thread_id="thread1",
+            from_=EmailAddress(email="alice@example.com", name="Alice"),
+            to=[EmailAddress(email="bob@example.com")],
+            subject="Hello",
+            date=datetime(2024, 1, 2, 3, 4, 5),
+            body_plain="Hi Bob",
+        )
+
+        response = WorkflowResponse(success=True, email=email, message="ok", progress={})
+
+        assert response.email is email
+        assert response.model_dump(mode="json")["email"] == email.model_dump(mode="json")